@@ -5,6 +5,9 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import timedelta
+from functools import partial
+import hashlib
+import time
 from typing import Any, Optional, cast
 
 import jwt
@@ -15,7 +18,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -157,6 +160,13 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Validated access tokens by token hash, least recently used first
+        self._access_token_cache: OrderedDict[
+            bytes, tuple[models.RefreshToken, float]
+        ] = OrderedDict()
+        # Cached access tokens of each refresh token and the function that
+        # unregisters their revoke callback
+        self._access_token_cache_keys: dict[str, tuple[set[bytes], CALLBACK_TYPE]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -308,8 +318,13 @@ class AuthManager:
         if tasks:
             await asyncio.gather(*tasks)
 
+        refresh_token_ids = list(user.refresh_tokens)
         await self._store.async_remove_user(user)
 
+        for refresh_token_id in refresh_token_ids:
+            self._async_drop_cached_access_tokens(refresh_token_id)
+            self._revoke_callbacks.pop(refresh_token_id, None)
+
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
     async def async_update_user(
@@ -551,6 +566,21 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        cache_key = hashlib.sha256(token.encode()).digest()
+
+        if (cached := self._access_token_cache.get(cache_key)) is not None:
+            refresh_token, expires = cached
+            # The refresh token must still exist, its user may have been
+            # removed without the token being revoked
+            if (
+                time.time() < expires
+                and await self.async_get_refresh_token(refresh_token.id)
+                is refresh_token
+            ):
+                self._access_token_cache.move_to_end(cache_key)
+                return refresh_token if refresh_token.user.is_active else None
+            self._async_drop_cached_access_token(cache_key)
+
         try:
             unverif_claims = jwt.decode(
                 token, algorithms=["HS256"], options={"verify_signature": False}
@@ -570,15 +600,70 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        if isinstance(expires := claims.get("exp"), (int, float)):
+            self._async_cache_access_token(cache_key, refresh_token, expires)
+
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
 
+    @callback
+    def _async_cache_access_token(
+        self, cache_key: bytes, refresh_token: models.RefreshToken, expires: float
+    ) -> None:
+        """Cache a validated access token until it expires or is revoked."""
+        if (cached_keys := self._access_token_cache_keys.get(refresh_token.id)) is None:
+            cached_keys = self._access_token_cache_keys[refresh_token.id] = (
+                set(),
+                self.async_register_revoke_token_callback(
+                    refresh_token.id,
+                    partial(self._async_drop_cached_access_tokens, refresh_token.id),
+                ),
+            )
+
+        cached_keys[0].add(cache_key)
+        self._access_token_cache[cache_key] = (refresh_token, expires)
+
+        while len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            self._async_drop_cached_access_token(next(iter(self._access_token_cache)))
+
+    @callback
+    def _async_drop_cached_access_token(self, cache_key: bytes) -> None:
+        """Remove an access token from the validation cache."""
+        if (cached := self._access_token_cache.pop(cache_key, None)) is None:
+            return
+
+        refresh_token_id = cached[0].id
+        keys, unregister = self._access_token_cache_keys[refresh_token_id]
+        keys.discard(cache_key)
+        if not keys:
+            del self._access_token_cache_keys[refresh_token_id]
+            unregister()
+
+    @callback
+    def _async_drop_cached_access_tokens(self, refresh_token_id: str) -> None:
+        """Remove all cached access tokens of a revoked or removed refresh token.
+
+        The revoke callbacks of the refresh token are dropped by the caller.
+        """
+        if (
+            cached_keys := self._access_token_cache_keys.pop(refresh_token_id, None)
+        ) is None:
+            return
+
+        for cache_key in cached_keys[0]:
+            self._access_token_cache.pop(cache_key, None)
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
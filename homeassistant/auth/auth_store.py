@@ -8,7 +8,7 @@ import hmac
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from . import models
@@ -44,6 +44,9 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        # Indexes of the refresh tokens of all users by id and by token
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_token: dict[str, models.RefreshToken] = {}
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
@@ -148,6 +151,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -236,6 +241,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -248,10 +254,12 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if (found := self._refresh_tokens.get(refresh_token.id)) is None:
+            return
+
+        found.user.refresh_tokens.pop(found.id, None)
+        self._async_unindex_refresh_token(found)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -261,12 +269,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -276,14 +279,23 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        refresh_token = self._refresh_tokens_by_token.get(token)
+        if refresh_token is None or not hmac.compare_digest(refresh_token.token, token):
+            return None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        return refresh_token
+
+    @callback
+    def _async_index_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the lookup indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_token[refresh_token.token] = refresh_token
 
-        return found
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the lookup indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_token.pop(refresh_token.token, None)
 
     @callback
     def async_log_refresh_token_usage(
@@ -316,6 +328,20 @@ class AuthStore:
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
 
+        @callback
+        def _async_registry_updated(event: Event) -> None:
+            """Invalidate memoized entity permissions."""
+            perm_lookup.generation += 1
+
+        self.hass.bus.async_listen(
+            self.hass.helpers.entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_registry_updated,
+        )
+        self.hass.bus.async_listen(
+            self.hass.helpers.device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            _async_registry_updated,
+        )
+
         if data is None:
             self._set_defaults()
             return
@@ -487,6 +513,7 @@ class AuthStore:
                 version=rt_dict.get("version"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
@@ -6,7 +6,7 @@ from typing import Any
 
 import voluptuous as vol
 
-from .const import CAT_ENTITIES
+from .const import CAT_ENTITIES, MAX_CACHED_ENTITY_CHECKS
 from .entities import ENTITY_POLICY_SCHEMA, compile_entities
 from .merge import merge_policies
 from .models import PermissionLookup
@@ -54,11 +54,46 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        # Entity ids that are visible and hidden for each key, valid for a
+        # single generation of the permission lookup
+        self._entity_checks: dict[str, tuple[set[str], set[str]]] = {}
+        self._entity_checks_size = 0
+        self._entity_checks_generation = 0
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
         return test_all(self._policy.get(CAT_ENTITIES), key)
 
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        Results are memoized until the entity or device registry changes.
+        """
+        if (
+            self._perm_lookup is not None
+            and self._perm_lookup.generation != self._entity_checks_generation
+        ) or self._entity_checks_size >= MAX_CACHED_ENTITY_CHECKS:
+            self._entity_checks.clear()
+            self._entity_checks_size = 0
+            if self._perm_lookup is not None:
+                self._entity_checks_generation = self._perm_lookup.generation
+
+        if (entity_checks := self._entity_checks.get(key)) is None:
+            entity_checks = self._entity_checks[key] = (set(), set())
+
+        visible, hidden = entity_checks
+        if entity_id in visible:
+            return True
+        if entity_id in hidden:
+            return False
+
+        self._entity_checks_size += 1
+        if super().check_entity(entity_id, key):
+            visible.add(entity_id)
+            return True
+        hidden.add(entity_id)
+        return False
+
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
         return compile_entities(self._policy.get(CAT_ENTITIES), self._perm_lookup)
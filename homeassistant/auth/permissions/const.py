@@ -6,3 +6,6 @@ SUBCAT_ALL = "all"
 POLICY_READ = "read"
 POLICY_CONTROL = "control"
 POLICY_EDIT = "edit"
+
+# Upper bound of memoized entity checks of a single user
+MAX_CACHED_ENTITY_CHECKS = 10000
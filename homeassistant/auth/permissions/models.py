@@ -18,3 +18,5 @@ class PermissionLookup:
 
     entity_registry: ent_reg.EntityRegistry = attr.ib()
     device_registry: dev_reg.DeviceRegistry = attr.ib()
+    # Incremented when the registries change so memoized checks are redone
+    generation: int = attr.ib(default=0)
@@ -530,6 +530,21 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import the integrations in the executor ahead of their setup, stage 1
+    # first and dependencies before the integrations depending on them.
+    preload_task = asyncio.create_task(
+        loader.async_preload_integrations(
+            hass,
+            sorted(
+                integration_cache.values(),
+                key=lambda itg: (
+                    itg.domain not in stage_1_domains,
+                    len(itg.all_dependencies),
+                ),
+            ),
+        )
+    )
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -570,6 +585,7 @@ async def _async_set_up_integrations(
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
+    preload_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
 
     _LOGGER.debug(
@@ -581,3 +597,12 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Integration import times: %s",
+        dict(
+            sorted(
+                hass.data.get(loader.DATA_IMPORT_TIMES, {}).items(),
+                key=lambda item: item[1],  # type: ignore[no-any-return]
+            )
+        ),
+    )
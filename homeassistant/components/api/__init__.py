@@ -1,8 +1,12 @@
 """Rest API for Home Assistant."""
+from __future__ import annotations
+
 import asyncio
+from collections.abc import Callable
 from http import HTTPStatus
 import json
 import logging
+from typing import Any
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPBadRequest
@@ -13,6 +17,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     MATCH_ALL,
@@ -27,10 +32,10 @@ from homeassistant.const import (
     URL_API_TEMPLATE,
 )
 import homeassistant.core as ha
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, executor_job_timer_cv
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, states_to_json
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 
@@ -48,12 +53,22 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_PING_MESSAGE = f"data: {STREAM_PING_PAYLOAD}\n\n".encode("UTF-8")
+# Events waiting to be written to a single stream client
+STREAM_QUEUE_SIZE = 1024
+STREAM_OVERFLOW_DROP = "drop"
+STREAM_OVERFLOW_DISCONNECT = "disconnect"
+STREAM_OVERFLOW_POLICIES = (STREAM_OVERFLOW_DROP, STREAM_OVERFLOW_DISCONNECT)
+URL_API_STREAM_STATS = f"{URL_API_STREAM}/stats"
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Register the API with the HTTP interface."""
+    hass.data[DOMAIN] = EventStreamHub(hass)
+
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIEventStreamStatsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIStatesView)
     hass.http.register_view(APIEntityStateView)
@@ -82,6 +97,113 @@ class APIStatusView(HomeAssistantView):
         return self.json_message("API running.")
 
 
+class EventStreamClient:
+    """A client of the event stream with a bounded queue of messages."""
+
+    __slots__ = ("restrict", "overflow", "queue", "sent", "dropped", "stopped")
+
+    def __init__(self, restrict: list[str] | None, overflow: str) -> None:
+        """Initialize the stream client."""
+        self.restrict = restrict
+        self.overflow = overflow
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_QUEUE_SIZE)
+        self.sent = 0
+        self.dropped = 0
+        self.stopped = False
+
+    @ha.callback
+    def async_put(self, message: bytes) -> None:
+        """Queue a message, applying the overflow policy if the queue is full."""
+        if self.stopped:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.overflow == STREAM_OVERFLOW_DISCONNECT:
+                _LOGGER.debug("STREAM %s DISCONNECTING SLOW CLIENT", id(self))
+                self.async_stop()
+
+    @ha.callback
+    def async_stop(self) -> None:
+        """Stop the stream after the queued messages have been written."""
+        if self.stopped:
+            return
+        self.stopped = True
+        if self.queue.full():
+            # Make room for the stop marker
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the client."""
+        return {
+            "restrict": self.restrict,
+            "overflow": self.overflow,
+            "lag": self.queue.qsize(),
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+
+class EventStreamHub:
+    """Encode each event once and share it with all stream clients."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.clients: set[EventStreamClient] = set()
+        self._unsub_events: Callable[[], None] | None = None
+
+    @ha.callback
+    def async_add_client(self, client: EventStreamClient) -> Callable[[], None]:
+        """Add a client and return a function to remove it."""
+        if self._unsub_events is None:
+            self._unsub_events = self.hass.bus.async_listen(
+                MATCH_ALL, self._async_forward_event
+            )
+        self.clients.add(client)
+
+        @ha.callback
+        def async_remove_client() -> None:
+            """Remove the client."""
+            self.clients.discard(client)
+            if not self.clients and self._unsub_events is not None:
+                self._unsub_events()
+                self._unsub_events = None
+
+        return async_remove_client
+
+    @ha.callback
+    def _async_forward_event(self, event: Event) -> None:
+        """Forward an event to the clients that are interested in it."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        message: bytes | None = None
+        for client in list(self.clients):
+            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+                client.async_stop()
+                continue
+
+            if client.restrict and event.event_type not in client.restrict:
+                continue
+
+            if message is None:
+                _LOGGER.debug("STREAM FORWARDING %s", event)
+                message = f"data: {json.dumps(event, cls=JSONEncoder)}\n\n".encode(
+                    "UTF-8"
+                )
+
+            client.async_put(message)
+
+    @ha.callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return the statistics of the connected clients."""
+        return [client.as_dict() for client in self.clients]
+
+
 class APIEventStream(HomeAssistantView):
     """View to handle EventStream requests."""
 
@@ -93,66 +215,72 @@ class APIEventStream(HomeAssistantView):
         # pylint: disable=no-self-use
         if not request["hass_user"].is_admin:
             raise Unauthorized()
-        hass = request.app["hass"]
-        stop_obj = object()
-        to_write = asyncio.Queue()
+        hub: EventStreamHub = request.app["hass"].data[DOMAIN]
+        # The stream stays open, so executor jobs are not accounted to it
+        executor_job_timer_cv.set(None)
 
         if restrict := request.query.get("restrict"):
-            restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
-
-        async def forward_events(event):
-            """Forward events to the open request."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
+            restrict = restrict.split(",")
 
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json.dumps(event, cls=JSONEncoder)
+        overflow = request.query.get("overflow", STREAM_OVERFLOW_DROP)
+        if overflow not in STREAM_OVERFLOW_POLICIES:
+            return self.json_message(
+                f"Overflow policy must be one of {', '.join(STREAM_OVERFLOW_POLICIES)}",
+                HTTPStatus.BAD_REQUEST,
+            )
 
-            await to_write.put(data)
+        client = EventStreamClient(restrict, overflow)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        remove_client = hub.async_add_client(client)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", id(client))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            await response.write(STREAM_PING_MESSAGE)
 
             while True:
                 try:
                     async with async_timeout.timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
+                        message = await client.queue.get()
+                except asyncio.TimeoutError:
+                    message = STREAM_PING_MESSAGE
 
-                    if payload is stop_obj:
-                        break
+                if message is None:
+                    break
 
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
-                except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                _LOGGER.debug("STREAM %s WRITING %s", id(client), message.strip())
+                await response.write(message)
+                client.sent += 1
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", id(client))
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(client))
+            remove_client()
 
         return response
 
 
+class APIEventStreamStatsView(HomeAssistantView):
+    """View to handle EventStream statistics requests."""
+
+    url = URL_API_STREAM_STATS
+    name = "api:stream:stats"
+
+    @ha.callback
+    def get(self, request):
+        """Return the lag and drop counters of the stream clients."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        return self.json(request.app["hass"].data[DOMAIN].async_get_stats())
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -175,13 +303,32 @@ class APIStatesView(HomeAssistantView):
     def get(self, request):
         """Get current states."""
         user = request["hass_user"]
+        hass = request.app["hass"]
         entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+        try:
+            if user.permissions.access_all_entities(POLICY_READ):
+                body = hass.states.async_all_json()
+            else:
+                body = states_to_json(
+                    state
+                    for state in hass.states.async_all()
+                    if entity_perm(state.entity_id, POLICY_READ)
+                )
+        except (ValueError, TypeError):
+            # Let the regular serializer report which states can't be serialized
+            return self.json(
+                [
+                    state
+                    for state in hass.states.async_all()
+                    if entity_perm(state.entity_id, POLICY_READ)
+                ]
+            )
+
+        response = web.Response(
+            body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON
+        )
+        response.enable_compression()
+        return response
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -9,6 +9,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.components import blueprint
+from homeassistant.components.trace import async_clear_trace_run_count
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -62,9 +63,11 @@ from homeassistant.helpers.service import (
 )
 from homeassistant.helpers.trace import (
     TraceElement,
+    TraceLevel,
     script_execution_set,
     trace_append_element,
     trace_get,
+    trace_level_get,
     trace_path,
 )
 from homeassistant.helpers.trigger import async_initialize_triggers
@@ -525,6 +528,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_clear_trace_run_count(self.hass, (DOMAIN, self.unique_id))
 
     async def async_enable(self):
         """Enable this automation entity.
@@ -721,8 +725,17 @@ async def _async_process_if(hass, name, config, p_config):
             LOGGER.warning("Invalid condition: %s", ex)
             return None
 
+    check_all = condition.async_compile_and(checks)
+
     def if_action(variables=None):
         """AND all conditions."""
+        if trace_level_get() == TraceLevel.OFF:
+            try:
+                return check_all(hass, variables)
+            except ConditionError:
+                # Evaluate the conditions one by one to report the errors
+                pass
+
         errors = []
         for index, check in enumerate(checks):
             try:
@@ -4,9 +4,14 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_get_trace_level,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context
+from homeassistant.helpers.trace import TraceLevel, trace_level_reset, trace_level_set
 
 from .const import DOMAIN
 
@@ -50,7 +55,10 @@ def trace_automation(
 ):
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    level = async_get_trace_level(hass, (DOMAIN, automation_id), trace_config)
+    if level != TraceLevel.OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_level_set(level)
 
     try:
         yield trace
@@ -59,5 +67,6 @@ def trace_automation(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_level_reset(token)
         if automation_id:
             trace.finished()
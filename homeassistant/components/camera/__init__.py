@@ -61,12 +61,13 @@ from .const import (
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
+    DATA_SCALED_IMAGE_CACHE,
     DOMAIN,
     SERVICE_RECORD,
     STREAM_TYPE_HLS,
     STREAM_TYPE_WEB_RTC,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import ScaledImageCache, scale_jpeg_camera_image
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls
@@ -158,7 +159,35 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests for the same size share a single fetch.
     """
+    key = (width, height)
+    if (fetch := camera._image_fetches.get(key)) is None:
+        fetch = camera._image_fetches[key] = asyncio.create_task(
+            _async_fetch_image(camera, timeout, width, height)
+        )
+
+        @callback
+        def _async_fetch_done(fetch: asyncio.Task[Image]) -> None:
+            """Forget the finished fetch."""
+            del camera._image_fetches[key]
+            # Retrieve the exception in case all requests were cancelled
+            if not fetch.cancelled():
+                fetch.exception()
+
+        fetch.add_done_callback(_async_fetch_done)
+
+    return await asyncio.shield(fetch)
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int = 10,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image:
+    """Fetch a snapshot image from a camera device."""
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             # Calling inspect will be removed in 2022.1 after all
@@ -183,7 +212,8 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await _async_scale_image(camera, image, width, height),
                     )
 
                 return image
@@ -191,6 +221,27 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_scale_image(
+    camera: Camera, image: Image, width: int, height: int
+) -> bytes:
+    """Scale a jpeg camera image in the executor, reusing cached results."""
+    if (cache := camera.hass.data.get(DATA_SCALED_IMAGE_CACHE)) is None:
+        cache = camera.hass.data[DATA_SCALED_IMAGE_CACHE] = ScaledImageCache()
+
+    key = (
+        camera.entity_id,
+        hashlib.blake2b(image.content, digest_size=16).digest(),
+        width,
+        height,
+    )
+    if (content := cache.get(key)) is None:
+        content = await camera.hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        )
+        cache.set(key, content)
+    return content
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -263,7 +314,7 @@ async def async_get_still_stream(
         if not img_bytes:
             break
 
-        if img_bytes != last_image:
+        if img_bytes is not last_image and img_bytes != last_image:
             await write_to_mjpeg_stream(img_bytes)
 
             # Chrome seems to always ignore first picture,
@@ -277,6 +328,76 @@ async def async_get_still_stream(
     return response
 
 
+class _StillStreamProducer:
+    """Poll a camera once for all MJPEG viewers of an interval.
+
+    Every viewer gets a queue holding the latest changed image, viewers
+    which can't keep up skip images. None is queued when the camera stops
+    returning images.
+    """
+
+    def __init__(
+        self,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        interval: float,
+        on_stop: Callable[[], None],
+    ) -> None:
+        """Initialize the producer."""
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_stop = on_stop
+        self._queues: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._last_image: bytes | None = None
+
+    @callback
+    def async_subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Add a viewer and start polling the camera."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+        if self._last_image is not None:
+            queue.put_nowait(self._last_image)
+        self._queues.add(queue)
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_produce())
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Remove a viewer and stop polling after the last one."""
+        self._queues.discard(queue)
+        if not self._queues:
+            self._async_stop()
+
+    @callback
+    def _async_broadcast(self, img_bytes: bytes | None) -> None:
+        """Replace the pending image of every viewer."""
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(img_bytes)
+
+    async def _async_produce(self) -> None:
+        """Poll the camera and broadcast changed images."""
+        try:
+            while img_bytes := await self._image_cb():
+                if img_bytes is not self._last_image and img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    self._async_broadcast(img_bytes)
+                await asyncio.sleep(self._interval)
+        finally:
+            self._task = None
+            self._async_broadcast(None)
+            self._async_stop()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop polling the camera."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._on_stop()
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     if (component := hass.data.get(DOMAIN)) is None:
@@ -456,6 +577,8 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._image_fetches: dict[tuple[int | None, int | None], asyncio.Task] = {}
+        self._still_stream_producers: dict[float, _StillStreamProducer] = {}
 
     @property
     def entity_picture(self) -> str:
@@ -601,10 +724,29 @@ class Camera(Entity):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        Viewers of the same interval share one producer polling the camera.
+        """
+        if (producer := self._still_stream_producers.get(interval)) is None:
+
+            @callback
+            def _async_remove_producer() -> None:
+                """Forget the producer once it stopped."""
+                if self._still_stream_producers.get(interval) is producer:
+                    del self._still_stream_producers[interval]
+
+            producer = self._still_stream_producers[interval] = _StillStreamProducer(
+                self.async_camera_image, interval, _async_remove_producer
+            )
+
+        queue = producer.async_subscribe()
+        try:
+            return await async_get_still_stream(
+                request, queue.get, self.content_type, interval
+            )
+        finally:
+            producer.async_unsubscribe(queue)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -5,6 +5,7 @@ DOMAIN: Final = "camera"
 
 DATA_CAMERA_PREFS: Final = "camera_prefs"
 DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
+DATA_SCALED_IMAGE_CACHE: Final = "camera_scaled_image_cache"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 
@@ -1,8 +1,9 @@
 """Image processing for cameras."""
 from __future__ import annotations
 
+from collections import OrderedDict
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 SUPPORTED_SCALING_FACTORS = [(7, 8), (3, 4), (5, 8), (1, 2), (3, 8), (1, 4), (1, 8)]
 
@@ -10,6 +11,8 @@ _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+SCALED_IMAGE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
 if TYPE_CHECKING:
     from turbojpeg import TurboJPEG
 
@@ -66,6 +69,54 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+class ScaledImageCache:
+    """Least recently used cache of scaled camera images.
+
+    Images are keyed by entity, a digest of the source frame and the
+    requested size. The total size of the cached images is bounded.
+    """
+
+    def __init__(self, max_bytes: int = SCALED_IMAGE_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._images: OrderedDict[tuple[str, bytes, int, int], bytes] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, bytes, int, int]) -> bytes | None:
+        """Return a cached scaled image."""
+        if (content := self._images.get(key)) is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(key)
+        self.hits += 1
+        return content
+
+    def set(self, key: tuple[str, bytes, int, int], content: bytes) -> None:
+        """Cache a scaled image and evict the least recently used ones."""
+        if len(content) > self._max_bytes:
+            return
+        if (old_content := self._images.pop(key, None)) is not None:
+            self.size -= len(old_content)
+        self._images[key] = content
+        self.size += len(content)
+        while self.size > self._max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= len(evicted)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return the cache statistics."""
+        return {
+            "images": len(self._images),
+            "size": self.size,
+            "max_size": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class TurboJPEGSingleton:
     """
     Load TurboJPEG only once.
@@ -21,6 +21,7 @@ from homeassistant.const import (
     CONF_NAME,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_OFF,
     STATE_ON,
@@ -67,6 +68,7 @@ PLATFORMS = [
 ]
 
 REG_KEY = f"{DOMAIN}_registry"
+EXPANSION_CACHE_KEY = f"{DOMAIN}_expansion_cache"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -141,7 +143,9 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
     Async friendly.
     """
+    expansion_cache = _get_expansion_cache(hass)
     found_ids: list[str] = []
+    seen: set[str] = set()
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -154,29 +158,156 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
         try:
             # If entity_id points at a group, expand it
             domain, _ = ha.split_entity_id(entity_id)
+        except AttributeError:
+            # Raised by split_entity_id if entity_id is not a string
+            continue
 
-            if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
-
+        if domain == DOMAIN:
+            if expansion_cache is None:
+                members = _expand_group(hass, entity_id, None)[0]
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                members = expansion_cache.expand(entity_id)
+            for member in members:
+                if member not in seen:
+                    seen.add(member)
+                    found_ids.append(member)
 
-        except AttributeError:
-            # Raised by split_entity_id if entity_id is not a string
-            pass
+        elif entity_id not in seen:
+            seen.add(entity_id)
+            found_ids.append(entity_id)
 
     return found_ids
 
 
+def _group_members(state: ha.State | None) -> Any:
+    """Return the members of a group state."""
+    if state is None:
+        return None
+    return state.attributes.get(ATTR_ENTITY_ID)
+
+
+def _expand_group(
+    hass: HomeAssistant, group_id: str, expansion_cache: GroupExpansionCache | None
+) -> tuple[tuple[str, ...], set[str]]:
+    """Return the entities reachable from a group and the groups visited.
+
+    Nested groups that have already been expanded are taken from the cache.
+    Groups that are part of a cycle are only expanded once.
+    """
+    found_ids: list[str] = []
+    seen: set[str] = set()
+    visited: set[str] = {group_id}
+    cycles: list[str] = []
+
+    def _visit(current_id: str) -> None:
+        members = _group_members(hass.states.get(current_id))
+        if not members:
+            return
+        for member in members:
+            if not isinstance(member, str) or member in (
+                ENTITY_MATCH_NONE,
+                ENTITY_MATCH_ALL,
+            ):
+                continue
+            member = member.lower()
+            if not member.startswith(f"{DOMAIN}."):
+                if member not in seen:
+                    seen.add(member)
+                    found_ids.append(member)
+                continue
+            if member in visited:
+                if member != current_id:
+                    cycles.append(member)
+                continue
+            if expansion_cache is not None and (cached := expansion_cache.get(member)):
+                visited.update(cached[1])
+                for ent_id in cached[0]:
+                    if ent_id not in seen:
+                        seen.add(ent_id)
+                        found_ids.append(ent_id)
+                continue
+            visited.add(member)
+            _visit(member)
+
+    _visit(group_id)
+
+    if cycles:
+        _LOGGER.warning(
+            "Group %s is part of a cycle of nested groups through %s",
+            group_id,
+            ", ".join(sorted(set(cycles))),
+        )
+
+    return tuple(found_ids), visited
+
+
+class GroupExpansionCache:
+    """Cache of the entities reachable from each group.
+
+    An expansion is dropped when the members of any group that was
+    visited to build it change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._expanded: dict[str, tuple[tuple[str, ...], set[str]]] = {}
+        self._dependents: dict[str, set[str]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for group membership changes."""
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_membership_changed,
+            self._async_membership_changed_filter,
+        )
+
+    @callback
+    def get(self, group_id: str) -> tuple[tuple[str, ...], set[str]] | None:
+        """Return a cached expansion and the groups it depends on."""
+        return self._expanded.get(group_id)
+
+    @callback
+    def expand(self, group_id: str) -> tuple[str, ...]:
+        """Return the entities reachable from a group."""
+        if (cached := self._expanded.get(group_id)) is not None:
+            return cached[0]
+        expanded = self._expanded[group_id] = _expand_group(self.hass, group_id, self)
+        for visited_id in expanded[1]:
+            self._dependents.setdefault(visited_id, set()).add(group_id)
+        return expanded[0]
+
+    @callback
+    def _async_membership_changed_filter(self, event: ha.Event) -> bool:
+        """Filter state changes that change the members of a group."""
+        return bool(
+            event.data["entity_id"] in self._dependents
+            and _group_members(event.data.get("old_state"))
+            != _group_members(event.data.get("new_state"))
+        )
+
+    @callback
+    def _async_membership_changed(self, event: ha.Event) -> None:
+        """Drop the expansions that depend on a changed group."""
+        for group_id in self._dependents.pop(event.data["entity_id"], ()):
+            self._expanded.pop(group_id, None)
+
+
+def _get_expansion_cache(hass: HomeAssistant) -> GroupExpansionCache | None:
+    """Return the group expansion cache if called from the event loop."""
+    try:
+        if asyncio.get_running_loop() is not hass.loop:
+            return None
+    except RuntimeError:
+        return None
+    if (expansion_cache := hass.data.get(EXPANSION_CACHE_KEY)) is not None:
+        return cast(GroupExpansionCache, expansion_cache)
+    expansion_cache = hass.data[EXPANSION_CACHE_KEY] = GroupExpansionCache(hass)
+    expansion_cache.async_setup()
+    return expansion_cache
+
+
 @bind_hass
 def get_entity_ids(
     hass: HomeAssistant, entity_id: str, domain_filter: str | None = None
@@ -1,8 +1,10 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -37,6 +39,8 @@ CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
 
+DATA_STATE_TRIGGER_DISPATCHER = "state_trigger_dispatcher"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -84,6 +88,156 @@ async def async_validate_trigger_config(
     return config
 
 
+def _match_key(parameter: Any) -> Hashable:
+    """Return a key to share the matcher of a from or to parameter."""
+    if isinstance(parameter, list):
+        parameter = tuple(parameter)
+    try:
+        hash(parameter)
+    except TypeError:
+        return id(parameter)
+    return parameter
+
+
+class _StateTriggerMatcher:
+    """State triggers of an entity sharing the attribute and from/to matchers."""
+
+    __slots__ = (
+        "attribute",
+        "match_all",
+        "match_from_state",
+        "match_to_state",
+        "actions",
+    )
+
+    def __init__(
+        self, attribute: str | None, from_state: Any, to_state: Any, match_all: bool
+    ) -> None:
+        """Initialize the matcher."""
+        self.attribute = attribute
+        self.match_all = match_all
+        self.match_from_state = process_state_match(from_state)
+        self.match_to_state = process_state_match(to_state)
+        self.actions: list[Callable[[Event, Any, Any], None]] = []
+
+
+class _StateTriggerDispatcher:
+    """Dispatch state changes to the state triggers of each entity.
+
+    Each watched entity is tracked once, no matter how many triggers watch it.
+    Triggers which share the attribute and from/to matchers are matched once
+    per state change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._matchers: dict[str, dict[Hashable, _StateTriggerMatcher]] = {}
+        self._unsub_track: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: list[str],
+        attribute: str | None,
+        from_state: Any,
+        to_state: Any,
+        match_all: bool,
+        action: Callable[[Event, Any, Any], None],
+    ) -> CALLBACK_TYPE:
+        """Add a state trigger action for entities."""
+        key = (attribute, _match_key(from_state), _match_key(to_state), match_all)
+        for entity_id in entity_ids:
+            matchers = self._matchers.setdefault(entity_id, {})
+            if (matcher := matchers.get(key)) is None:
+                matcher = matchers[key] = _StateTriggerMatcher(
+                    attribute, from_state, to_state, match_all
+                )
+            matcher.actions.append(action)
+            if entity_id not in self._unsub_track:
+                self._unsub_track[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+
+        @callback
+        def async_remove() -> None:
+            """Remove the state trigger action."""
+            for entity_id in entity_ids:
+                matchers = self._matchers[entity_id]
+                matcher = matchers[key]
+                matcher.actions.remove(action)
+                if not matcher.actions:
+                    del matchers[key]
+                if not matchers:
+                    del self._matchers[entity_id]
+                    self._unsub_track.pop(entity_id)()
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Match a state change against the triggers of the entity."""
+        entity_id: str = event.data["entity_id"]
+        if (matchers := self._matchers.get(entity_id)) is None:
+            return
+
+        from_s: State | None = event.data.get("old_state")
+        to_s: State | None = event.data.get("new_state")
+        values: dict[str | None, tuple[Any, Any]] = {}
+
+        for matcher in list(matchers.values()):
+            if (attribute := matcher.attribute) in values:
+                old_value, new_value = values[attribute]
+            else:
+                if from_s is None:
+                    old_value = None
+                elif attribute is None:
+                    old_value = from_s.state
+                else:
+                    old_value = from_s.attributes.get(attribute)
+
+                if to_s is None:
+                    new_value = None
+                elif attribute is None:
+                    new_value = to_s.state
+                else:
+                    new_value = to_s.attributes.get(attribute)
+
+                values[attribute] = (old_value, new_value)
+
+            # When we listen for state changes with `match_all`, we
+            # will trigger even if just an attribute changes. When
+            # we listen to just an attribute, we should ignore all
+            # other attribute changes.
+            if attribute is not None and old_value == new_value:
+                continue
+
+            if (
+                not matcher.match_from_state(old_value)
+                or not matcher.match_to_state(new_value)
+                or (not matcher.match_all and old_value == new_value)
+            ):
+                continue
+
+            for action in list(matcher.actions):
+                try:
+                    action(event, old_value, new_value)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while processing state change for %s", entity_id
+                    )
+
+
+@callback
+def _async_get_dispatcher(hass: HomeAssistant) -> _StateTriggerDispatcher:
+    """Return the state trigger dispatcher."""
+    if (dispatcher := hass.data.get(DATA_STATE_TRIGGER_DISPATCHER)) is None:
+        dispatcher = hass.data[DATA_STATE_TRIGGER_DISPATCHER] = _StateTriggerDispatcher(
+            hass
+        )
+    return dispatcher
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config,
@@ -105,8 +259,6 @@ async def async_attach_trigger(
     match_all = CONF_FROM not in config and CONF_TO not in config
     unsub_track_same = {}
     period: dict[str, timedelta] = {}
-    match_from_state = process_state_match(from_state)
-    match_to_state = process_state_match(to_state)
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action)
 
@@ -114,40 +266,12 @@ async def async_attach_trigger(
     _variables = automation_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
+    def state_automation_listener(event: Event, old_value: Any, new_value: Any):
+        """Listen for matching state changes and calls action."""
         entity: str = event.data["entity_id"]
         from_s: State | None = event.data.get("old_state")
         to_s: State | None = event.data.get("new_state")
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action():
             """Call action with right context."""
@@ -215,7 +339,14 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = _async_get_dispatcher(hass).async_add(
+        entity_ids,
+        attribute,
+        from_state,
+        to_state,
+        match_all,
+        state_automation_listener,
+    )
 
     @callback
     def async_remove():
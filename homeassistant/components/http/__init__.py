@@ -28,6 +28,11 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_HASS_USER  # noqa: F401
 from .cors import setup_cors
 from .forwarded import async_setup_forwarded
 from .request_context import current_request, setup_request_context
+from .request_stats import (  # noqa: F401
+    async_get_request_stats,
+    async_reset_request_stats,
+    setup_request_stats,
+)
 from .security_filter import setup_security_filter
 from .static import CACHE_HEADERS, CachingStaticResource
 from .view import HomeAssistantView
@@ -251,6 +256,8 @@ class HomeAssistantHTTP:
 
         setup_request_context(self.app, current_request)
 
+        setup_request_stats(self.app)
+
         if is_ban_enabled:
             setup_bans(self.hass, self.app, login_threshold)
 
@@ -5,3 +5,4 @@ KEY_AUTHENTICATED: Final = "ha_authenticated"
 KEY_HASS: Final = "hass"
 KEY_HASS_USER: Final = "hass_user"
 KEY_HASS_REFRESH_TOKEN_ID: Final = "hass_refresh_token_id"
+KEY_REQUEST_STATS: Final = "ha_request_stats"
@@ -0,0 +1,140 @@
+"""Middleware to collect per route request statistics."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any, Final
+
+from aiohttp.web import Application, HTTPException, Request, StreamResponse, middleware
+
+from homeassistant.core import (
+    ExecutorJobTimer,
+    HomeAssistant,
+    callback,
+    executor_job_timer_cv,
+)
+
+from .const import KEY_REQUEST_STATS
+
+# Upper bounds in milliseconds of the latency histogram buckets, the last
+# bucket counts everything slower
+LATENCY_BUCKETS: Final = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+UNMATCHED_METHOD: Final = "*"
+UNMATCHED_ROUTE: Final = "<unmatched>"
+
+
+class RouteStats:
+    """Statistics of the requests handled by a single route."""
+
+    __slots__ = (
+        "count",
+        "statuses",
+        "bytes",
+        "latency_total",
+        "latency_max",
+        "latency_buckets",
+        "executor_total",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the route statistics."""
+        self.count = 0
+        self.statuses: dict[int, int] = {}
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.executor_total = 0.0
+
+    @callback
+    def async_add(
+        self, latency: float, status: int, size: int, executor_time: float
+    ) -> None:
+        """Add a handled request."""
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes += size
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency * 1000)] += 1
+        self.executor_total += executor_time
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "count": self.count,
+            "statuses": self.statuses,
+            "bytes": self.bytes,
+            "latency_total": self.latency_total,
+            "latency_max": self.latency_max,
+            "latency_buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS), "inf"], self.latency_buckets)
+            ),
+            "executor_total": self.executor_total,
+        }
+
+
+@callback
+def setup_request_stats(app: Application) -> None:
+    """Create request statistics middleware for the app."""
+    stats: dict[tuple[str, str], RouteStats] = {}
+    app[KEY_REQUEST_STATS] = stats
+
+    @middleware
+    async def request_stats_middleware(
+        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
+    ) -> StreamResponse:
+        """Request statistics middleware."""
+        job_timer = ExecutorJobTimer()
+        token = executor_job_timer_cv.set(job_timer)
+        start = monotonic()
+        status = 500
+        size = 0
+        try:
+            response = await handler(request)
+            status = response.status
+            if response.prepared:
+                size = response.body_length
+            elif response.content_length is not None:
+                size = response.content_length
+            return response
+        except HTTPException as err:
+            status = err.status
+            raise
+        finally:
+            # Tasks started by the request keep the timer, stop recording
+            job_timer.active = False
+            executor_job_timer_cv.reset(token)
+            resource = request.match_info.route.resource
+            # Requests of unmatched routes are not authenticated yet, don't
+            # let their method add entries
+            key = (
+                (UNMATCHED_METHOD, UNMATCHED_ROUTE)
+                if resource is None
+                else (request.method, resource.canonical)
+            )
+            if (route_stats := stats.get(key)) is None:
+                route_stats = stats[key] = RouteStats()
+            route_stats.async_add(monotonic() - start, status, size, job_timer.total)
+
+    app.middlewares.append(request_stats_middleware)
+
+
+@callback
+def async_get_request_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the request statistics of each route keyed by method and path."""
+    if hass.http is None:
+        return {}
+    return {
+        f"{method} {path}": route_stats.as_dict()
+        for (method, path), route_stats in hass.http.app[KEY_REQUEST_STATS].items()
+    }
+
+
+@callback
+def async_reset_request_stats(hass: HomeAssistant) -> None:
+    """Reset the request statistics of all routes."""
+    if hass.http is not None:
+        hass.http.app[KEY_REQUEST_STATS].clear()
@@ -1,26 +1,210 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+import mimetypes
+import os
 from pathlib import Path
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
+from homeassistant.core import callback
+
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADERS: Final[Mapping[str, str]] = {
     hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"
 }
 
+# Files up to this size are served from memory
+MAX_MEMORY_FILE_SIZE: Final = 256 * 1024
+# Memory budget for the served files of a single static path
+MAX_MEMORY_CACHE_SIZE: Final = 8 * 1024 * 1024
+MAX_PATH_CACHE_SIZE: Final = 4096
+
+# Precompressed siblings of a file in order of preference
+PRECOMPRESSED_ENCODINGS: Final = (("br", ".br"), ("gzip", ".gz"))
+
+# Requests with these headers are served by FileResponse
+FILE_RESPONSE_HEADERS: Final = (
+    hdrs.RANGE,
+    hdrs.IF_RANGE,
+    hdrs.IF_MATCH,
+    hdrs.IF_UNMODIFIED_SINCE,
+)
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Return the quality value of each encoding in an Accept-Encoding header."""
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        encoding, *params = item.split(";")
+        if not (encoding := encoding.strip().lower()):
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[encoding] = quality
+    return qualities
+
+
+class _MemoryFile:
+    """A small static file and its precompressed siblings held in memory."""
+
+    __slots__ = (
+        "mtime",
+        "mtime_ns",
+        "size",
+        "etag",
+        "content_type",
+        "content_encoding",
+        "bodies",
+        "cache_size",
+    )
+
+    def __init__(self, filepath: Path, stat: os.stat_result) -> None:
+        """Load a file and its precompressed siblings from disk.
+
+        Does blocking I/O and must run in the executor.
+        """
+        self.mtime = stat.st_mtime
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        content_type, self.content_encoding = mimetypes.guess_type(str(filepath))
+        self.content_type = content_type or "application/octet-stream"
+        self.bodies: dict[str | None, bytes] = {None: filepath.read_bytes()}
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if self.content_encoding is not None:
+                # The file itself is compressed, like a requested .gz file
+                break
+            try:
+                self.bodies[encoding] = filepath.with_name(
+                    filepath.name + suffix
+                ).read_bytes()
+            except OSError:
+                continue
+        self.cache_size = sum(len(body) for body in self.bodies.values())
+
+    def response(self, request: Request) -> Response:
+        """Return the response for a request, negotiating the encoding."""
+        headers = {
+            **CACHE_HEADERS,
+            hdrs.ETAG: f'"{self.etag}"',
+            hdrs.ACCEPT_RANGES: "bytes",
+        }
+        if len(self.bodies) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if_none_match = request.if_none_match
+        if_modified_since = request.if_modified_since
+        if (
+            if_none_match
+            and any(etag.value in (self.etag, "*") for etag in if_none_match)
+        ) or (
+            if_none_match is None
+            and if_modified_since is not None
+            and self.mtime <= if_modified_since.timestamp()
+        ):
+            response = Response(status=304, headers=headers)
+            response.last_modified = self.mtime  # type: ignore[assignment]
+            return response
+
+        body = self.bodies[None]
+        if self.content_encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = self.content_encoding
+        elif len(self.bodies) > 1:
+            qualities = parse_accept_encoding(
+                request.headers.get(hdrs.ACCEPT_ENCODING, "")
+            )
+            best_quality = 0.0
+            for encoding, _ in PRECOMPRESSED_ENCODINGS:
+                quality = qualities.get(encoding, qualities.get("*", 0.0))
+                if encoding in self.bodies and quality > best_quality:
+                    headers[hdrs.CONTENT_ENCODING] = encoding
+                    body = self.bodies[encoding]
+                    best_quality = quality
+
+        response = Response(body=body, content_type=self.content_type, headers=headers)
+        response.last_modified = self.mtime  # type: ignore[assignment]
+        return response
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resolved paths are memoized and small files are served from memory
+    together with their precompressed .br and .gz siblings.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        self._resolved_paths: OrderedDict[str, Path] = OrderedDict()
+        self._memory_files: OrderedDict[Path, _MemoryFile] = OrderedDict()
+        self._memory_size = 0
 
     async def _handle(self, request: Request) -> StreamResponse:
         rel_url = request.match_info["filename"]
+        if (filepath := self._resolved_paths.get(rel_url)) is None:
+            filepath = self._resolve_path(request, rel_url)
+
+            # on opening a dir, load its contents if allowed
+            if filepath.is_dir():
+                return await super()._handle(request)
+            if not filepath.is_file():
+                raise HTTPNotFound
+
+            self._resolved_paths[rel_url] = filepath
+            if len(self._resolved_paths) > MAX_PATH_CACHE_SIZE:
+                self._resolved_paths.popitem(last=False)
+
+        try:
+            stat = filepath.stat()
+        except OSError as error:
+            # The file was removed since its path was resolved
+            self._resolved_paths.pop(rel_url, None)
+            raise HTTPNotFound() from error
+
+        if stat.st_size > MAX_MEMORY_FILE_SIZE or any(
+            header in request.headers for header in FILE_RESPONSE_HEADERS
+        ):
+            return FileResponse(
+                filepath,
+                chunk_size=self._chunk_size,
+                headers=CACHE_HEADERS,
+            )
+
+        memory_file = self._memory_files.get(filepath)
+        if (
+            memory_file is None
+            or memory_file.mtime_ns != stat.st_mtime_ns
+            or memory_file.size != stat.st_size
+        ):
+            try:
+                memory_file = await request.app["hass"].async_add_executor_job(
+                    _MemoryFile, filepath, stat
+                )
+            except OSError as error:
+                self._resolved_paths.pop(rel_url, None)
+                raise HTTPNotFound() from error
+            self._async_store_memory_file(filepath, memory_file)
+        else:
+            self._memory_files.move_to_end(filepath)
+
+        return memory_file.response(request)
+
+    def _resolve_path(self, request: Request, rel_url: str) -> Path:
+        """Resolve a requested path inside the static directory."""
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -38,14 +222,18 @@ class CachingStaticResource(StaticResource):
             # perm error or other kind!
             request.app.logger.exception(error)
             raise HTTPNotFound() from error
+        return filepath
 
-        # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers=CACHE_HEADERS,
-            )
-        raise HTTPNotFound
+    @callback
+    def _async_store_memory_file(
+        self, filepath: Path, memory_file: _MemoryFile
+    ) -> None:
+        """Store a file in memory, dropping the least recently used files."""
+        if (old := self._memory_files.pop(filepath, None)) is not None:
+            self._memory_size -= old.cache_size
+        self._memory_files[filepath] = memory_file
+        self._memory_size += memory_file.cache_size
+
+        while self._memory_size > MAX_MEMORY_CACHE_SIZE and len(self._memory_files) > 1:
+            _, evicted = self._memory_files.popitem(last=False)
+            self._memory_size -= evicted.cache_size
@@ -4,8 +4,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -13,7 +15,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -30,7 +32,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -39,11 +41,13 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
 )
 from homeassistant.helpers.typing import ConfigType
+import homeassistant.util.dt as dt_util
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
+    BATCH_WRITE_TARGET_SECONDS,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
@@ -56,8 +60,11 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_LINE_PROTOCOL,
+    CONF_MAX_BATCH_SIZE,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -87,6 +94,7 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    LINE_PREFIX_CACHE_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -95,11 +103,15 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPILL_FILENAME,
+    SPILL_MAX_BYTES,
+    SPILLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
+    WROTE_SPILLED_MESSAGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -183,6 +195,10 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_LINE_PROTOCOL, default=False): cv.boolean,
+        vol.Optional(CONF_MAX_BATCH_SIZE, default=BATCH_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
     }
 )
 
@@ -198,10 +214,11 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
-    """Build event to json converter and add to config."""
+def _generate_state_to_point(
+    conf: dict,
+) -> Callable[[State | None], tuple[str, dict[str, Any], dict[str, Any]] | None]:
+    """Build state to measurement, attribute tags and fields converter."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
     tags_attributes = conf.get(CONF_TAGS_ATTRIBUTES)
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr = conf.get(CONF_MEASUREMENT_ATTR)
@@ -213,15 +230,16 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    def event_to_json(event: dict) -> str:
-        """Convert event into json in format Influx expects."""
-        state = event.data.get(EVENT_NEW_STATE)
+    def state_to_point(
+        state: State | None,
+    ) -> tuple[str, dict[str, Any], dict[str, Any]] | None:
+        """Convert state into the measurement, attribute tags and fields."""
         if (
             state is None
             or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE)
             or not entity_filter(state.entity_id)
         ):
-            return
+            return None
 
         try:
             _include_state = _include_value = False
@@ -263,54 +281,72 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
-        }
+        attribute_tags: dict[str, Any] = {}
+        fields: dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                attribute_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
+
+        return measurement, attribute_tags, fields
+
+    return state_to_point
+
 
+def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
+    """Build event to json converter and add to config."""
+    state_to_point = _generate_state_to_point(conf)
+    tags = conf.get(CONF_TAGS)
+
+    def event_to_json(event: Event) -> dict[str, Any] | None:
+        """Convert event into json in format Influx expects."""
+        state = event.data.get(EVENT_NEW_STATE)
+        if (point := state_to_point(state)) is None:
+            return None
+
+        measurement, attribute_tags, fields = point
+        json = {
+            INFLUX_CONF_MEASUREMENT: measurement,
+            INFLUX_CONF_TAGS: {
+                CONF_DOMAIN: state.domain,
+                CONF_ENTITY_ID: state.object_id,
+                **attribute_tags,
+            },
+            INFLUX_CONF_TIME: event.time_fired,
+            INFLUX_CONF_FIELDS: fields,
+        }
         json[INFLUX_CONF_TAGS].update(tags)
 
         return json
@@ -318,6 +354,85 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
     return event_to_json
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_ESCAPE_KEY = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+_ESCAPE_STRING = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+def _line_field_value(value: float | str) -> str:
+    """Return a field value in line protocol."""
+    if isinstance(value, str):
+        return f'"{value.translate(_ESCAPE_STRING)}"'
+    return repr(value)
+
+
+def _line_timestamp(time_fired: datetime, precision: str | None) -> int:
+    """Return a timestamp in line protocol at the precision."""
+    delta = time_fired - _EPOCH
+    microseconds = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    if precision in (None, "ns"):
+        return microseconds * 1000
+    if precision == "us":
+        return microseconds
+    if precision == "ms":
+        return microseconds // 1000
+    return microseconds // 1000000
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
+    state_to_point = _generate_state_to_point(conf)
+    tags = conf.get(CONF_TAGS)
+    precision = conf.get(CONF_PRECISION)
+    # The measurement and tags of a point only change with the attributes,
+    # so the escaped line prefix is kept per entity
+    prefixes: dict[tuple, str] = {}
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line in the Influx line protocol."""
+        state = event.data.get(EVENT_NEW_STATE)
+        if (point := state_to_point(state)) is None:
+            return None
+
+        measurement, attribute_tags, fields = point
+        key = (
+            state.entity_id,
+            measurement,
+            *((tag, str(value)) for tag, value in attribute_tags.items()),
+        )
+        if (prefix := prefixes.get(key)) is None:
+            if len(prefixes) >= LINE_PREFIX_CACHE_SIZE:
+                prefixes.clear()
+            point_tags = {
+                CONF_DOMAIN: state.domain,
+                CONF_ENTITY_ID: state.object_id,
+                **attribute_tags,
+                **tags,
+            }
+            prefix = prefixes[key] = ",".join(
+                [
+                    str(measurement).translate(_ESCAPE_KEY),
+                    *(
+                        f"{tag.translate(_ESCAPE_KEY)}={value.translate(_ESCAPE_KEY)}"
+                        for tag, value in sorted(
+                            (tag, str(value)) for tag, value in point_tags.items()
+                        )
+                        if value
+                    ),
+                ]
+            )
+
+        line_fields = ",".join(
+            f"{field.translate(_ESCAPE_KEY)}={_line_field_value(value)}"
+            for field, value in fields.items()
+        )
+        return f"{prefix} {line_fields} {_line_timestamp(event.time_fired, precision)}"
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -337,6 +452,8 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
 
     if conf[CONF_API_VERSION] == API_VERSION_2:
         kwargs[CONF_TIMEOUT] = TIMEOUT * 1000
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         kwargs[CONF_URL] = conf[CONF_URL]
         kwargs[CONF_TOKEN] = conf[CONF_TOKEN]
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
@@ -346,8 +463,9 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are done in the writer thread and must block so their errors
+        # and duration drive the retries, spill file and batch size
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
         def write_v2(json):
             """Write data to V2 influx."""
@@ -386,7 +504,6 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -424,12 +541,19 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    if conf.get(CONF_GZIP):
+        kwargs[CONF_GZIP] = True
+
     influx = InfluxDBClient(**kwargs)
 
+    write_kwargs = {"time_precision": precision}
+    if conf.get(CONF_LINE_PROTOCOL):
+        write_kwargs["protocol"] = "line"
+
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, **write_kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -480,9 +604,25 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
         return True
 
-    event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    if conf[CONF_LINE_PROTOCOL]:
+        instance = InfluxThread(
+            hass,
+            influx,
+            _generate_event_to_line(conf),
+            max_tries,
+            conf[CONF_MAX_BATCH_SIZE],
+            hass.config.path(SPILL_FILENAME),
+        )
+    else:
+        instance = InfluxThread(
+            hass,
+            influx,
+            _generate_event_to_json(conf),
+            max_tries,
+            conf[CONF_MAX_BATCH_SIZE],
+        )
+    hass.data[DOMAIN] = instance
     instance.start()
 
     def shutdown(event):
@@ -499,7 +639,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        max_batch_size=BATCH_BUFFER_SIZE,
+        spill_path=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
@@ -508,6 +656,11 @@ class InfluxThread(threading.Thread):
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.max_batch_size = max_batch_size
+        self.min_batch_size = min(BATCH_BUFFER_SIZE, max_batch_size)
+        self.batch_size = self.min_batch_size
+        self.spill_path = spill_path
+        self.spilled = 0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -531,7 +684,7 @@ class InfluxThread(threading.Thread):
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(json) < self.batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -554,17 +707,28 @@ class InfluxThread(threading.Thread):
 
         return count, json
 
+    def _adapt_batch_size(self, batch_size, write_seconds):
+        """Grow batches while writes are fast and shrink them when they are slow."""
+        if write_seconds > BATCH_WRITE_TARGET_SECONDS:
+            self.batch_size = max(self.batch_size // 2, self.min_batch_size)
+        elif batch_size >= self.batch_size:
+            self.batch_size = min(self.batch_size * 2, self.max_batch_size)
+
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                self._adapt_batch_size(len(json), time.monotonic() - start)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
+                if self.spilled:
+                    self.write_spilled()
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -573,12 +737,72 @@ class InfluxThread(threading.Thread):
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
+                    if not self.write_errors and not self.spilled:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    if not self.spill(json):
+                        self.write_errors += len(json)
+
+    def spill(self, lines):
+        """Save lines which could not be written to the spill file."""
+        if self.spill_path is None:
+            return False
+
+        data = "".join(f"{line}\n" for line in lines)
+        try:
+            size = os.path.getsize(self.spill_path)
+        except FileNotFoundError:
+            size = 0
+        if size + len(data) > SPILL_MAX_BYTES:
+            return False
+
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+                spill_file.write(data)
+        except OSError as err:
+            _LOGGER.error("Could not save events to %s: %s", self.spill_path, err)
+            return False
+
+        if not self.spilled:
+            _LOGGER.warning(SPILLED_MESSAGE, len(lines))
+        self.spilled += len(lines)
+        return True
+
+    def write_spilled(self):
+        """Write the lines from the spill file, keeping those which fail."""
+        try:
+            with open(self.spill_path, encoding="utf-8") as spill_file:
+                lines = spill_file.read().splitlines()
+        except FileNotFoundError:
+            self.spilled = 0
+            return
+        except OSError as err:
+            _LOGGER.error("Could not read events from %s: %s", self.spill_path, err)
+            return
+
+        written = 0
+        while written < len(lines):
+            batch = lines[written : written + self.batch_size]
+            try:
+                self.influx.write(batch)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                break
+            written += len(batch)
+
+        remaining = lines[written:]
+        with suppress(OSError):
+            os.remove(self.spill_path)
+        self.spilled = 0
+        if written:
+            _LOGGER.info(WROTE_SPILLED_MESSAGE, written)
+        if remaining and not self.spill(remaining):
+            self.write_errors += len(remaining)
 
     def run(self):
         """Process incoming events."""
+        if self.spill_path is not None and os.path.exists(self.spill_path):
+            self.write_spilled()
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
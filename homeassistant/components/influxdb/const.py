@@ -32,6 +32,9 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_GZIP = "gzip"
+CONF_LINE_PROTOCOL = "line_protocol"
+CONF_MAX_BATCH_SIZE = "max_batch_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -78,6 +81,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_WRITE_TARGET_SECONDS = 0.5
+LINE_PREFIX_CACHE_SIZE = 10000
+SPILL_FILENAME = ".influxdb_spill"
+SPILL_MAX_BYTES = 50 * 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +127,8 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPILLED_MESSAGE = "Could not write to InfluxDB, saved %d events to write later."
+WROTE_SPILLED_MESSAGE = "Wrote %d events saved while InfluxDB was not reachable."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -143,6 +152,7 @@ COMPONENT_CONFIG_SCHEMA_CONNECTION = {
     vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): cv.boolean,
     vol.Optional(CONF_SSL_CA_CERT): cv.isfile,
     vol.Optional(CONF_PRECISION): vol.In(["ms", "s", "us", "ns"]),
+    vol.Optional(CONF_GZIP): cv.boolean,
     # Connection config for V1 API only.
     vol.Inclusive(CONF_USERNAME, "authentication"): cv.string,
     vol.Inclusive(CONF_PASSWORD, "authentication"): cv.string,
@@ -15,12 +15,18 @@ from pyprof2calltree import convert
 import voluptuous as vol
 
 from homeassistant.components import persistent_notification
+from homeassistant.components.http import async_get_request_stats
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_timer_wheel,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.setup import async_get_setup_timeline
+from homeassistant.util.json import save_json
 
 from .const import DOMAIN
 
@@ -31,7 +37,8 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
-
+SERVICE_DUMP_SETUP_TIMELINE = "dump_setup_timeline"
+SERVICE_DUMP_HTTP_REQUEST_STATS = "dump_http_request_stats"
 
 SERVICES = (
     SERVICE_START,
@@ -41,6 +48,8 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_DUMP_SETUP_TIMELINE,
+    SERVICE_DUMP_HTTP_REQUEST_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -127,10 +136,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             for handle in hass.loop._scheduled:  # pylint: disable=protected-access
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            for point_in_time, job in async_get_timer_wheel(
+                hass
+            ).async_pending_timers():
+                _LOGGER.critical("Scheduled timer at %s: %s", point_in_time, job)
         finally:
             arepr.max_string = original_maxstring
             arepr.max_other = original_maxother
 
+    async def _async_dump_setup_timeline(call: ServiceCall) -> None:
+        """Write the setup timeline as a Chrome trace."""
+        start_time = int(time.time() * 1000000)
+        trace = async_get_setup_timeline(hass).as_chrome_trace()
+        timeline_path = hass.config.path(f"setup_timeline.{start_time}.json")
+        await hass.async_add_executor_job(save_json, timeline_path, trace)
+        persistent_notification.async_create(
+            hass,
+            f"Wrote the setup timeline to {timeline_path}. Load it in chrome://tracing or https://ui.perfetto.dev to review it.",
+            title="Setup timeline written",
+            notification_id="profile_setup_timeline",
+        )
+
+    async def _async_dump_http_request_stats(call: ServiceCall) -> None:
+        """Write the http request statistics of each route."""
+        start_time = int(time.time() * 1000000)
+        stats_path = hass.config.path(f"http_request_stats.{start_time}.json")
+        await hass.async_add_executor_job(
+            save_json, stats_path, async_get_request_stats(hass)
+        )
+        persistent_notification.async_create(
+            hass,
+            f"Wrote the http request statistics to {stats_path}.",
+            title="HTTP request statistics written",
+            notification_id="profile_http_request_stats",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -194,6 +234,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_SETUP_TIMELINE,
+        _async_dump_setup_timeline,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_HTTP_REQUEST_STATS,
+        _async_dump_http_request_stats,
+    )
+
     return True
 
 
@@ -1,13 +1,16 @@
 """Support for Prometheus metrics export."""
+import asyncio
 from contextlib import suppress
+from functools import partial
+import gzip
 import logging
 import string
+import time
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -16,7 +19,8 @@ from homeassistant.components.climate.const import (
     ATTR_TARGET_TEMP_LOW,
     CURRENT_HVAC_ACTIONS,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.components.http.static import parse_accept_encoding
 from homeassistant.components.humidifier.const import (
     ATTR_AVAILABLE_MODES,
     ATTR_HUMIDITY,
@@ -57,11 +61,14 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
+CONF_CACHE_TTL = "cache_ttl"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
 
 DEFAULT_NAMESPACE = "homeassistant"
+DEFAULT_SCRAPE_CACHE_TTL = 5
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -80,6 +87,8 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
                     {cv.string: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
+                vol.Optional(CONF_CACHE_TTL): cv.positive_float,
             }
         )
     },
@@ -89,8 +98,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -103,7 +110,8 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    metrics = PrometheusMetrics(
+    metrics_factory = partial(
+        PrometheusMetrics,
         prometheus_client,
         entity_filter,
         namespace,
@@ -113,6 +121,22 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    if conf[CONF_COLLECT_ON_SCRAPE]:
+        collector = PrometheusCollector(prometheus_client, metrics_factory)
+        prometheus_client.REGISTRY.register(collector)
+        hass.http.register_view(
+            PrometheusView(
+                prometheus_client,
+                collector,
+                conf.get(CONF_CACHE_TTL, DEFAULT_SCRAPE_CACHE_TTL),
+            )
+        )
+        return True
+
+    hass.http.register_view(
+        PrometheusView(prometheus_client, cache_ttl=conf.get(CONF_CACHE_TTL, 0))
+    )
+    metrics = metrics_factory()
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
@@ -132,9 +156,13 @@ class PrometheusMetrics:
         component_config,
         override_metric,
         default_metric,
+        registry=None,
+        collect_on_scrape=False,
     ):
         """Initialize Prometheus Metrics."""
         self.prometheus_cli = prometheus_cli
+        self._registry = registry or prometheus_cli.REGISTRY
+        self._collect_on_scrape = collect_on_scrape
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -161,7 +189,6 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
         if not self._filter(state.entity_id):
             return
@@ -171,19 +198,29 @@ class PrometheusMetrics:
         ) != state.attributes.get(ATTR_FRIENDLY_NAME):
             self._remove_labelsets(old_state.entity_id, old_friendly_name)
 
+        self.handle_state(state)
+
+        state_change = self._metric(
+            "state_change", self.prometheus_cli.Counter, "The number of state changes"
+        )
+        state_change.labels(**self._labels(state)).inc()
+
+    def handle_states(self, states):
+        """Update the metrics of the states passing the filter."""
+        for state in states:
+            if self._filter(state.entity_id):
+                self.handle_state(state)
+
+    def handle_state(self, state):
+        """Update the metrics of a state."""
         ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
 
-        handler = f"_handle_{domain}"
+        handler = f"_handle_{state.domain}"
 
         if hasattr(self, handler) and state.state not in ignored_states:
             getattr(self, handler)(state)
 
         labels = self._labels(state)
-        state_change = self._metric(
-            "state_change", self.prometheus_cli.Counter, "The number of state changes"
-        )
-        state_change.labels(**labels).inc()
-
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
@@ -267,7 +304,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=self.prometheus_cli.REGISTRY,
+                registry=self._registry,
             )
             return self._metrics[metric]
 
@@ -583,6 +620,10 @@ class PrometheusMetrics:
         self._battery(state)
 
     def _handle_automation(self, state):
+        if self._collect_on_scrape:
+            # Triggers can only be counted from state changed events
+            return
+
         metric = self._metric(
             "automation_triggered_count",
             self.prometheus_cli.Counter,
@@ -601,21 +642,80 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(self.state_as_number(state))
 
 
+class PrometheusCollector:
+    """Collect the metrics of all states when Prometheus scrapes them."""
+
+    def __init__(self, prometheus_cli, metrics_factory):
+        """Initialize Prometheus collector."""
+        self.prometheus_cli = prometheus_cli
+        self._metrics_factory = metrics_factory
+        self.states = []
+
+    def describe(self):
+        """Return the metrics known before collecting, none."""
+        return []
+
+    def collect(self):
+        """Collect the metrics of the states, runs in the executor."""
+        registry = self.prometheus_cli.CollectorRegistry(auto_describe=False)
+        metrics = self._metrics_factory(registry=registry, collect_on_scrape=True)
+        metrics.handle_states(self.states)
+        return registry.collect()
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, collector=None, cache_ttl=0):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self._collector = collector
+        self._cache_ttl = cache_ttl
+        # Created on the first request as the view is set up outside the loop
+        self._lock: asyncio.Lock | None = None
+        self._expires = 0.0
+        self._body = b""
+        self._gzip_body = None
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app[KEY_HASS]
+        qualities = parse_accept_encoding(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        use_gzip = qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if time.monotonic() >= self._expires:
+                if self._collector is not None:
+                    self._collector.states = hass.states.async_all()
+                self._body = await hass.async_add_executor_job(
+                    self.prometheus_cli.generate_latest, self.prometheus_cli.REGISTRY
+                )
+                self._gzip_body = None
+                if self._collector is not None:
+                    self._collector.states = []
+                self._expires = time.monotonic() + self._cache_ttl
+
+            if not use_gzip:
+                body = self._body
+            else:
+                if self._gzip_body is None:
+                    self._gzip_body = await hass.async_add_executor_job(
+                        gzip.compress, self._body
+                    )
+                body = self._gzip_body
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+        response = web.Response(
+            body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            headers={hdrs.VARY: hdrs.ACCEPT_ENCODING},
         )
+        if use_gzip:
+            response.headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return response
@@ -29,7 +29,6 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, ServiceCall, callback
@@ -466,6 +465,15 @@ class StopTask(RecorderTask):
         instance.stop_requested = True
 
 
+@dataclass
+class TimeTickTask(RecorderTask):
+    """An object to insert into the recorder queue every time the timer ticks."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._process_time_tick()  # pylint: disable=[protected-access]
+
+
 @dataclass
 class EventTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -525,6 +533,7 @@ class Recorder(threading.Thread):
         self.get_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
+        self._time_tick_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
@@ -543,6 +552,9 @@ class Recorder(threading.Thread):
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
         )
+        self._time_tick_listener = self.hass.bus.async_listen_time_tick(
+            self._async_time_tick
+        )
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
@@ -572,6 +584,9 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._time_tick_listener:
+            self._time_tick_listener()
+            self._time_tick_listener = None
 
     @callback
     def _async_event_filter(self, event) -> bool:
@@ -888,19 +903,19 @@ class Recorder(threading.Thread):
             self.queue.qsize(),
         )
 
-    def _process_one_event(self, event):
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
-            return
+    def _process_time_tick(self):
+        """Keep the connection alive and commit when the interval passed."""
+        self._keepalive_count += 1
+        if self._keepalive_count >= KEEPALIVE_TIME:
+            self._keepalive_count = 0
+            self._send_keep_alive()
+        if self.commit_interval:
+            self._timechanges_seen += 1
+            if self._timechanges_seen >= self.commit_interval:
+                self._timechanges_seen = 0
+                self._commit_event_session_or_retry()
 
+    def _process_one_event(self, event):
         if not self.enabled:
             return
 
@@ -1034,6 +1049,11 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Sending keepalive")
         self.event_session.connection().scalar(select([1]))
 
+    @callback
+    def _async_time_tick(self, now):
+        """Put a time tick in the process queue."""
+        self.queue.put(TimeTickTask())
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
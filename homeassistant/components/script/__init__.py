@@ -9,6 +9,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.components.blueprint import BlueprintInputs
+from homeassistant.components.trace import async_clear_trace_run_count
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -430,3 +431,4 @@ class ScriptEntity(ToggleEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.object_id)
+        async_clear_trace_run_count(self.hass, (DOMAIN, self.object_id))
@@ -5,9 +5,14 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_get_trace_level,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import TraceLevel, trace_level_reset, trace_level_set
 
 from .const import DOMAIN
 
@@ -29,7 +34,10 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    level = async_get_trace_level(hass, (DOMAIN, item_id), trace_config)
+    if level != TraceLevel.OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_level_set(level)
 
     try:
         yield trace
@@ -38,5 +46,6 @@ def trace_script(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_level_reset(token)
         if item_id:
             trace.finished()
@@ -17,6 +17,7 @@ from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.trace import (
     TraceElement,
+    TraceLevel,
     script_execution_get,
     trace_id_get,
     trace_id_set,
@@ -28,8 +29,11 @@ import homeassistant.util.uuid as uuid_util
 
 from . import websocket_api
 from .const import (
+    CONF_LEVEL,
+    CONF_SAMPLE_EVERY,
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_RUN_COUNTS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
     DEFAULT_STORED_TRACES,
@@ -44,7 +48,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_LEVEL, default=TraceLevel.FULL): vol.Coerce(TraceLevel),
+    vol.Optional(CONF_SAMPLE_EVERY, default=1): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 
@@ -131,6 +139,27 @@ async def async_list_traces(hass, wanted_domain, wanted_key):
     return traces
 
 
+def async_get_trace_level(hass, key, trace_config):
+    """Return the trace level of the next run of a script or automation.
+
+    When sampling, only one out of every sample_every runs is traced.
+    """
+    level = trace_config.get(CONF_LEVEL, TraceLevel.FULL)
+    sample_every = trace_config.get(CONF_SAMPLE_EVERY, 1)
+    if level == TraceLevel.OFF or sample_every == 1:
+        return level
+
+    run_counts = hass.data.setdefault(DATA_TRACE_RUN_COUNTS, {})
+    run_count = run_counts.get(key, 0)
+    run_counts[key] = (run_count + 1) % sample_every
+    return level if run_count == 0 else TraceLevel.OFF
+
+
+def async_clear_trace_run_count(hass, key):
+    """Forget the sampling run count of a removed script or automation."""
+    hass.data.get(DATA_TRACE_RUN_COUNTS, {}).pop(key, None)
+
+
 def async_store_trace(hass, trace, stored_traces):
     """Store a trace if its key is valid."""
     if key := trace.key:
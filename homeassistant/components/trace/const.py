@@ -1,7 +1,10 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_LEVEL = "level"
+CONF_SAMPLE_EVERY = "sample_every"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_RUN_COUNTS = "trace_run_counts"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import functools as ft
 import hashlib
 from http import HTTPStatus
@@ -17,6 +18,7 @@ import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_ID,
@@ -60,7 +62,9 @@ BASE_URL_KEY = "tts_base_url"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_DIR_SIZE = "cache_dir_size"
 CONF_LANG = "language"
+CONF_MEMORY_CACHE_SIZE = "memory_cache_size"
 CONF_SERVICE_NAME = "service_name"
 CONF_TIME_MEMORY = "time_memory"
 
@@ -68,12 +72,16 @@ CONF_FIELDS = "fields"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_DIR_SIZE = 1024
+DEFAULT_MEMORY_CACHE_SIZE = 32
 DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
 MEM_CACHE_FILENAME = "filename"
 MEM_CACHE_VOICE = "voice"
 
+MIB = 1024 * 1024
+
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_SAY = "say"
 
@@ -99,6 +107,12 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(
+            CONF_MEMORY_CACHE_SIZE, default=DEFAULT_MEMORY_CACHE_SIZE
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_CACHE_DIR_SIZE, default=DEFAULT_CACHE_DIR_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_BASE_URL): cv.string,
         vol.Optional(CONF_SERVICE_NAME): cv.string,
     }
@@ -127,16 +141,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         use_cache = conf.get(CONF_CACHE, DEFAULT_CACHE)
         cache_dir = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+        memory_cache_size = conf.get(CONF_MEMORY_CACHE_SIZE, DEFAULT_MEMORY_CACHE_SIZE)
+        cache_dir_size = conf.get(CONF_CACHE_DIR_SIZE, DEFAULT_CACHE_DIR_SIZE)
         base_url = conf.get(CONF_BASE_URL)
         hass.data[BASE_URL_KEY] = base_url
 
-        await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
+        await tts.async_init_cache(
+            use_cache,
+            cache_dir,
+            time_memory,
+            base_url,
+            memory_cache_size * MIB,
+            cache_dir_size * MIB,
+        )
     except (HomeAssistantError, KeyError):
         _LOGGER.exception("Error on cache init")
         return False
 
     hass.http.register_view(TextToSpeechView(tts))
     hass.http.register_view(TextToSpeechUrlView(tts))
+    hass.data[DOMAIN] = tts
+    websocket_api.async_register_command(hass, websocket_cache_info)
 
     # Load service descriptions from tts/services.yaml
     integration = await async_get_integration(hass, DOMAIN)
@@ -252,6 +277,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "tts/cache_info"})
+@callback
+def websocket_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return memory and file cache statistics."""
+    tts: SpeechManager = hass.data[DOMAIN]
+    connection.send_result(msg["id"], tts.async_get_cache_info())
+
+
 def _hash_options(options: dict) -> str:
     """Hashes an options dictionary."""
     opts_hash = hashlib.blake2s(digest_size=5)
@@ -273,17 +309,44 @@ class SpeechManager:
         self.use_cache = DEFAULT_CACHE
         self.cache_dir = DEFAULT_CACHE_DIR
         self.time_memory = DEFAULT_TIME_MEMORY
+        self.memory_cache_size = DEFAULT_MEMORY_CACHE_SIZE * MIB
+        self.cache_dir_size = DEFAULT_CACHE_DIR_SIZE * MIB
         self.base_url: str | None = None
-        self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, dict[str, str | bytes]] = {}
+
+        # Both caches are kept in least recently used order
+        self.file_cache: OrderedDict[str, str] = OrderedDict()
+        self.file_cache_sizes: dict[str, int] = {}
+        self.mem_cache: OrderedDict[str, dict[str, str | bytes]] = OrderedDict()
+        self._mem_cache_bytes = 0
+        self._file_cache_bytes = 0
+        self._mem_cache_timers: dict[str, asyncio.TimerHandle] = {}
+
+        self._pending_audio: dict[tuple[str, bool], asyncio.Task[str]] = {}
+        self._pending_loads: dict[str, asyncio.Task[None]] = {}
+        self._stats = {
+            "memory_hits": 0,
+            "file_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "memory_evictions": 0,
+            "file_evictions": 0,
+        }
 
     async def async_init_cache(
-        self, use_cache: bool, cache_dir: str, time_memory: int, base_url: str | None
+        self,
+        use_cache: bool,
+        cache_dir: str,
+        time_memory: int,
+        base_url: str | None,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE * MIB,
+        cache_dir_size: int = DEFAULT_CACHE_DIR_SIZE * MIB,
     ) -> None:
         """Init config folder and load file cache."""
         self.use_cache = use_cache
         self.time_memory = time_memory
         self.base_url = base_url
+        self.memory_cache_size = memory_cache_size
+        self.cache_dir_size = cache_dir_size
 
         try:
             self.cache_dir = await self.hass.async_add_executor_job(
@@ -292,30 +355,63 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        def load_cache_files() -> tuple[dict[str, str], dict[str, int]]:
+            """Read the cache files and their sizes from filesystem."""
+            cache_files = _get_cache_files(self.cache_dir)
+            sizes = {
+                key: os.path.getsize(os.path.join(self.cache_dir, filename))
+                for key, filename in cache_files.items()
+            }
+            return cache_files, sizes
+
         try:
-            cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
+            cache_files, sizes = await self.hass.async_add_executor_job(
+                load_cache_files
             )
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
-        if cache_files:
-            self.file_cache.update(cache_files)
+        for key, filename in cache_files.items():
+            self._async_add_to_file_cache(key, filename, sizes[key])
+
+        await self._async_enforce_file_quota()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
-
-        def remove_files():
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+        for timer in self._mem_cache_timers.values():
+            timer.cancel()
+        self._mem_cache_timers = {}
+        self.mem_cache = OrderedDict()
+        self._mem_cache_bytes = 0
+
+        filenames = list(self.file_cache.values())
+        self.file_cache = OrderedDict()
+        self.file_cache_sizes = {}
+        self._file_cache_bytes = 0
+
+        await self.hass.async_add_executor_job(self._remove_files, filenames)
+
+    def _remove_files(self, filenames: list[str]) -> None:
+        """Remove files from filesystem."""
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError as err:
+                _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
-        await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+    @callback
+    def async_get_cache_info(self) -> dict[str, int]:
+        """Return statistics of the memory and file cache."""
+        return {
+            **self._stats,
+            "memory_entries": len(self.mem_cache),
+            "memory_bytes": self._mem_cache_bytes,
+            "memory_max_bytes": self.memory_cache_size,
+            "file_entries": len(self.file_cache),
+            "file_bytes": self._file_cache_bytes,
+            "file_max_bytes": self.cache_dir_size,
+            "pending": len(self._pending_audio),
+        }
 
     @callback
     def async_register_engine(
@@ -377,16 +473,32 @@ class SpeechManager:
 
         # Is speech already in memory
         if key in self.mem_cache:
+            self._stats["memory_hits"] += 1
+            self.mem_cache.move_to_end(key)
             filename = cast(str, self.mem_cache[key][MEM_CACHE_FILENAME])
         # Is file store in file cache
         elif use_cache and key in self.file_cache:
+            self._stats["file_hits"] += 1
             filename = self.file_cache[key]
-            self.hass.async_create_task(self.async_file_to_mem(key))
-        # Load speech from provider into memory
+            self._async_load_file(key)
+        # Load speech from provider into memory, sharing a single request
+        # between all callers asking for the same speech at the same time
         else:
-            filename = await self.async_get_tts_audio(
-                engine, key, message, use_cache, language, options
-            )
+            pending_key = (key, use_cache)
+            if (task := self._pending_audio.get(pending_key)) is None:
+                self._stats["misses"] += 1
+                task = self.hass.async_create_task(
+                    self.async_get_tts_audio(
+                        engine, key, message, use_cache, language, options
+                    )
+                )
+                self._pending_audio[pending_key] = task
+                task.add_done_callback(
+                    lambda _: self._pending_audio.pop(pending_key, None)
+                )
+            else:
+                self._stats["coalesced"] += 1
+            filename = await asyncio.shield(task)
 
         return f"/api/tts_proxy/{filename}"
 
@@ -441,9 +553,50 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self._async_add_to_file_cache(key, filename, len(data))
+        await self._async_enforce_file_quota()
+
+    @callback
+    def _async_add_to_file_cache(self, key: str, filename: str, size: int) -> None:
+        """Add a file as most recently used entry of the file cache."""
+        self._file_cache_bytes += size - self.file_cache_sizes.get(key, 0)
+        self.file_cache[key] = filename
+        self.file_cache.move_to_end(key)
+        self.file_cache_sizes[key] = size
+
+    @callback
+    def _async_remove_from_file_cache(self, key: str) -> str | None:
+        """Remove a file from the file cache and return its filename."""
+        self._file_cache_bytes -= self.file_cache_sizes.pop(key, 0)
+        return self.file_cache.pop(key, None)
+
+    async def _async_enforce_file_quota(self) -> None:
+        """Remove the least recently used files until the quota is met."""
+        evicted = []
+        while self._file_cache_bytes > self.cache_dir_size and len(self.file_cache) > 1:
+            key = next(iter(self.file_cache))
+            if (filename := self._async_remove_from_file_cache(key)) is not None:
+                evicted.append(filename)
+
+        if not evicted:
+            return
+
+        self._stats["file_evictions"] += len(evicted)
+        _LOGGER.debug("Removing %d files to stay within cache quota", len(evicted))
+        await self.hass.async_add_executor_job(self._remove_files, evicted)
+
+    @callback
+    def _async_load_file(self, key: str) -> asyncio.Task[None]:
+        """Load a voice from the file cache into memory, once per key."""
+        if (task := self._pending_loads.get(key)) is None:
+            task = self.hass.async_create_task(self.async_file_to_mem(key))
+            self._pending_loads[key] = task
+            task.add_done_callback(lambda _: self._pending_loads.pop(key, None))
+        return task
 
     async def async_file_to_mem(self, key: str) -> None:
         """Load voice from file cache into memory.
@@ -453,17 +606,22 @@ class SpeechManager:
         if not (filename := self.file_cache.get(key)):
             raise HomeAssistantError(f"Key {key} not in file cache!")
 
+        self.file_cache.move_to_end(key)
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
-            """Load a speech from filesystem."""
+            """Load a speech from filesystem and mark it as recently used."""
             with open(voice_file, "rb") as speech:
-                return speech.read()
+                data = speech.read()
+            # Access times are unreliable on noatime mounts, so the
+            # modification time is what orders the cache on startup
+            os.utime(voice_file)
+            return data
 
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[key]
+            self._async_remove_from_file_cache(key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(key, filename, data)
@@ -471,14 +629,28 @@ class SpeechManager:
     @callback
     def _async_store_to_memcache(self, key: str, filename: str, data: bytes) -> None:
         """Store data to memcache and set timer to remove it."""
+        self._async_remove_from_memcache(key)
         self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        self._mem_cache_bytes += len(data)
+
+        # Keep the newest entry even when it exceeds the budget on its own
+        while (
+            self._mem_cache_bytes > self.memory_cache_size and len(self.mem_cache) > 1
+        ):
+            self._async_remove_from_memcache(next(iter(self.mem_cache)))
+            self._stats["memory_evictions"] += 1
 
-        @callback
-        def async_remove_from_mem() -> None:
-            """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
+        self._mem_cache_timers[key] = self.hass.loop.call_later(
+            self.time_memory, self._async_remove_from_memcache, key
+        )
 
-        self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
+    @callback
+    def _async_remove_from_memcache(self, key: str) -> None:
+        """Cleanup memcache."""
+        if timer := self._mem_cache_timers.pop(key, None):
+            timer.cancel()
+        if entry := self.mem_cache.pop(key, None):
+            self._mem_cache_bytes -= len(entry[MEM_CACHE_VOICE])
 
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
@@ -492,10 +664,12 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if key not in self.mem_cache:
+        if key in self.mem_cache:
+            self.mem_cache.move_to_end(key)
+        else:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
-            await self.async_file_to_mem(key)
+            await self._async_load_file(key)
 
         content, _ = mimetypes.guess_type(filename)
         return content, cast(bytes, self.mem_cache[key][MEM_CACHE_VOICE])
@@ -601,11 +775,12 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
 
 
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
-    """Return a dict of given engine files."""
+    """Return a dict of given engine files, least recently used first."""
     cache = {}
 
-    folder_data = os.listdir(cache_dir)
-    for file_data in folder_data:
+    folder_data = sorted(os.scandir(cache_dir), key=lambda entry: entry.stat().st_mtime)
+    for entry in folder_data:
+        file_data = entry.name
         if record := _RE_VOICE_FILE.match(file_data):
             key = KEY_PATTERN.format(
                 record.group(1), record.group(2), record.group(3), record.group(4)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import partial
 import json
 from typing import Any
 
@@ -15,7 +16,7 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -27,10 +28,14 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_event,
     async_track_template_result,
 )
-from homeassistant.helpers.json import ExtendedJSONEncoder
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.json import ExtendedJSONEncoder, states_to_json
+from homeassistant.helpers.service import (
+    async_extract_referenced_entity_ids,
+    async_get_all_descriptions,
+)
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
@@ -52,12 +57,14 @@ def async_register_commands(
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_http_request_stats)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -118,6 +125,76 @@ def handle_subscribe_events(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("target"): cv.ENTITY_SERVICE_FIELDS,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the states of the entities, then compact diffs of their changes.
+    Without entity_ids or a target all entities are subscribed to.
+    """
+    entity_ids: set[str] | None = None
+    if "entity_ids" in msg or "target" in msg:
+        entity_ids = set(msg.get("entity_ids", []))
+        if "target" in msg:
+            selected = async_extract_referenced_entity_ids(
+                hass, ServiceCall(const.DOMAIN, "subscribe_entities", msg["target"])
+            )
+            entity_ids |= selected.referenced | selected.indirectly_referenced
+
+    if connection.user.permissions.access_all_entities("read"):
+        entity_perm = None
+    else:
+        entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changes to websocket."""
+        if entity_perm is not None and not entity_perm(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    if entity_ids is None:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forward_entity_changes
+        )
+        states = hass.states.async_all()
+    else:
+        connection.subscriptions[msg["id"]] = async_track_state_change_event(
+            hass, entity_ids, forward_entity_changes
+        )
+        states = [
+            state
+            for entity_id in sorted(entity_ids)
+            if (state := hass.states.get(entity_id)) is not None
+        ]
+
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state)
+                    for state in states
+                    if entity_perm is None or entity_perm(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -235,6 +312,7 @@ def handle_get_states(
     """Handle get states command."""
     if connection.user.permissions.access_all_entities("read"):
         states = hass.states.async_all()
+        serialize = hass.states.async_all_json
     else:
         entity_perm = connection.user.permissions.check_entity
         states = [
@@ -242,8 +320,18 @@ def handle_get_states(
             for state in hass.states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
+        serialize = partial(states_to_json, states)
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        serialized_states = serialize()
+    except (ValueError, TypeError):
+        # Let the regular serializer report which states can't be serialized
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], serialized_states)
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -535,6 +623,31 @@ async def handle_execute_script(
     connection.send_message(messages.result_message(msg["id"], {"context": context}))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "http/request_stats",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@decorators.require_admin
+def handle_http_request_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle http request statistics command."""
+    # Circular dep
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.http import (
+        async_get_request_stats,
+        async_reset_request_stats,
+    )
+
+    stats = async_get_request_stats(hass)
+    if msg["reset"]:
+        async_reset_request_stats(hass)
+    connection.send_result(msg["id"], stats)
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "fire_event",
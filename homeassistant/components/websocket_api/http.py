@@ -13,7 +13,7 @@ import async_timeout
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback, executor_job_timer_cv
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
@@ -43,6 +43,9 @@ class WebsocketAPIView(HomeAssistantView):
     async def get(self, request: web.Request) -> web.WebSocketResponse:
         """Handle an incoming websocket connection."""
         # pylint: disable=no-self-use
+        # The connection stays open, so the executor jobs of its commands are
+        # not accounted to the request
+        executor_job_timer_cv.set(None)
         return await WebSocketHandler(request.app["hass"], request).async_handle()
 
 
@@ -10,6 +10,7 @@ import logging
 import os
 import time
 import traceback
+from typing import Any
 
 from serial import SerialException
 from zigpy.config import CONF_DEVICE
@@ -85,6 +86,12 @@ from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
 
 _LOGGER = logging.getLogger(__name__)
 
+REFRESH_CONCURRENCY_INITIAL = 2
+REFRESH_CONCURRENCY_MAX = 6
+REFRESH_CONCURRENCY_MIN = 1
+REFRESH_FAST_SECONDS = 2
+REFRESH_SLOW_SECONDS = 10
+
 EntityReference = collections.namedtuple(
     "EntityReference",
     "reference_id zha_device cluster_channels device_info remove_future",
@@ -124,6 +131,9 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self.config_entry = config_entry
         self._unsubs = []
+        self.refresh_concurrency = REFRESH_CONCURRENCY_INITIAL
+        self.refresh_timings: dict[str, dict[str, Any]] = {}
+        self._refresh_task: asyncio.Task | None = None
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -208,30 +218,78 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
+        """Initialize devices from cache and schedule a live refresh."""
+        _LOGGER.debug("Loading devices from cache")
+        await asyncio.gather(
+            *(dev.async_initialize(from_cache=True) for dev in self.devices.values())
+        )
 
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        # Not tracked by hass so polling the radio doesn't hold up startup,
+        # the task is cancelled on shutdown instead
+        self._refresh_task = self._hass.loop.create_task(
+            self.async_refresh_mains_powered_devices()
+        )
 
-        _LOGGER.debug("Loading battery powered devices")
-        await asyncio.gather(
-            *(
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
+    async def async_refresh_mains_powered_devices(self) -> None:
+        """Refresh mains powered devices from the network in the background.
+
+        Devices seen most recently are refreshed first since they are the most
+        likely to answer. Concurrency grows while the radio answers quickly and
+        backs off when refreshes get slow or fail.
+        """
+        pending = collections.deque(
+            sorted(
+                (dev for dev in self.devices.values() if dev.is_mains_powered),
+                key=lambda dev: (not dev.available, -(dev.last_seen or 0)),
             )
         )
+        _LOGGER.debug("Refreshing %s mains powered devices", len(pending))
+        running: set[asyncio.Task] = set()
+        try:
+            while pending or running:
+                while pending and len(running) < self.refresh_concurrency:
+                    running.add(
+                        asyncio.create_task(
+                            self._async_refresh_device(pending.popleft())
+                        )
+                    )
+                _, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in running:
+                task.cancel()
+        _LOGGER.debug("Refreshed mains powered devices")
+
+    async def _async_refresh_device(self, zha_device: zha_typing.ZhaDeviceType) -> None:
+        """Refresh a single device and adapt the refresh concurrency."""
+        start = time.monotonic()
+        success = True
+        try:
+            await zha_device.async_initialize(from_cache=False)
+        except Exception:  # pylint: disable=broad-except
+            success = False
+            _LOGGER.warning(
+                "[%s](%s) failed to refresh", zha_device.nwk, zha_device.name
+            )
+        duration = time.monotonic() - start
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *(
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
+        if not success or duration > REFRESH_SLOW_SECONDS:
+            self.refresh_concurrency = max(
+                REFRESH_CONCURRENCY_MIN, self.refresh_concurrency // 2
             )
-        )
+        elif duration < REFRESH_FAST_SECONDS:
+            self.refresh_concurrency = min(
+                REFRESH_CONCURRENCY_MAX, self.refresh_concurrency + 1
+            )
+
+        self.refresh_timings[str(zha_device.ieee)] = {
+            "name": zha_device.name,
+            "completed": time.time(),
+            "duration": round(duration, 3),
+            "success": success,
+            "concurrency": self.refresh_concurrency,
+        }
 
     def device_joined(self, device):
         """Handle device joined.
@@ -664,6 +722,8 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
         await self.application_controller.pre_shutdown()
 
     def handle_message(
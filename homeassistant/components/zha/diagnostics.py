@@ -0,0 +1,34 @@
+"""Diagnostics support for ZHA."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_UNIQUE_ID
+from homeassistant.core import HomeAssistant
+
+from .core.const import (
+    CONF_ALARM_MASTER_CODE,
+    CONF_DEVICE_PATH,
+    DATA_ZHA,
+    DATA_ZHA_GATEWAY,
+)
+from .core.gateway import ZHAGateway
+
+REDACT_CONFIG_ENTRY = {CONF_ALARM_MASTER_CODE, CONF_DEVICE_PATH, CONF_UNIQUE_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    gateway: ZHAGateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+
+    return {
+        "config_entry": async_redact_data(config_entry.as_dict(), REDACT_CONFIG_ENTRY),
+        "device_refresh": {
+            "concurrency": gateway.refresh_concurrency,
+            "devices": gateway.refresh_timings,
+        },
+    }
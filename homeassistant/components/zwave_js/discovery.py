@@ -781,74 +781,195 @@ def async_discover_node_values(
         yield from async_discover_single_value(value, device, discovered_value_ids)
 
 
+@dataclass
+class _CommandClassSchemas:
+    """Discovery schemas of a command class, in discovery order."""
+
+    # schemas for the values of a property
+    by_property: dict[str | int, list[tuple[int, ZWaveDiscoverySchema]]]
+    # schemas for the values of the other properties
+    other: list[tuple[int, ZWaveDiscoverySchema]]
+
+
+def _index_command_class_schemas(
+    schemas: list[tuple[int, ZWaveDiscoverySchema]]
+) -> _CommandClassSchemas:
+    """Index the schemas of a command class by property."""
+    properties: set[str | int] = set()
+    for _, schema in schemas:
+        properties.update(schema.primary_value.property or ())
+    return _CommandClassSchemas(
+        {
+            property_: [
+                (position, schema)
+                for position, schema in schemas
+                if schema.primary_value.property is None
+                or property_ in schema.primary_value.property
+            ]
+            for property_ in properties
+        },
+        [
+            (position, schema)
+            for position, schema in schemas
+            if schema.primary_value.property is None
+        ],
+    )
+
+
+def _index_discovery_schemas(
+    schemas: list[ZWaveDiscoverySchema],
+) -> tuple[dict[int, _CommandClassSchemas], _CommandClassSchemas]:
+    """Index the schemas by command class and property of their primary value.
+
+    Returns the index and the schemas for other command classes.
+    """
+    positioned = list(enumerate(schemas))
+    command_classes: set[int] = set()
+    for schema in schemas:
+        command_classes.update(schema.primary_value.command_class or ())
+    return (
+        {
+            command_class: _index_command_class_schemas(
+                [
+                    (position, schema)
+                    for position, schema in positioned
+                    if schema.primary_value.command_class is None
+                    or command_class in schema.primary_value.command_class
+                ]
+            )
+            for command_class in command_classes
+        },
+        _index_command_class_schemas(
+            [
+                (position, schema)
+                for position, schema in positioned
+                if schema.primary_value.command_class is None
+            ]
+        ),
+    )
+
+
+DISCOVERY_SCHEMA_INDEX, OTHER_COMMAND_CLASS_SCHEMAS = _index_discovery_schemas(
+    DISCOVERY_SCHEMAS
+)
+
+# Positions of the schemas matching the node checks, per node model and firmware
+_NODE_SCHEMA_POSITIONS: dict[tuple, frozenset[int]] = {}
+_NODE_SCHEMA_POSITIONS_MAX = 1000
+
+
 @callback
-def async_discover_single_value(
-    value: ZwaveValue, device: DeviceEntry, discovered_value_ids: dict[str, set[str]]
-) -> Generator[ZwaveDiscoveryInfo, None, None]:
-    """Run discovery on a single ZWave value and return matching schema info."""
-    discovered_value_ids[device.id].add(value.value_id)
-    for schema in DISCOVERY_SCHEMAS:
+def async_get_value_schemas(
+    value: ZwaveValue,
+) -> list[tuple[int, ZWaveDiscoverySchema]]:
+    """Return the positions and schemas which may match a value, in order."""
+    command_class_schemas = DISCOVERY_SCHEMA_INDEX.get(
+        value.command_class, OTHER_COMMAND_CLASS_SCHEMAS
+    )
+    return command_class_schemas.by_property.get(
+        value.property_, command_class_schemas.other
+    )
+
+
+@callback
+def async_get_node_schema_positions(node: ZwaveNode) -> frozenset[int]:
+    """Return the positions of the schemas matching the node checks."""
+    device_class = node.device_class
+    key = (
+        node.manufacturer_id,
+        node.product_id,
+        node.product_type,
+        node.firmware_version,
+        device_class.basic.key,
+        device_class.basic.label,
+        device_class.generic.key,
+        device_class.generic.label,
+        device_class.specific.key,
+        device_class.specific.label,
+    )
+    if (positions := _NODE_SCHEMA_POSITIONS.get(key)) is None:
+        if len(_NODE_SCHEMA_POSITIONS) >= _NODE_SCHEMA_POSITIONS_MAX:
+            _NODE_SCHEMA_POSITIONS.clear()
+        positions = _NODE_SCHEMA_POSITIONS[key] = frozenset(
+            _async_check_node_schemas(node)
+        )
+    return positions
+
+
+def _async_check_node_schemas(node: ZwaveNode) -> Generator[int, None, None]:
+    """Yield the positions of the schemas matching the node checks."""
+    firmware_version: AwesomeVersion | None = None
+
+    for position, schema in enumerate(DISCOVERY_SCHEMAS):
         # check manufacturer_id
         if (
             schema.manufacturer_id is not None
-            and value.node.manufacturer_id not in schema.manufacturer_id
+            and node.manufacturer_id not in schema.manufacturer_id
         ):
             continue
 
         # check product_id
-        if (
-            schema.product_id is not None
-            and value.node.product_id not in schema.product_id
-        ):
+        if schema.product_id is not None and node.product_id not in schema.product_id:
             continue
 
         # check product_type
         if (
             schema.product_type is not None
-            and value.node.product_type not in schema.product_type
+            and node.product_type not in schema.product_type
         ):
             continue
 
         # check firmware_version_range
-        if schema.firmware_version_range is not None and (
-            (
+        if schema.firmware_version_range is not None:
+            if firmware_version is None:
+                firmware_version = AwesomeVersion(node.firmware_version)
+            if (
                 schema.firmware_version_range.min is not None
-                and schema.firmware_version_range.min_ver
-                > AwesomeVersion(value.node.firmware_version)
-            )
-            or (
+                and schema.firmware_version_range.min_ver > firmware_version
+            ) or (
                 schema.firmware_version_range.max is not None
-                and schema.firmware_version_range.max_ver
-                < AwesomeVersion(value.node.firmware_version)
-            )
-        ):
-            continue
+                and schema.firmware_version_range.max_ver < firmware_version
+            ):
+                continue
 
         # check firmware_version
         if (
             schema.firmware_version is not None
-            and value.node.firmware_version not in schema.firmware_version
+            and node.firmware_version not in schema.firmware_version
         ):
             continue
 
         # check device_class_basic
-        if not check_device_class(
-            value.node.device_class.basic, schema.device_class_basic
-        ):
+        if not check_device_class(node.device_class.basic, schema.device_class_basic):
             continue
 
         # check device_class_generic
         if not check_device_class(
-            value.node.device_class.generic, schema.device_class_generic
+            node.device_class.generic, schema.device_class_generic
         ):
             continue
 
         # check device_class_specific
         if not check_device_class(
-            value.node.device_class.specific, schema.device_class_specific
+            node.device_class.specific, schema.device_class_specific
         ):
             continue
 
+        yield position
+
+
+@callback
+def async_discover_single_value(
+    value: ZwaveValue, device: DeviceEntry, discovered_value_ids: dict[str, set[str]]
+) -> Generator[ZwaveDiscoveryInfo, None, None]:
+    """Run discovery on a single ZWave value and return matching schema info."""
+    discovered_value_ids[device.id].add(value.value_id)
+    node_schema_positions = async_get_node_schema_positions(value.node)
+    for position, schema in async_get_value_schemas(value):
+        # check manufacturer, product, firmware and device classes
+        if position not in node_schema_positions:
+            continue
+
         # check primary value
         if not check_value(value, schema.primary_value):
             continue
@@ -22,7 +22,12 @@ from .helpers import device_registry, entity_registry
 from .helpers.event import async_call_later
 from .helpers.frame import report
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
-from .setup import async_process_deps_reqs, async_setup_component
+from .setup import (
+    SetupPhase,
+    async_process_deps_reqs,
+    async_setup_component,
+    async_setup_timeline_span,
+)
 from .util import uuid as uuid_util
 from .util.decorator import Registry
 
@@ -288,7 +293,7 @@ class ConfigEntry:
         self.supports_unload = await support_entry_unload(hass, self.domain)
 
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as err:
             _LOGGER.error(
                 "Error importing integration %s to set up %s configuration entry: %s",
@@ -303,7 +308,7 @@ class ConfigEntry:
 
         if self.domain == integration.domain:
             try:
-                integration.get_platform("config_flow")
+                await integration.async_get_platform("config_flow")
             except ImportError as err:
                 _LOGGER.error(
                     "Error importing platform config_flow from integration %s to set up %s configuration entry: %s",
@@ -324,7 +329,8 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            with async_setup_timeline_span(hass, self.domain, SetupPhase.SETUP_ENTRY):
+                result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(
@@ -15,9 +15,11 @@ from collections.abc import (
     Iterable,
     Mapping,
 )
+from contextvars import ContextVar
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -76,6 +78,7 @@ from .exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from .helpers.json import JSONEncoder, states_to_json
 from .util import dt as dt_util, location, uuid as uuid_util
 from .util.async_ import (
     fire_coroutine_threadsafe,
@@ -138,6 +141,9 @@ SOURCE_YAML = ConfigSource.YAML.value
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Events that are not sent to the listeners of all events
+MATCH_ALL_SKIPPED_EVENTS = {EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -173,6 +179,30 @@ def is_callback(func: Callable[..., Any]) -> bool:
     return getattr(func, "_hass_callback", False) is True
 
 
+class ExecutorJobTimer:
+    """Accumulate the duration of executor jobs while it is active."""
+
+    __slots__ = ("total", "active")
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.total = 0.0
+        self.active = True
+
+    @callback
+    def async_add(self, duration: float) -> None:
+        """Add the duration of a finished executor job."""
+        if self.active:
+            self.total += duration
+
+
+# When set, the duration of executor jobs added from the current context is
+# added to the timer once they are done
+executor_job_timer_cv: ContextVar[ExecutorJobTimer | None] = ContextVar(
+    "executor_job_timer_cv", default=None
+)
+
+
 @enum.unique
 class HassJobType(enum.Enum):
     """Represent a job type."""
@@ -480,6 +510,10 @@ class HomeAssistant:
         """Add an executor job from within the event loop."""
         task = self.loop.run_in_executor(None, target, *args)
 
+        if (job_timer := executor_job_timer_cv.get()) is not None and job_timer.active:
+            start = monotonic()
+            task.add_done_callback(lambda _: job_timer.async_add(monotonic() - start))
+
         # If a task is scheduled
         if self._track_task:
             self._pending_tasks.append(task)
@@ -786,6 +820,7 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        self._time_tick_jobs: list[HassJob[None | Awaitable[None]]] = []
         self._hass = hass
 
     @callback
@@ -834,18 +869,62 @@ class EventBus:
         listeners = self._listeners.get(event_type, [])
 
         # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
+        # EVENT_TIME_CHANGED fires every second and is not needed by them
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+        if (
+            match_all_listeners is not None
+            and event_type not in MATCH_ALL_SKIPPED_EVENTS
+        ):
             listeners = match_all_listeners + listeners
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
-        if event_type != EVENT_TIME_CHANGED:
+        if event_type == EVENT_TIME_CHANGED:
+            if event_data is not None and ATTR_NOW in event_data:
+                self._async_run_time_tick_jobs(event_data[ATTR_NOW])
+        else:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
+        self._async_run_listeners(event, listeners)
+
+    @callback
+    def async_fire_time_changed(
+        self, now: datetime.datetime, context: Context | None = None
+    ) -> None:
+        """Fire the time changed event of the timer.
+
+        Time tick listeners are called with the time directly. The event is
+        only created if there are listeners for EVENT_TIME_CHANGED.
+
+        This method must be run in the event loop.
+        """
+        self._async_run_time_tick_jobs(now)
+
+        if listeners := self._listeners.get(EVENT_TIME_CHANGED):
+            self._async_run_listeners(
+                Event(
+                    EVENT_TIME_CHANGED,
+                    {ATTR_NOW: now},
+                    EventOrigin.local,
+                    now,
+                    context,
+                ),
+                listeners,
+            )
+
+    @callback
+    def _async_run_time_tick_jobs(self, now: datetime.datetime) -> None:
+        """Call the time tick listeners."""
+        if not self._time_tick_jobs:
             return
+        for job in self._time_tick_jobs.copy():
+            self._hass.async_add_hass_job(job, now)
 
+    @callback
+    def _async_run_listeners(
+        self, event: Event, listeners: list[_FilterableJob]
+    ) -> None:
+        """Run the listeners of an event."""
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -900,6 +979,30 @@ class EventBus:
             event_type, _FilterableJob(HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_time_tick(
+        self, listener: Callable[[datetime.datetime], None | Awaitable[None]]
+    ) -> CALLBACK_TYPE:
+        """Listen for the time changing every second.
+
+        The listener is called with the time in UTC, without an event being
+        created and without going through the listeners of all events.
+
+        This method must be run in the event loop.
+        """
+        job = HassJob(listener)
+        self._time_tick_jobs.append(job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            try:
+                self._time_tick_jobs.remove(job)
+            except ValueError:
+                _LOGGER.exception("Unable to remove unknown time tick listener %s", job)
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJob
@@ -1019,6 +1122,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -1054,6 +1158,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1088,6 +1193,19 @@ class State:
             )
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return a JSON representation of the State.
+
+        Async friendly.
+
+        The State is immutable, so it only has to be serialized once no matter
+        how many times it is sent. Raises ValueError or TypeError when the
+        attributes can't be serialized.
+        """
+        if self._as_json is None:
+            self._as_json = json.dumps(self.as_dict(), cls=JSONEncoder, allow_nan=False)
+        return self._as_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1147,6 +1265,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._states_json: str | None = None
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1220,6 +1339,20 @@ class StateMachine:
             state for state in self._states.values() if state.domain in domain_filter
         ]
 
+    @callback
+    def async_all_json(self) -> str:
+        """Return a JSON array of all states.
+
+        The array is built from the serialized states and kept until the next
+        state change. Raises ValueError or TypeError when a state can't be
+        serialized.
+
+        This method must be run in the event loop.
+        """
+        if self._states_json is None:
+            self._states_json = states_to_json(self._states.values())
+        return self._states_json
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -1261,6 +1394,7 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._states_json = None
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1365,6 +1499,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._states_json = None
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1928,9 +2063,7 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        hass.bus.async_fire_time_changed(now, timer_context)
 
         # If we are more than a second late, a tick was missed
         if (late := monotonic() - target) > 1:
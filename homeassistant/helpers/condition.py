@@ -60,7 +60,9 @@ from .sun import get_astral_event_date
 from .template import Template
 from .trace import (
     TraceElement,
+    TraceLevel,
     trace_append_element,
+    trace_level_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -83,6 +85,23 @@ INPUT_ENTITY_ID = re.compile(
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
 
+class _StateCache(dict):
+    """Entity states looked up during a single untraced evaluation."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        super().__init__()
+        self.hass = hass
+
+    def __missing__(self, entity_id: str) -> State | None:
+        """Look up a state the first time it is used."""
+        state_obj = self[entity_id] = self.hass.states.get(entity_id)
+        return state_obj
+
+
+UntracedCheckerType = Callable[[HomeAssistant, TemplateVarsType, _StateCache], bool]
+
+
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
@@ -135,20 +154,91 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None
             trace_stack_pop(trace_stack_cv)
 
 
-def trace_condition_function(condition: ConditionCheckerType) -> ConditionCheckerType:
-    """Wrap a condition function to enable basic tracing."""
+def trace_condition_function(
+    condition: ConditionCheckerType,
+    untraced: UntracedCheckerType | None = None,
+    kind: str | None = None,
+    flat_checks: list[UntracedCheckerType] | None = None,
+) -> ConditionCheckerType:
+    """Wrap a condition function to enable basic tracing.
+
+    When tracing is off, the compiled untraced evaluator is used instead. It
+    reports errors without detail, so the condition is evaluated again to
+    raise the same error as a traced evaluation would.
+    """
 
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Trace condition."""
+        if trace_level_cv.get() == TraceLevel.OFF:
+            if untraced is not None:
+                try:
+                    return untraced(hass, variables, _StateCache(hass))
+                except ConditionError:
+                    pass
+            return condition(hass, variables)
+
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
             return result
 
+    if untraced is not None:
+        setattr(wrapper, "untraced", untraced)
+    if kind is not None:
+        setattr(wrapper, "kind", kind)
+        setattr(wrapper, "flat_checks", flat_checks)
     return wrapper
 
 
+def _untraced_checker(check: ConditionCheckerType) -> UntracedCheckerType:
+    """Return the untraced evaluator of a condition."""
+    if (untraced := getattr(check, "untraced", None)) is not None:
+        return cast(UntracedCheckerType, untraced)
+
+    def untraced_check(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Run a condition which has no untraced evaluator."""
+        return check(hass, variables)
+
+    return untraced_check
+
+
+def _flatten_checks(
+    kind: str, checks: list[ConditionCheckerType]
+) -> list[UntracedCheckerType]:
+    """Return untraced evaluators with nested conditions of the same kind inlined."""
+    flat_checks: list[UntracedCheckerType] = []
+    for check in checks:
+        if getattr(check, "kind", None) == kind:
+            flat_checks.extend(getattr(check, "flat_checks"))
+        else:
+            flat_checks.append(_untraced_checker(check))
+    return flat_checks
+
+
+@callback
+def async_compile_and(checks: list[ConditionCheckerType]) -> ConditionCheckerType:
+    """Compile conditions into a single untraced checker which ANDs them.
+
+    Nested 'and' conditions are inlined and entity states are looked up once
+    per evaluation. A ConditionError is raised without detail, evaluate the
+    conditions one by one to find out what failed.
+    """
+    flat_checks = _flatten_checks("and", checks)
+
+    def if_all(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test all conditions."""
+        states = _StateCache(hass)
+        for check in flat_checks:
+            if not check(hass, variables, states):
+                return False
+        return True
+
+    return if_all
+
+
 async def async_from_config(
     hass: HomeAssistant,
     config: ConfigType,
@@ -183,7 +273,17 @@ async def async_and_from_config(
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
+    flat_checks = _flatten_checks("and", checks)
+
+    def if_and_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Test and condition without tracing."""
+        for check in flat_checks:
+            if not check(hass, variables, states):
+                return False
+        return True
+
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -205,7 +305,9 @@ async def async_and_from_config(
 
         return True
 
-    return if_and_condition
+    return trace_condition_function(
+        if_and_condition, if_and_untraced, "and", flat_checks
+    )
 
 
 async def async_or_from_config(
@@ -214,7 +316,17 @@ async def async_or_from_config(
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
+    flat_checks = _flatten_checks("or", checks)
+
+    def if_or_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Test or condition without tracing."""
+        for check in flat_checks:
+            if check(hass, variables, states):
+                return True
+        return False
+
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -236,7 +348,7 @@ async def async_or_from_config(
 
         return False
 
-    return if_or_condition
+    return trace_condition_function(if_or_condition, if_or_untraced, "or", flat_checks)
 
 
 async def async_not_from_config(
@@ -245,7 +357,17 @@ async def async_not_from_config(
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
+    untraced_checks = [_untraced_checker(check) for check in checks]
+
+    def if_not_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Test not condition without tracing."""
+        for check in untraced_checks:
+            if check(hass, variables, states):
+                return False
+        return True
+
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -267,7 +389,7 @@ async def async_not_from_config(
 
         return True
 
-    return if_not_condition
+    return trace_condition_function(if_not_condition, if_not_untraced)
 
 
 def numeric_state(
@@ -419,7 +541,26 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
-    @trace_condition_function
+    def if_numeric_state_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Test numeric state condition without tracing."""
+        if value_template is not None:
+            value_template.hass = hass
+
+        for entity_id in entity_ids:
+            if not async_numeric_state(
+                hass,
+                states[entity_id],
+                below,
+                above,
+                value_template,
+                variables,
+                attribute,
+            ):
+                return False
+        return True
+
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -454,7 +595,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    return trace_condition_function(if_numeric_state, if_numeric_state_untraced)
 
 
 def state(
@@ -532,7 +673,15 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
-    @trace_condition_function
+    def if_state_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Test if condition without tracing."""
+        for entity_id in entity_ids:
+            if not state(hass, states[entity_id], req_states, for_period, attribute):
+                return False
+        return True
+
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         errors = []
@@ -554,7 +703,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_state
+    return trace_condition_function(if_state, if_state_untraced)
 
 
 def sun(
@@ -673,14 +822,26 @@ def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
 
-    @trace_condition_function
+    def template_if_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType, states: _StateCache
+    ) -> bool:
+        """Validate template based if-condition without tracing."""
+        value_template.hass = hass
+
+        try:
+            value = value_template.async_render(variables, parse_result=False)
+        except TemplateError as ex:
+            raise ConditionErrorMessage("template", str(ex)) from ex
+
+        return cast(str, value).lower() == "true"
+
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
         value_template.hass = hass
 
         return async_template(hass, value_template, variables)
 
-    return template_if
+    return trace_condition_function(template_if, template_if_untraced)
 
 
 def time(
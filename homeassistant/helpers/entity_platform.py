@@ -32,7 +32,11 @@ from homeassistant.exceptions import (
     PlatformNotReady,
     RequiredParameterMissing,
 )
-from homeassistant.setup import async_start_setup
+from homeassistant.setup import (
+    SetupPhase,
+    async_setup_timeline_span,
+    async_start_setup,
+)
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from . import (
@@ -241,7 +245,9 @@ class EntityPlatform:
             self.platform_name,
             SLOW_SETUP_WARNING,
         )
-        with async_start_setup(hass, [full_name]):
+        with async_start_setup(hass, [full_name]), async_setup_timeline_span(
+            hass, full_name, SetupPhase.SETUP_PLATFORM
+        ):
             try:
                 task = async_create_setup_task()
 
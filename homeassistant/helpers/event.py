@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import Any, Union, cast
@@ -16,10 +17,8 @@ from typing_extensions import Concatenate, ParamSpec
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -56,6 +55,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+DATA_TIMER_WHEEL = "timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1229,6 +1230,179 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _WheelTimer:
+    """A point in time listener held by the timer wheel."""
+
+    __slots__ = ("deadline", "seq", "point_in_time", "job", "cancelled")
+
+    def __init__(
+        self,
+        deadline: float,
+        seq: int,
+        point_in_time: datetime,
+        job: HassJob[Awaitable[None] | None],
+    ) -> None:
+        """Initialize the timer."""
+        self.deadline = deadline
+        self.seq = seq
+        self.point_in_time = point_in_time
+        self.job = job
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Schedule point in time listeners on a single event loop timer.
+
+    Timers are grouped in buckets of one second, so adding and cancelling a
+    timer are dict operations. A heap of bucket seconds keeps track of the
+    next bucket due, it holds each second of a bucket once. Buckets emptied by
+    cancelled timers are dropped when their second is popped from the heap. Only the earliest deadline is armed with the event loop,
+    instead of one handle per listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        self._buckets: dict[int, dict[int, _WheelTimer]] = {}
+        self._bucket_heap: list[int] = []
+        self._seq = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._armed_deadline: float | None = None
+        self._firing = False
+
+    def __len__(self) -> int:
+        """Return the number of pending timers."""
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    @callback
+    def async_schedule(
+        self, job: HassJob[Awaitable[None] | None], point_in_time: datetime
+    ) -> CALLBACK_TYPE:
+        """Run a job once at a point in time.
+
+        The job is called with the point in time. Returns a function to cancel.
+        """
+        deadline = point_in_time.timestamp()
+        second = int(deadline)
+        self._seq += 1
+        timer = _WheelTimer(deadline, self._seq, point_in_time, job)
+
+        if (bucket := self._buckets.get(second)) is None:
+            bucket = self._buckets[second] = {}
+            heapq.heappush(self._bucket_heap, second)
+        bucket[timer.seq] = timer
+
+        if not self._firing and (
+            self._armed_deadline is None or deadline < self._armed_deadline
+        ):
+            self._async_arm(deadline)
+
+        @callback
+        def cancel_timer() -> None:
+            """Cancel the timer."""
+            timer.cancelled = True
+            if (bucket := self._buckets.get(second)) is None:
+                return
+            bucket.pop(timer.seq, None)
+
+        return cancel_timer
+
+    @callback
+    def async_pending_timers(self) -> list[tuple[datetime, HassJob]]:
+        """Return the pending timers ordered by the time they are due."""
+        timers = sorted(
+            (timer for bucket in self._buckets.values() for timer in bucket.values()),
+            key=lambda timer: (timer.deadline, timer.seq),
+        )
+        return [(timer.point_in_time, timer.job) for timer in timers]
+
+    @callback
+    def _async_arm(self, deadline: float, now: float | None = None) -> None:
+        """Arm the event loop timer for a deadline."""
+        if self._handle is not None:
+            self._handle.cancel()
+        if now is None:
+            now = time.time()
+        self._armed_deadline = deadline
+        self._handle = self._hass.loop.call_later(deadline - now, self._async_fire_due)
+
+    @callback
+    def _async_fire_due(self) -> None:
+        """Run all timers that are due and arm the next one."""
+        self._handle = None
+        self._armed_deadline = None
+
+        # Depending on the available clock support (including timer hardware
+        # and the OS kernel) it can happen that we fire a little bit too early
+        # as measured by utcnow(). That is bad when callbacks have assumptions
+        # about the current time. Timers that are not due yet stay in place
+        # and the loop timer is armed again for the remaining time.
+        now = time_tracker_utcnow().timestamp()
+        now_second = int(now)
+        last_seq = self._seq
+        heap = self._bucket_heap
+        due: list[_WheelTimer] = []
+
+        while heap and heap[0] <= now_second:
+            second = heapq.heappop(heap)
+            if (bucket := self._buckets.pop(second, None)) is None:
+                continue
+            if second < now_second:
+                due.extend(bucket.values())
+                continue
+            for seq, timer in list(bucket.items()):
+                if timer.deadline <= now:
+                    due.append(timer)
+                    del bucket[seq]
+            if bucket:
+                self._buckets[second] = bucket
+                heapq.heappush(heap, second)
+                break
+
+        due.sort(key=lambda timer: (timer.deadline, timer.seq))
+        self._firing = True
+        for timer in due:
+            # Timers can be cancelled by jobs that run before them
+            if timer.cancelled:
+                continue
+            try:
+                self._hass.async_run_hass_job(timer.job, timer.point_in_time)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._hass.loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer callback {timer.job}",
+                        "exception": exc,
+                    }
+                )
+
+        self._firing = False
+        self._async_arm_next(now, last_seq)
+
+    @callback
+    def _async_arm_next(self, now: float, last_seq: int) -> None:
+        """Arm the event loop timer for the earliest pending timer.
+
+        Timers that were pending before the loop timer fired are armed for the
+        remaining time as measured by utcnow(), like a timer that fired too
+        early. Timers added since are armed like any new timer.
+        """
+        heap = self._bucket_heap
+        while heap:
+            if bucket := self._buckets.get(heap[0]):
+                timer = min(bucket.values(), key=lambda timer: timer.deadline)
+                self._async_arm(timer.deadline, now if timer.seq <= last_seq else None)
+                return
+            self._buckets.pop(heapq.heappop(heap), None)
+
+
+@callback
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel that runs point in time listeners."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+    return cast(TimerWheel, wheel)
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1265,39 +1439,8 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
-
-    @callback
-    def run_action(job: HassJob[Awaitable[None] | None]) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
-
-        now = time_tracker_utcnow()
-
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        if (delta := (utc_point_in_time - now).total_seconds()) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
-            return
-
-        hass.async_run_hass_job(job, utc_point_in_time)
-
     job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
-
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
+    return async_get_timer_wheel(hass).async_schedule(job, utc_point_in_time)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -1463,18 +1606,12 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
-    job = HassJob(action)
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
     if all(val is None for val in (hour, minute, second)):
+        return hass.bus.async_listen_time_tick(action)
 
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_hass_job(job, cast(datetime, event.data[ATTR_NOW]))
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
-
+    job = HassJob(action)
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
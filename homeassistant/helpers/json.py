@@ -1,7 +1,13 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
+from collections.abc import Iterable
 import datetime
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import State
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -40,3 +46,11 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def states_to_json(states: Iterable[State]) -> str:
+    """Return a JSON array of states built from their serialized form.
+
+    Raises ValueError or TypeError when a state can't be serialized.
+    """
+    return f"[{', '.join(state.as_json() for state in states)}]"
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager, suppress
+from copy import deepcopy
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
@@ -55,6 +56,7 @@ from homeassistant.core import (
     HassJob,
     HomeAssistant,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
@@ -318,6 +320,7 @@ class _ScriptRun:
         self._log_exceptions = log_exceptions
         self._step = -1
         self._action: dict[str, Any] | None = None
+        self._script_step: _ScriptStep | None = None
         self._stop = asyncio.Event()
         self._stopped = asyncio.Event()
 
@@ -329,6 +332,17 @@ class _ScriptRun:
         # pylint: disable=protected-access
         return await self._script._async_get_condition(config)
 
+    async def _async_get_step_conditions(
+        self, configs: list[ConfigType]
+    ) -> list[ConditionCheckerType]:
+        """Return the conditions of the current step, created on its first run."""
+        script_step = self._script_step
+        if script_step.conditions is None:
+            script_step.conditions = [
+                await self._async_get_condition(config) for config in configs
+            ]
+        return script_step.conditions
+
     def _log(
         self, msg: str, *args: Any, level: int = logging.INFO, **kwargs: Any
     ) -> None:
@@ -347,7 +361,9 @@ class _ScriptRun:
         """Run script."""
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            # pylint: disable-next=protected-access
+            for self._step, self._script_step in enumerate(self._script._plan):
+                self._action = self._script_step.action
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
@@ -363,13 +379,13 @@ class _ScriptRun:
             self._finish()
 
     async def _async_step(self, log_exceptions):
-        with trace_path(str(self._step)):
+        script_step = self._script_step
+        with trace_path(script_step.path):
             async with trace_action(self._hass, self, self._stop, self._variables):
                 if self._stop.is_set():
                     return
                 try:
-                    handler = f"_async_{cv.determine_script_action(self._action)}_step"
-                    await getattr(self, handler)()
+                    await script_step.handler(self)
                 except Exception as ex:
                     if not isinstance(ex, _StopScript) and (
                         self._log_exceptions or log_exceptions
@@ -390,7 +406,7 @@ class _ScriptRun:
         await self._stopped.wait()
 
     def _log_exception(self, exception):
-        action_type = cv.determine_script_action(self._action)
+        action_type = self._script_step.action_type
 
         error = str(exception)
         level = logging.ERROR
@@ -545,9 +561,17 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        script_step = self._script_step
+        if (params := script_step.service_params) is None:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
+            if script_step.static_service:
+                script_step.service_params = params
+        if script_step.static_service:
+            # The service registry and service handlers may modify the data, so
+            # each run gets its own copy of the prepared call
+            params = deepcopy(params)
 
         running_script = (
             params[CONF_DOMAIN] == "automation"
@@ -628,7 +652,10 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        script_step = self._script_step
+        if script_step.conditions is None:
+            script_step.conditions = [await self._async_get_condition(self._action)]
+        cond = script_step.conditions[0]
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -707,9 +734,7 @@ class _ScriptRun:
                     break
 
         elif CONF_WHILE in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_WHILE]
-            ]
+            conditions = await self._async_get_step_conditions(repeat[CONF_WHILE])
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 try:
@@ -724,9 +749,7 @@ class _ScriptRun:
                 await async_run_sequence(iteration)
 
         elif CONF_UNTIL in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_UNTIL]
-            ]
+            conditions = await self._async_get_step_conditions(repeat[CONF_UNTIL])
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 await async_run_sequence(iteration)
@@ -935,6 +958,43 @@ def _referenced_extract_ids(data: dict[str, Any], key: str, found: set[str]) ->
             found.add(item_id)
 
 
+class _ScriptStep:
+    """A step of a script sequence, compiled when the script is created."""
+
+    __slots__ = (
+        "action",
+        "action_type",
+        "conditions",
+        "handler",
+        "path",
+        "service_params",
+        "static_service",
+    )
+
+    def __init__(self, index: int, action: dict[str, Any]) -> None:
+        """Compile the step."""
+        self.action = action
+        self.action_type = cv.determine_script_action(action)
+        self.handler: Callable[[_ScriptRun], Awaitable[None]] = getattr(
+            _ScriptRun, f"_async_{self.action_type}_step"
+        )
+        self.path = str(index)
+        # Conditions of condition steps and repeat while or until steps, created
+        # on the first run so config errors surface when the step runs
+        self.conditions: list[ConditionCheckerType] | None = None
+        # Service calls without templates or entity registry IDs in their target
+        # are prepared on the first run and reused afterwards
+        self.static_service = (
+            self.action_type == cv.SCRIPT_ACTION_CALL_SERVICE
+            and not template.is_complex(action)
+            and all(
+                valid_entity_id(entity_id)
+                for entity_id in action.get(CONF_TARGET, {}).get(ATTR_ENTITY_ID, [])
+            )
+        )
+        self.service_params: service.ServiceParams | None = None
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -978,6 +1038,9 @@ class Script:
         self._hass = hass
         self.sequence = sequence
         template.attach(hass, self.sequence)
+        self._plan = tuple(
+            _ScriptStep(index, action) for index, action in enumerate(sequence)
+        )
         self.name = name
         self.domain = domain
         self.running_description = running_description or f"{domain} script"
@@ -6,6 +6,7 @@ from collections.abc import Awaitable, Callable, Iterable
 import dataclasses
 from functools import partial, wraps
 import logging
+import time
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from typing_extensions import TypeGuard
@@ -62,6 +63,10 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
 
+# Optional coroutine function entity platforms can implement to handle a
+# service call for many of their entities at once.
+ATTR_ENTITY_SERVICE_BATCH_HANDLER = "async_handle_entity_service_batch"
+
 
 class ServiceParams(TypedDict):
     """Type for service call parameters."""
@@ -571,55 +576,36 @@ async def entity_service_call(
 
     # Check the permissions
 
-    # A list with entities to call the service on.
-    entity_candidates: list[Entity] = []
-
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
-                )
-
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
+    # A list with entities to call the service on, grouped by platform.
+    platform_candidates: list[tuple[EntityPlatform, list[Entity]]] = []
+
+    for platform in platforms:
+        if target_all_entities:
+            # If we target all entities, we will select all entities the user
+            # is allowed to control.
+            platform_entities = [
+                entity
+                for entity in platform.entities.values()
+                if entity_perms is None
+                or entity_perms(entity.entity_id, POLICY_CONTROL)
+            ]
+        else:
+            assert all_referenced is not None
+            platform_entities = _async_get_referenced_platform_entities(
+                platform, all_referenced
             )
 
-    else:
-        assert all_referenced is not None
-
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
-
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity.entity_id,
-                        permission=POLICY_CONTROL,
-                    )
-
-                platform_entities.append(entity)
+            if entity_perms is not None:
+                for entity in platform_entities:
+                    if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                        raise Unauthorized(
+                            context=call.context,
+                            entity_id=entity.entity_id,
+                            permission=POLICY_CONTROL,
+                        )
 
-            entity_candidates.extend(platform_entities)
+        if platform_entities:
+            platform_candidates.append((platform, platform_entities))
 
     if not target_all_entities:
         assert referenced is not None
@@ -627,45 +613,62 @@ async def entity_service_call(
         # Only report on explicit referenced entities
         missing = set(referenced.referenced)
 
-        for entity in entity_candidates:
-            missing.discard(entity.entity_id)
+        for _, platform_entities in platform_candidates:
+            for entity in platform_entities:
+                missing.discard(entity.entity_id)
 
         referenced.log_missing(missing)
 
-    entities = []
+    platform_calls: list[tuple[EntityPlatform, list[Entity]]] = []
 
-    for entity in entity_candidates:
-        if not entity.available:
-            continue
+    for platform, platform_entities in platform_candidates:
+        entities = []
 
-        # Skip entities that don't have the required feature.
-        if required_features is not None and (
-            entity.supported_features is None
-            or not any(
-                entity.supported_features & feature_set == feature_set
-                for feature_set in required_features
-            )
-        ):
-            continue
+        for entity in platform_entities:
+            if not entity.available:
+                continue
+
+            # Skip entities that don't have the required feature.
+            if required_features is not None and (
+                entity.supported_features is None
+                or not any(
+                    entity.supported_features & feature_set == feature_set
+                    for feature_set in required_features
+                )
+            ):
+                continue
+
+            entities.append(entity)
 
-        entities.append(entity)
+        if entities:
+            platform_calls.append((platform, entities))
 
-    if not entities:
+    if not platform_calls:
         return
 
-    done, pending = await asyncio.wait(
-        [
-            asyncio.create_task(
-                entity.async_request_call(
-                    _handle_entity_call(hass, entity, func, data, call.context)
+    if len(platform_calls) == 1:
+        platform, entities = platform_calls[0]
+        await _handle_platform_entity_calls(hass, platform, entities, func, data, call)
+    else:
+        done, pending = await asyncio.wait(
+            [
+                asyncio.create_task(
+                    _handle_platform_entity_calls(
+                        hass, platform, entities, func, data, call
+                    )
                 )
-            )
-            for entity in entities
-        ]
-    )
-    assert not pending
-    for future in done:
-        future.result()  # pop exception if have
+                for platform, entities in platform_calls
+            ]
+        )
+        assert not pending
+        for future in done:
+            future.result()  # pop exception if have
+
+    entities = [
+        entity
+        for _, platform_entities in platform_calls
+        for entity in platform_entities
+    ]
 
     tasks = []
 
@@ -685,6 +688,89 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+@callback
+def _async_get_referenced_platform_entities(
+    platform: EntityPlatform, all_referenced: set[str]
+) -> list[Entity]:
+    """Return the entities of a platform that are referenced by a service call.
+
+    Entities are looked up by entity ID when the call references fewer
+    entities than the platform holds, which avoids a scan of big platforms.
+    """
+    platform_entities = platform.entities
+
+    if len(all_referenced) >= len(platform_entities):
+        return [
+            entity
+            for entity in platform_entities.values()
+            if entity.entity_id in all_referenced
+        ]
+
+    return [
+        entity
+        for entity_id in all_referenced
+        if (entity := platform_entities.get(entity_id)) is not None
+    ]
+
+
+async def _handle_platform_entity_calls(
+    hass: HomeAssistant,
+    platform: EntityPlatform,
+    entities: list[Entity],
+    func: str | Callable[..., Any],
+    data: dict | ServiceCall,
+    call: ServiceCall,
+) -> None:
+    """Call the service on the entities of a single platform.
+
+    Entity platforms can implement ``async_handle_entity_service_batch`` to
+    handle the call for all their targeted entities with a single request.
+    It should return False if it can not handle the call, in which case the
+    service is called on each entity.
+    """
+    start = time.monotonic()
+    batch_handler = getattr(platform.platform, ATTR_ENTITY_SERVICE_BATCH_HANDLER, None)
+
+    if asyncio.iscoroutinefunction(batch_handler):
+        for entity in entities:
+            entity.async_set_context(call.context)
+        handled = await batch_handler(hass, entities, func, data)
+    else:
+        handled = False
+
+    if not handled:
+        if len(entities) == 1:
+            entity = entities[0]
+            await entity.async_request_call(
+                _handle_entity_call(hass, entity, func, data, call.context)
+            )
+        else:
+            done, pending = await asyncio.wait(
+                [
+                    asyncio.create_task(
+                        entity.async_request_call(
+                            _handle_entity_call(hass, entity, func, data, call.context)
+                        )
+                    )
+                    for entity in entities
+                ]
+            )
+            assert not pending
+            for future in done:
+                future.result()  # pop exception if have
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Service %s.%s handled for %s entities of platform %s%s in %.3f seconds",
+            call.domain,
+            call.service,
+            len(entities),
+            platform.platform_name,
+            " in a single batch" if handled else "",
+            time.monotonic() - start,
+        )
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
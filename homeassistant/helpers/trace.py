@@ -4,15 +4,27 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from functools import wraps
 from typing import Any, cast
 
+from homeassistant.backports.enum import StrEnum
 import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
 
+class TraceLevel(StrEnum):
+    """Amount of detail recorded in a trace."""
+
+    # Nothing is recorded
+    OFF = "off"
+    # Steps are recorded with their results, but not the variables
+    SUMMARY = "summary"
+    # Steps are recorded with the variables they changed
+    FULL = "full"
+
+
 class TraceElement:
     """Container for trace data."""
 
@@ -25,16 +37,25 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._variables: dict[str, Any] = {}
+
+        if trace_level_cv.get() != TraceLevel.FULL:
+            return
 
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
+        changed_variables = {}
+        for key, value in variables.items():
+            if key not in last_variables:
+                changed_variables[key] = value
+                continue
+            last_value = last_variables[key]
+            if last_value is not value and last_value != value:
+                changed_variables[key] = value
+        # The copy of the variables is shared by the steps until they change
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
@@ -101,6 +122,25 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# Amount of detail to record
+trace_level_cv: ContextVar[TraceLevel] = ContextVar(
+    "trace_level_cv", default=TraceLevel.FULL
+)
+
+
+def trace_level_set(level: TraceLevel) -> Token[TraceLevel]:
+    """Set the amount of detail to record in the current trace."""
+    return trace_level_cv.set(level)
+
+
+def trace_level_reset(token: Token[TraceLevel]) -> None:
+    """Restore the amount of detail recorded before trace_level_set."""
+    trace_level_cv.reset(token)
+
+
+def trace_level_get() -> TraceLevel:
+    """Return the amount of detail recorded in the current trace."""
+    return trace_level_cv.get()
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -160,6 +200,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if trace_level_cv.get() == TraceLevel.OFF:
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
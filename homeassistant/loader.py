@@ -15,6 +15,7 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeVar, cast
 
@@ -24,6 +25,7 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from .const import Platform
 from .generated.dhcp import DHCP
 from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
@@ -44,6 +46,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -56,6 +59,10 @@ CUSTOM_WARNING = (
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
+MAX_PRELOAD_CONCURRENTLY = 4
+
+# Platforms that are imported ahead of setup by async_preload_integrations
+PRELOAD_PLATFORMS = ("config_flow", *(platform.value for platform in Platform))
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
@@ -545,12 +552,24 @@ class Integration:
 
     def get_component(self) -> ModuleType:
         """Return the component."""
+        component, import_time = self._load_component()
+        if import_time is not None:
+            self._record_import_time(self.domain, import_time)
+        return component
+
+    def _load_component(self) -> tuple[ModuleType, float | None]:
+        """Return the component and how long importing it took.
+
+        The import time is None when the component was already imported.
+        """
         cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain in cache:
-            return cache[self.domain]
+            return cache[self.domain], None
 
         try:
+            start = time.perf_counter()
             cache[self.domain] = importlib.import_module(self.pkg_path)
+            import_time = time.perf_counter() - start
         except ImportError:
             raise
         except Exception as err:
@@ -559,17 +578,45 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
-        return cache[self.domain]
+        return cache[self.domain], import_time
+
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor if needed.
+
+        Custom integrations are imported in the event loop as they might
+        not be safe to import in another thread.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if self.domain in cache or not self.is_built_in:
+            return self.get_component()
+        component, import_time = await self.hass.async_add_executor_job(
+            self._load_component
+        )
+        if import_time is not None:
+            self._record_import_time(self.domain, import_time)
+        return component
 
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
+        platform, import_time = self._load_platform(platform_name)
+        if import_time is not None:
+            self._record_import_time(f"{self.domain}.{platform_name}", import_time)
+        return platform
+
+    def _load_platform(self, platform_name: str) -> tuple[ModuleType, float | None]:
+        """Return a platform and how long importing it took.
+
+        The import time is None when the platform was already imported.
+        """
         cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name in cache:
-            return cache[full_name]
+            return cache[full_name], None
 
         try:
+            start = time.perf_counter()
             cache[full_name] = self._import_platform(platform_name)
+            import_time = time.perf_counter() - start
         except ImportError:
             raise
         except Exception as err:
@@ -582,17 +629,104 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
-        return cache[full_name]
+        return cache[full_name], import_time
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor if needed."""
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if f"{self.domain}.{platform_name}" in cache or not self.is_built_in:
+            return self.get_platform(platform_name)
+        platform, import_time = await self.hass.async_add_executor_job(
+            self._load_platform, platform_name
+        )
+        if import_time is not None:
+            self._record_import_time(f"{self.domain}.{platform_name}", import_time)
+        return platform
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def _record_import_time(self, name: str, import_time: float) -> None:
+        """Record how long the first import of a module took.
+
+        The time includes waiting for another thread importing the same module.
+        """
+        import_times: dict[str, float] = self.hass.data.setdefault(
+            DATA_IMPORT_TIMES, {}
+        )
+        import_times.setdefault(name, import_time)
+
+    def preload(self) -> dict[str, float]:
+        """Import the component and its platforms ahead of setup.
+
+        Integrations with requirements that are not installed yet are
+        skipped, they are imported once the requirements are processed.
+        Import errors are raised again when the module is needed.
+
+        Returns how long the modules that were imported took to import, to
+        be recorded in the event loop.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .util.package import is_installed
+
+        import_times: dict[str, float] = {}
+        if not all(is_installed(req) for req in self.requirements):
+            return import_times
+
+        try:
+            _, import_time = self._load_component()
+        except ImportError:
+            return import_times
+        if import_time is not None:
+            import_times[self.domain] = import_time
+
+        for platform_name in PRELOAD_PLATFORMS:
+            if not (
+                (self.file_path / f"{platform_name}.py").exists()
+                or (self.file_path / platform_name).is_dir()
+            ):
+                continue
+            try:
+                _, import_time = self._load_platform(platform_name)
+            except ImportError:
+                continue
+            if import_time is not None:
+                import_times[f"{self.domain}.{platform_name}"] = import_time
+
+        return import_times
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+async def async_preload_integrations(
+    hass: HomeAssistant, integrations: list[Integration]
+) -> None:
+    """Import built-in integrations and their platforms in the executor.
+
+    Integrations are imported in the given order, which should put
+    dependencies before the integrations that depend on them.
+    """
+    # Create the module cache in the event loop, the executor jobs only add to it
+    hass.data.setdefault(DATA_COMPONENTS, {})
+    results = await gather_with_concurrency(
+        MAX_PRELOAD_CONCURRENTLY,
+        *(
+            hass.async_add_executor_job(integration.preload)
+            for integration in integrations
+            if integration.is_built_in
+        ),
+        return_exceptions=True,
+    )
+    import_times: dict[str, float] = hass.data.setdefault(DATA_IMPORT_TIMES, {})
+    for result in results:
+        if isinstance(result, dict):
+            for name, import_time in result.items():
+                import_times.setdefault(name, import_time)
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
     if (cache := hass.data.get(DATA_INTEGRATIONS)) is None:
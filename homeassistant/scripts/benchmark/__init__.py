@@ -9,14 +9,22 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from pathlib import Path
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.trace import (
+    TraceLevel,
+    trace_clear,
+    trace_level_reset,
+    trace_level_set,
+)
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -391,6 +399,219 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def script_run_trace_off(hass):
+    """Run a script 10k times without tracing."""
+    return await _script_run(hass, TraceLevel.OFF)
+
+
+@benchmark
+async def script_run_trace_summary(hass):
+    """Run a script 10k times recording a summary trace."""
+    return await _script_run(hass, TraceLevel.SUMMARY)
+
+
+@benchmark
+async def script_run_trace_full(hass):
+    """Run a script 10k times recording a full trace."""
+    return await _script_run(hass, TraceLevel.FULL)
+
+
+async def _script_run(hass, level):
+    """Run a script 10k times at a trace level."""
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"brightness": 128, "transition": 2}},
+            {"condition": "state", "entity_id": "light.kitchen", "state": "off"},
+            {"event": "benchmark_event", "event_data": {"brightness": 128}},
+            {"variables": {"brightness": 255}},
+            {"event": "benchmark_event", "event_data": {"brightness": 255}},
+        ]
+    )
+    bench_script = script.Script(hass, sequence, "Benchmark", "benchmark")
+    hass.states.async_set("light.kitchen", "off")
+    token = trace_level_set(level)
+
+    start = timer()
+    for _ in range(10**4):
+        trace_clear()
+        await bench_script.async_run(context=core.Context())
+    runtime = timer() - start
+
+    trace_level_reset(token)
+    return runtime
+
+
+@benchmark
+async def script_run_choose(hass):
+    """Run a script with a choose action 10k times."""
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "choose": [
+                    {
+                        "conditions": {
+                            "condition": "state",
+                            "entity_id": "light.kitchen",
+                            "state": state,
+                        },
+                        "sequence": {"event": "benchmark_event"},
+                    }
+                    for state in ("on", "unavailable", "unknown", "off")
+                ],
+                "default": {"event": "benchmark_event"},
+            }
+        ]
+    )
+    return await _script_run_untraced(hass, sequence)
+
+
+@benchmark
+async def script_run_repeat(hass):
+    """Run a script repeating a sequence 10 times 1k times."""
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "repeat": {
+                    "while": [
+                        {
+                            "condition": "state",
+                            "entity_id": "light.kitchen",
+                            "state": "off",
+                        },
+                        {
+                            "condition": "template",
+                            "value_template": "{{ repeat.index <= 10 }}",
+                        },
+                    ],
+                    "sequence": [
+                        {"service": "light.turn_on", "data": {"brightness": 255}},
+                        {"condition": "template", "value_template": "{{ True }}"},
+                        {"service": "light.turn_off", "data": {"transition": 2}},
+                    ],
+                }
+            }
+        ]
+    )
+    hass.services.async_register("light", "turn_on", lambda call: None)
+    hass.services.async_register("light", "turn_off", lambda call: None)
+    return await _script_run_untraced(hass, sequence, 10**3)
+
+
+async def _script_run_untraced(hass, sequence, runs=10**4):
+    """Run a script without tracing."""
+    bench_script = script.Script(hass, sequence, "Benchmark", "benchmark")
+    hass.states.async_set("light.kitchen", "off")
+    token = trace_level_set(TraceLevel.OFF)
+
+    start = timer()
+    for _ in range(runs):
+        await bench_script.async_run(context=core.Context())
+    runtime = timer() - start
+
+    trace_level_reset(token)
+    return runtime
+
+
+@benchmark
+async def automation_conditions_trace_off(hass):
+    """Evaluate the 50 conditions of an automation 10k times without tracing."""
+    return await _automation_conditions(hass, TraceLevel.OFF)
+
+
+@benchmark
+async def automation_conditions_trace_full(hass):
+    """Evaluate the 50 conditions of an automation 10k times with tracing."""
+    return await _automation_conditions(hass, TraceLevel.FULL)
+
+
+async def _automation_conditions(hass, level):
+    """Evaluate the 50 conditions of an automation 10k times at a trace level."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.automation import _async_process_if
+
+    configs = []
+    for idx in range(10):
+        entity_id = f"sensor.benchmark_{idx}"
+        hass.states.async_set(entity_id, idx, {"unit_of_measurement": "W"})
+        configs.extend(
+            [
+                {"condition": "state", "entity_id": entity_id, "state": str(idx)},
+                {"condition": "numeric_state", "entity_id": entity_id, "below": 100},
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": entity_id,
+                            "attribute": "unit_of_measurement",
+                            "state": "W",
+                        },
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": entity_id,
+                            "above": -1,
+                        },
+                    ],
+                },
+                {
+                    "condition": "template",
+                    "value_template": f"{{{{ is_state('{entity_id}', '{idx}') }}}}",
+                },
+            ]
+        )
+    if_action = await _async_process_if(
+        hass,
+        "Benchmark",
+        {},
+        {"condition": [cv.CONDITION_SCHEMA(config) for config in configs]},
+    )
+    token = trace_level_set(level)
+
+    start = timer()
+    for _ in range(10**4):
+        trace_clear()
+        assert if_action()
+    runtime = timer() - start
+
+    trace_level_reset(token)
+    return runtime
+
+
+@benchmark
+async def zwave_js_discovery(hass):
+    """Run Z-Wave JS discovery 100 times on the node dumps of the tests."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from zwave_js_server.model.node import Node
+
+    from homeassistant.components.zwave_js.discovery import (
+        async_discover_node_values,
+    )
+
+    # Discovery doesn't talk to the server, so the nodes get a client without
+    # a connection
+    client = SimpleNamespace(driver=None)
+    fixtures = Path(__file__).parents[3] / "tests/components/zwave_js/fixtures"
+    nodes = []
+    for path in sorted(fixtures.glob("*.json")):
+        state = json.loads(path.read_text())
+        if isinstance(state, dict) and "nodeId" in state and "values" in state:
+            nodes.append(Node(client, state))
+    if not nodes:
+        raise FileNotFoundError(f"No Z-Wave JS node dumps found in {fixtures}")
+
+    device = SimpleNamespace(id="benchmark", name="Benchmark", name_by_user=None)
+
+    start = timer()
+    for _ in range(100):
+        for node in nodes:
+            for _ in async_discover_node_values(node, device, {device.id: set()}):
+                pass
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -191,7 +191,7 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -199,7 +199,11 @@ def check(config_dir, secrets=False):
         return secrets
 
     try:
-        with patch.object(yaml_loader, "Secrets", secrets_proxy):
+        # Bypass the parsed YAML cache so every loaded file and used secret
+        # goes through the mocks above
+        with patch.object(yaml_loader, "Secrets", secrets_proxy), patch.object(
+            yaml_loader.PARSED_YAML_CACHE, "enabled", False
+        ):
             res["components"] = asyncio.run(async_check_config(config_dir))
         res["secret_cache"] = {
             str(key): val for key, val in res["secret_cache"].items()
@@ -219,9 +223,7 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
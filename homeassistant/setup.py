@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
+from dataclasses import dataclass
 import logging.handlers
+import time
 from timeit import default_timer as timer
 from types import ModuleType
 from typing import Any
 
 from . import config as conf_util, core, loader, requirements
+from .backports.enum import StrEnum
 from .config import async_notify_setup_error
 from .const import (
     EVENT_COMPONENT_LOADED,
@@ -31,6 +35,7 @@ BASE_PLATFORMS = {platform.value for platform in Platform}
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
@@ -38,6 +43,90 @@ DATA_DEPS_REQS = "deps_reqs_processed"
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+# Enough for a few thousand integrations and platforms, older spans
+# of config entry reloads are dropped first.
+MAX_TIMELINE_SPANS = 20000
+
+
+class SetupPhase(StrEnum):
+    """Phases of setting up an integration or platform."""
+
+    WAIT_DEPENDENCIES = "wait_dependencies"
+    REQUIREMENTS = "requirements"
+    IMPORT = "import"
+    SETUP = "setup"
+    SETUP_ENTRY = "setup_entry"
+    SETUP_PLATFORM = "setup_platform"
+
+
+@dataclass
+class SetupSpan:
+    """A span of time spent in a setup phase."""
+
+    name: str
+    phase: SetupPhase
+    start: float
+    end: float | None = None
+
+
+class SetupTimeline:
+    """Timeline of the setup phases of integrations and platforms."""
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.started = time.monotonic()
+        self.spans: deque[SetupSpan] = deque(maxlen=MAX_TIMELINE_SPANS)
+
+    @contextlib.contextmanager
+    def async_span(
+        self, name: str, phase: SetupPhase
+    ) -> Generator[SetupSpan, None, None]:
+        """Record the time spent in a setup phase."""
+        span = SetupSpan(name, phase, time.monotonic())
+        self.spans.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.monotonic()
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format."""
+        now = time.monotonic()
+        thread_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in self.spans:
+            # Each integration gets its own row, platforms share the row
+            # of the integration that provides them.
+            if "." in span.name:
+                _, integration = span.name.split(".", 1)
+            else:
+                integration = span.name
+            if (tid := thread_ids.get(integration)) is None:
+                tid = thread_ids[integration] = len(thread_ids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": integration},
+                    }
+                )
+            end = now if span.end is None else span.end
+            events.append(
+                {
+                    "name": f"{span.name} {span.phase}",
+                    "cat": str(span.phase),
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round((span.start - self.started) * 1_000_000),
+                    "dur": round((end - span.start) * 1_000_000),
+                    "args": {"name": span.name, "finished": span.end is not None},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
 
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str]) -> None:
@@ -122,10 +211,13 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_setup_timeline_span(
+        hass, integration.domain, SetupPhase.WAIT_DEPENDENCIES
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -179,7 +271,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_setup_timeline_span(hass, domain, SetupPhase.IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -223,8 +316,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_setup_timeline_span(hass, domain, SetupPhase.SETUP):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "Setup of %s is taking longer than %s seconds."
@@ -304,7 +398,10 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_setup_timeline_span(
+            hass, f"{domain}.{platform_name}", SetupPhase.IMPORT
+        ):
+            platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -317,7 +414,7 @@ async def async_prepare_setup_platform(
     # If the integration is not set up yet, and can be set up, set it up.
     if integration.domain not in hass.config.components:
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as exc:
             log_error(f"Unable to import the component ({exc}).")
             return None
@@ -347,10 +444,13 @@ async def async_process_deps_reqs(
         raise DependencyError(failed_deps)
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_setup_timeline_span(
+            hass, integration.domain, SetupPhase.REQUIREMENTS
+        ):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -456,3 +556,18 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Return the setup timeline."""
+    if (timeline := hass.data.get(DATA_SETUP_TIMELINE)) is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline()
+    return timeline  # type: ignore[no-any-return]
+
+
+def async_setup_timeline_span(
+    hass: core.HomeAssistant, name: str, phase: SetupPhase
+) -> contextlib.AbstractContextManager[SetupSpan]:
+    """Record the time spent in a setup phase of an integration or platform."""
+    return async_get_setup_timeline(hass).async_span(name, phase)
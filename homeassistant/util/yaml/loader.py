@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Hashable, Iterator
 import fnmatch
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -23,6 +33,13 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files modified less than this long before they were parsed are not cached,
+# as a second write within the timestamp granularity of the file system would
+# otherwise go unnoticed.
+CACHE_MTIME_GRACE_NS = 2_000_000_000
+
+DependencyKey = tuple[str, ...]
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -46,6 +63,7 @@ class Secrets:
                 # We went above the config dir
                 break
 
+            PARSED_YAML_CACHE.record_dependency(("file", str(secret_dir / SECRET_YAML)))
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -88,7 +106,171 @@ class Secrets:
         return secrets
 
 
-class SafeLineLoader(yaml.SafeLoader):
+class ParsedYamlCache:
+    """Cache of parsed YAML trees.
+
+    Entries are keyed by file path and validated against the modification
+    time and size of every file they were built from, including files pulled
+    in through !include tags and the secrets files that were consulted.
+    Directory listings used by the !include_dir_* tags and environment
+    variables used by !env_var are validated as well.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[
+            tuple[str, Path | None], tuple[JSON_TYPE, dict[DependencyKey, Any]]
+        ] = {}
+        self._local = threading.local()
+
+    def _collectors(self) -> list[dict[DependencyKey, Any]]:
+        """Return the dependency collectors of the loads running in this thread."""
+        try:
+            return self._local.collectors  # type: ignore[no-any-return]
+        except AttributeError:
+            collectors: list[dict[DependencyKey, Any]] = []
+            self._local.collectors = collectors
+            return collectors
+
+    def record_dependency(self, key: DependencyKey) -> None:
+        """Record that the files being loaded depend on key."""
+        if not self.enabled or not (collectors := self._collectors()):
+            return
+        signature = _dependency_signature(key)
+        for collector in collectors:
+            collector[key] = signature
+
+    def load(
+        self,
+        fname: str,
+        secrets: Secrets | None,
+        loader: Callable[[], JSON_TYPE],
+    ) -> JSON_TYPE:
+        """Return the parsed tree for fname, calling loader if not cached."""
+        if not self.enabled:
+            return loader()
+
+        cache_key = (
+            os.path.abspath(fname),
+            None if secrets is None else secrets.config_dir,
+        )
+        collectors = self._collectors()
+
+        if (entry := self._entries.get(cache_key)) is not None:
+            data, dependencies = entry
+            if all(
+                _dependency_signature(key) == signature
+                for key, signature in dependencies.items()
+            ):
+                self.hits += 1
+                for collector in collectors:
+                    collector.update(dependencies)
+                return _copy_tree(data)
+            del self._entries[cache_key]
+
+        self.misses += 1
+        started = time.time_ns()
+        dependencies = {}
+        collectors.append(dependencies)
+        try:
+            dependencies[("file", fname)] = _dependency_signature(("file", fname))
+            data = loader()
+        finally:
+            collectors.pop()
+            for collector in collectors:
+                collector.update(dependencies)
+
+        if _is_cacheable(dependencies, started):
+            self._entries[cache_key] = (_copy_tree(data), dependencies)
+        return data
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        self._entries.clear()
+
+
+def _file_signature(fname: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dependency_signature(key: DependencyKey) -> Hashable:
+    """Return the current signature of a dependency."""
+    kind = key[0]
+    if kind == "file":
+        return _file_signature(key[1])
+    if kind == "dir":
+        return tuple(_walk_files(key[1], key[2]))
+    if kind == "env":
+        return os.environ.get(key[1])
+    raise ValueError(f"Unknown dependency {key}")
+
+
+def _is_cacheable(dependencies: dict[DependencyKey, Any], started: int) -> bool:
+    """Decide if a tree built from dependencies can be cached."""
+    for key, signature in dependencies.items():
+        if key[0] != "file":
+            continue
+        if signature is None:
+            # Only missing secrets files are a valid dependency, the loaded
+            # file itself is expected to exist on disk.
+            if os.path.basename(key[1]) != SECRET_YAML:
+                return False
+        elif signature[0] > started - CACHE_MTIME_GRACE_NS:
+            return False
+    return True
+
+
+def _copy_tree(obj: Any) -> Any:
+    """Copy the containers of a parsed tree, keeping the annotations."""
+    if isinstance(obj, dict):
+        new_obj: Any = obj.__class__(
+            (key, _copy_tree(value)) for key, value in obj.items()
+        )
+    elif isinstance(obj, list):
+        new_obj = obj.__class__(_copy_tree(value) for value in obj)
+    else:
+        return obj
+    if attrs := getattr(obj, "__dict__", None):
+        new_obj.__dict__.update(attrs)
+    return new_obj
+
+
+PARSED_YAML_CACHE = ParsedYamlCache()
+
+
+class _LoaderMixin:
+    """Mixin class with extensions for YAML loader."""
+
+    name: str
+    stream: Any
+    secrets: Secrets | None
+
+
+class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
+    """The fastest available safe loader."""
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a safe line loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self.secrets = secrets
+
+
+class SafeLineLoader(yaml.SafeLoader, _LoaderMixin):
     """Loader class that keeps track of line numbers."""
 
     def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
@@ -104,8 +286,18 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+LoaderType = Union[FastSafeLoader, SafeLineLoader]  # pylint: disable=invalid-name
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return PARSED_YAML_CACHE.load(
+        fname, secrets, lambda: _load_yaml_file(fname, secrets)
+    )
+
+
+def _load_yaml_file(fname: str, secrets: Secrets | None) -> JSON_TYPE:
+    """Read and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -116,40 +308,63 @@ def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    if not HAS_C_LOADER:
+        return _parse_yaml_python(content, secrets)
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        return _parse_yaml(FastSafeLoader, content, secrets)
+    except yaml.YAMLError:
+        # Loading failed, so we now load with the Python loader
+        # to report the error the same way as without LibYAML
+        if not isinstance(content, str):
+            content.seek(0, 0)
+        return _parse_yaml_python(content, secrets)
+
+
+def _parse_yaml_python(
+    content: str | TextIO, secrets: Secrets | None = None
+) -> JSON_TYPE:
+    """Load a YAML file using the Python loader."""
+    try:
+        return _parse_yaml(SafeLineLoader, content, secrets)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _parse_yaml(
+    loader: type[FastSafeLoader] | type[SafeLineLoader],
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+) -> JSON_TYPE:
+    """Load a YAML file."""
+    # If configuration file is empty YAML returns None
+    # We convert that to an empty dict
+    return (
+        yaml.load(content, Loader=lambda stream: loader(stream, secrets))
+        or OrderedDict()
+    )
+
+
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,7 +375,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -183,6 +398,12 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    PARSED_YAML_CACHE.record_dependency(("dir", directory, pattern))
+    return _walk_files(directory, pattern)
+
+
+def _walk_files(directory: str, pattern: str) -> Iterator[str]:
+    """Recursively find the files in a directory matching pattern."""
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
@@ -191,9 +412,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -206,7 +425,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -221,7 +440,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -233,7 +452,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -247,7 +466,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,15 +498,16 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    PARSED_YAML_CACHE.record_dependency(("env", args[0]))
 
     # Check for a default value
     if len(args) > 1:
@@ -298,7 +518,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -306,19 +526,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: Any, constructor: Callable) -> None:
+    """Add a constructor to all loaders."""
+    for yaml_loader in (FastSafeLoader, SafeLineLoader):
+        yaml_loader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
@@ -3,6 +3,10 @@ import asyncio
 from unittest.mock import patch
 
 from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from tests.common import MockConfigEntry
 
 
 async def test_loading_no_group_data_format(hass, hass_storage):
@@ -248,3 +252,39 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_entity_permissions_follow_registry_updates(hass):
+    """Test memoized entity permissions are redone when the registries change."""
+    store = auth_store.AuthStore(hass)
+    await store.async_get_users()
+
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "1234")}
+    )
+    entity = entity_registry.async_get_or_create(
+        "light", "test", "1234", device_id=device.id
+    )
+
+    perms = PolicyPermissions(
+        {"entities": {"area_ids": {"kitchen": {"read": True}}}}, store._perm_lookup
+    )
+    assert not perms.check_entity(entity.entity_id, "read")
+
+    with patch.object(
+        entity_registry, "async_get", side_effect=AssertionError("not memoized")
+    ):
+        assert not perms.check_entity(entity.entity_id, "read")
+
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    await hass.async_block_till_done()
+    assert perms.check_entity(entity.entity_id, "read")
+    assert not perms.check_entity(entity.entity_id, "control")
+
+    entity_registry.async_update_entity(entity.entity_id, device_id=None)
+    await hass.async_block_till_done()
+    assert not perms.check_entity(entity.entity_id, "read")
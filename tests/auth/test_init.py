@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import hashlib
 from unittest.mock import Mock, patch
 
 import jwt
@@ -562,6 +563,86 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_is_cached(mock_hass):
+    """Test that a validated access token skips decoding until revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch("homeassistant.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert len(mock_decode.mock_calls) == 2
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert manager._access_token_cache == {}
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_cached_access_token_of_removed_user(mock_hass):
+    """Test that a cached access token is invalid once its user is removed."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager._store.async_remove_user(user)
+
+    assert await manager.async_get_refresh_token(refresh_token.id) is None
+    assert await manager.async_get_refresh_token_by_token(refresh_token.token) is None
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_remove_user_drops_cached_access_tokens(mock_hass):
+    """Test that removing a user drops its cached access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_user(user)
+
+    assert manager._access_token_cache == {}
+    assert manager._access_token_cache_keys == {}
+    assert manager._revoke_callbacks == {}
+
+
+async def test_access_token_cache_is_bounded(mock_hass):
+    """Test that the access token cache drops the least recently used token."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+
+    refresh_tokens = [
+        await manager.async_create_refresh_token(user, CLIENT_ID) for _ in range(3)
+    ]
+    access_tokens = [
+        manager.async_create_access_token(refresh_token)
+        for refresh_token in refresh_tokens
+    ]
+
+    with patch("homeassistant.auth.ACCESS_TOKEN_CACHE_SIZE", 2):
+        for access_token in access_tokens:
+            assert await manager.async_validate_access_token(access_token)
+
+    assert list(manager._access_token_cache) == [
+        hashlib.sha256(access_token.encode()).digest()
+        for access_token in access_tokens[1:]
+    ]
+    assert set(manager._access_token_cache_keys) == {
+        refresh_token.id for refresh_token in refresh_tokens[1:]
+    }
+    assert manager._revoke_callbacks[refresh_tokens[0].id] == []
+
+
 async def test_register_revoke_token_callback(mock_hass):
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
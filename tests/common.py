@@ -839,7 +839,15 @@ def patch_yaml_files(files_dict, endswith=True):
         # Not found
         raise FileNotFoundError(f"File not found: {fname}")
 
-    return patch.object(yaml_loader, "open", mock_open_f, create=True)
+    @contextmanager
+    def patch_open():
+        """Patch open and bypass the parsed YAML cache, which checks real files."""
+        with patch.object(yaml_loader, "open", mock_open_f, create=True), patch.object(
+            yaml_loader.PARSED_YAML_CACHE, "enabled", False
+        ):
+            yield
+
+    return patch_open()
 
 
 def mock_coro(return_value=None, exception=None):
@@ -10,6 +10,7 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components.api import EventStreamClient
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component
 
@@ -358,6 +359,74 @@ async def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_stream_stats(hass, mock_api_client):
+    """Test the stream statistics."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?overflow=disconnect")
+    assert resp.status == HTTPStatus.OK
+
+    hass.bus.async_fire("test_event")
+    data = await _stream_next_event(resp.content)
+    assert data["event_type"] == "test_event"
+
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}/stats")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == [
+        {
+            "restrict": None,
+            "overflow": "disconnect",
+            "lag": 0,
+            "sent": 1,
+            "dropped": 0,
+        }
+    ]
+
+
+async def test_stream_invalid_overflow(hass, mock_api_client):
+    """Test the stream rejects unknown overflow policies."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?overflow=block")
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "overflow,queued,dropped",
+    [("drop", [b"1", b"2"], 1), ("disconnect", [b"2", None], 2)],
+)
+async def test_stream_client_overflow(hass, mock_api_client, overflow, queued, dropped):
+    """Test the overflow policy of a stream client with a full queue."""
+    hub = hass.data["api"]
+    with patch("homeassistant.components.api.STREAM_QUEUE_SIZE", 2):
+        client = EventStreamClient(None, overflow)
+    remove_client = hub.async_add_client(client)
+
+    for message in (b"1", b"2", b"3"):
+        client.async_put(message)
+
+    assert client.dropped == dropped
+    assert [client.queue.get_nowait() for _ in range(2)] == queued
+    assert hub.async_get_stats()[0]["dropped"] == client.dropped
+    remove_client()
+    assert hub.async_get_stats() == []
+
+
+async def test_stream_shares_encoded_events(hass, mock_api_client):
+    """Test an event is encoded once for all stream clients."""
+    hub = hass.data["api"]
+    clients = [EventStreamClient(None, "drop"), EventStreamClient(["other"], "drop")]
+    clients.append(EventStreamClient(None, "drop"))
+    for client in clients:
+        hub.async_add_client(client)
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire(const.EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    message = clients[0].queue.get_nowait()
+    assert message.startswith(b"data: ")
+    assert clients[2].queue.get_nowait() is message
+    for client in clients:
+        assert client.queue.get_nowait() is None
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -489,6 +558,13 @@ async def test_states_view_filters(hass, mock_api_client, hass_admin_user):
     assert json[0]["entity_id"] == "test.entity"
 
 
+async def test_states_view_not_allows_nan(hass, mock_api_client):
+    """Test the states view does not allow NaN floats."""
+    hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 async def test_get_entity_state_read_perm(hass, mock_api_client, hass_admin_user):
     """Test getting a state requires read permission."""
     hass_admin_user.mock_policy({})
@@ -6,6 +6,7 @@ from turbojpeg import TurboJPEG
 
 from homeassistant.components.camera import Image
 from homeassistant.components.camera.img_util import (
+    ScaledImageCache,
     TurboJPEGSingleton,
     find_supported_scaling_factor,
     scale_jpeg_camera_image,
@@ -116,3 +117,31 @@ def test_find_supported_scaling_factor(
         )
         == scaling_factor
     )
+
+
+def test_scaled_image_cache():
+    """Test the scaled image cache is bounded and counts hits and misses."""
+    cache = ScaledImageCache(max_bytes=10)
+    first = ("camera.one", b"frame", 8, 6)
+    second = ("camera.two", b"frame", 8, 6)
+
+    assert cache.get(first) is None
+    cache.set(first, b"12345")
+    cache.set(second, b"12345")
+    assert cache.get(first) == b"12345"
+
+    # The least recently used image is evicted
+    cache.set(("camera.three", b"frame", 8, 6), b"123")
+    assert cache.get(second) is None
+    assert cache.get(first) == b"12345"
+
+    # Images larger than the cache are not cached
+    cache.set(("camera.four", b"frame", 8, 6), b"12345678901")
+
+    assert cache.statistics == {
+        "images": 2,
+        "size": 8,
+        "max_size": 10,
+        "hits": 2,
+        "misses": 2,
+    }
@@ -8,7 +8,11 @@ from unittest.mock import Mock, PropertyMock, mock_open, patch
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DATA_SCALED_IMAGE_CACHE,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -175,6 +179,31 @@ async def test_get_image_from_camera_with_width_height_scaled(hass, image_mock_u
     assert image.content == EMPTY_8_6_JPEG
 
 
+async def test_get_image_scaled_cached(hass, image_mock_url):
+    """Test scaled images of the same frame and size are cached."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+
+    assert turbo_jpeg.scale_with_quality.call_count == 1
+    statistics = hass.data[DATA_SCALED_IMAGE_CACHE].statistics
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 1
+
+
 async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     """Grab an image from camera entity that we cannot scale."""
 
@@ -479,6 +508,65 @@ async def test_record_service(hass, mock_camera, mock_stream):
         assert mock_record.called
 
 
+async def test_get_image_concurrent_requests_share_fetch(hass, image_mock_url):
+    """Test concurrent requests for a camera image share a single fetch."""
+    fetch_started = asyncio.Event()
+    release = asyncio.Event()
+    calls = []
+
+    async def _async_camera_image(self, width=None, height=None):
+        calls.append((width, height))
+        fetch_started.set()
+        await release.wait()
+        return b"Image"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        _async_camera_image,
+    ):
+        requests = asyncio.gather(
+            *(camera.async_get_image(hass, "camera.demo_camera") for _ in range(3))
+        )
+        await fetch_started.wait()
+        release.set()
+        images = await requests
+        assert len(calls) == 1
+        assert [image.content for image in images] == [b"Image"] * 3
+
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(calls) == 2
+
+
+async def test_still_stream_producer_shared(hass):
+    """Test MJPEG viewers of a camera share one producer."""
+    images = iter([b"first", b"first", b"second", None])
+    image_cb_calls = 0
+
+    async def _image_cb():
+        nonlocal image_cb_calls
+        image_cb_calls += 1
+        await asyncio.sleep(0)
+        return next(images)
+
+    stopped = []
+    producer = camera._StillStreamProducer(_image_cb, 0, lambda: stopped.append(True))
+
+    async def _viewer(queue):
+        received = []
+        while img_bytes := await queue.get():
+            received.append(img_bytes)
+        return received
+
+    queues = [producer.async_subscribe() for _ in range(2)]
+    received = await asyncio.gather(*(_viewer(queue) for queue in queues))
+    for queue in queues:
+        producer.async_unsubscribe(queue)
+
+    assert image_cb_calls == 4
+    assert received == [[b"first", b"second"], [b"first", b"second"]]
+    assert stopped
+
+
 async def test_camera_proxy_stream(hass, mock_camera, hass_client):
     """Test record service."""
 
@@ -8,6 +8,7 @@ import pytest
 import homeassistant.components.group as group
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     EVENT_HOMEASSISTANT_START,
@@ -225,6 +226,83 @@ async def test_expand_entity_ids_recursive(hass):
     )
 
 
+async def test_expand_entity_ids_nested_cycle(hass, caplog):
+    """Test expand_entity_ids with nested groups that contain each other."""
+    hass.states.async_set(
+        "group.outer", STATE_ON, {ATTR_ENTITY_ID: ["light.bowl", "group.inner"]}
+    )
+    hass.states.async_set(
+        "group.inner", STATE_ON, {ATTR_ENTITY_ID: ["light.ceiling", "group.outer"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert group.expand_entity_ids(hass, ["group.inner"]) == [
+        "light.ceiling",
+        "light.bowl",
+    ]
+    # The cycle is only detected once
+    group.expand_entity_ids(hass, ["group.outer", "group.inner"])
+    assert caplog.text.count("cycle of nested groups") == 1
+
+
+async def test_expand_entity_ids_cache_invalidation(hass):
+    """Test expanded groups are updated when the members of a group change."""
+    hass.states.async_set(
+        "group.outer", STATE_ON, {ATTR_ENTITY_ID: ["light.bowl", "group.inner"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.bowl"]
+
+    # Creating a missing nested group
+    hass.states.async_set("group.inner", STATE_ON, {ATTR_ENTITY_ID: ["light.ceiling"]})
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+
+    # Changing the state without changing the members keeps the expansion
+    with patch(
+        "homeassistant.components.group._expand_group",
+        wraps=group._expand_group,
+    ) as mock_expand:
+        hass.states.async_set(
+            "group.inner", STATE_OFF, {ATTR_ENTITY_ID: ["light.ceiling"]}
+        )
+        await hass.async_block_till_done()
+        group.expand_entity_ids(hass, ["group.outer"])
+        assert mock_expand.call_count == 0
+
+    # Changing the members of a nested group
+    hass.states.async_set(
+        "group.inner", STATE_OFF, {ATTR_ENTITY_ID: ["light.ceiling", "light.lamp"]}
+    )
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.ceiling",
+        "light.lamp",
+    ]
+
+    # Removing a nested group
+    hass.states.async_remove("group.inner")
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.bowl"]
+
+
+async def test_expand_entity_ids_from_thread(hass):
+    """Test expand_entity_ids outside of the event loop does not use the cache."""
+    hass.states.async_set("group.outer", STATE_ON, {ATTR_ENTITY_ID: ["light.bowl"]})
+
+    assert await hass.async_add_executor_job(
+        group.expand_entity_ids, hass, ["group.outer"]
+    ) == ["light.bowl"]
+    assert group.EXPANSION_CACHE_KEY not in hass.data
+
+
 async def test_expand_entity_ids_ignores_non_strings(hass):
     """Test that non string elements in lists are ignored."""
     assert [] == group.expand_entity_ids(hass, [5, True])
@@ -6,7 +6,12 @@ import pytest
 
 import homeassistant.components.automation as automation
 from homeassistant.components.homeassistant.triggers import state as state_trigger
-from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ENTITY_MATCH_ALL,
+    MATCH_ALL,
+    SERVICE_TURN_OFF,
+)
 from homeassistant.core import Context
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
@@ -1553,3 +1558,98 @@ async def test_variables_priority(hass, calls):
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_triggers_share_entity_tracking(hass, calls):
+    """Test state triggers of the same entity share the tracking and matchers."""
+    with patch.object(
+        state_trigger,
+        "async_track_state_change_event",
+        wraps=state_trigger.async_track_state_change_event,
+    ) as mock_track:
+        assert await async_setup_component(
+            hass,
+            automation.DOMAIN,
+            {
+                automation.DOMAIN: [
+                    {
+                        "trigger": {
+                            "platform": "state",
+                            "entity_id": "test.entity",
+                            "to": "world",
+                        },
+                        "action": {"service": "test.automation"},
+                    }
+                    for _ in range(3)
+                ]
+                + [
+                    {
+                        "trigger": {
+                            "platform": "state",
+                            "entity_id": "test.entity",
+                            "from": "world",
+                        },
+                        "action": {"service": "test.automation"},
+                    }
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert mock_track.call_count == 1
+    dispatcher = hass.data[state_trigger.DATA_STATE_TRIGGER_DISPATCHER]
+    assert len(dispatcher._matchers["test.entity"]) == 2
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test.entity" not in dispatcher._matchers
+    assert "test.entity" not in dispatcher._unsub_track
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
+async def test_trigger_error_does_not_stop_other_triggers(hass, caplog):
+    """Test a failing trigger action doesn't stop the other triggers of an entity."""
+    dispatcher = state_trigger._async_get_dispatcher(hass)
+    calls = []
+
+    def failing_action(event, old_value, new_value):
+        """Raise an error."""
+        raise ValueError("Boom")
+
+    remove_failing = dispatcher.async_add(
+        ["test.entity"], None, MATCH_ALL, MATCH_ALL, False, failing_action
+    )
+    remove_working = dispatcher.async_add(
+        ["test.entity"],
+        None,
+        MATCH_ALL,
+        MATCH_ALL,
+        False,
+        lambda *args: calls.append(args[1:]),
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+
+    assert calls == [("hello", "world")]
+    assert "Error while processing state change for test.entity" in caplog.text
+
+    remove_failing()
+    remove_working()
+    assert dispatcher._matchers == {}
+    assert dispatcher._unsub_track == {}
@@ -0,0 +1,123 @@
+"""Test the http request statistics middleware."""
+import asyncio
+from http import HTTPStatus
+import time
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http import (
+    HomeAssistantView,
+    async_get_request_stats,
+    async_reset_request_stats,
+)
+from homeassistant.components.http.request_stats import setup_request_stats
+from homeassistant.core import executor_job_timer_cv
+from homeassistant.setup import async_setup_component
+
+
+class SlowView(HomeAssistantView):
+    """View that does blocking work in the executor."""
+
+    url = "/api/slow/{name}"
+    name = "api:slow"
+    requires_auth = False
+
+    async def get(self, request: web.Request, name: str) -> web.Response:
+        """Return a response after blocking in the executor."""
+        await request.app["hass"].async_add_executor_job(time.sleep, 0.01)
+        if name == "missing":
+            raise web.HTTPNotFound()
+        return self.json_message(f"Hello {name}")
+
+
+@pytest.fixture
+async def stats_client(hass, hass_client_no_auth):
+    """Return a client for the http server with a slow view."""
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_view(SlowView)
+    return await hass_client_no_auth()
+
+
+async def test_request_stats(hass, stats_client):
+    """Test requests are accounted for per route."""
+    for name in ("paulus", "balloob"):
+        resp = await stats_client.get(f"/api/slow/{name}")
+        assert resp.status == HTTPStatus.OK
+    resp = await stats_client.get("/api/slow/missing")
+    assert resp.status == HTTPStatus.NOT_FOUND
+    resp = await stats_client.get("/does/not/exist")
+    assert resp.status == HTTPStatus.NOT_FOUND
+    for method in ("PATCH", "PROPFIND"):
+        resp = await stats_client.request(method, "/api/slow/paulus")
+        assert resp.status == HTTPStatus.METHOD_NOT_ALLOWED
+
+    stats = async_get_request_stats(hass)
+    route_stats = stats["GET /api/slow/{name}"]
+    assert route_stats["count"] == 3
+    assert route_stats["statuses"] == {200: 2, 404: 1}
+    assert route_stats["bytes"] > 0
+    assert route_stats["executor_total"] >= 0.03
+    assert route_stats["latency_total"] >= route_stats["executor_total"]
+    assert route_stats["latency_max"] >= 0.01
+    assert sum(route_stats["latency_buckets"].values()) == 3
+    assert stats["* <unmatched>"]["statuses"] == {404: 1, 405: 2}
+    assert len(stats) == 2
+
+    async_reset_request_stats(hass)
+    assert async_get_request_stats(hass) == {}
+
+
+async def test_request_stats_without_http(hass):
+    """Test the statistics are empty when the http server is not set up."""
+    assert async_get_request_stats(hass) == {}
+    async_reset_request_stats(hass)
+
+
+async def test_request_stats_server_error(aiohttp_client):
+    """Test requests raising an unexpected error count as a server error."""
+
+    async def handler(request):
+        """Raise an unexpected error."""
+        assert executor_job_timer_cv.get().total == 0
+        raise ValueError
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    setup_request_stats(app)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/")
+    assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert app["ha_request_stats"][("GET", "/")].statuses == {500: 1}
+
+
+async def test_request_stats_tasks_outliving_request(hass, aiohttp_client):
+    """Test executor jobs of tasks outliving the request are not recorded."""
+    release = asyncio.Event()
+    job_timers = []
+
+    async def background_task():
+        """Run an executor job after the request has finished."""
+        await release.wait()
+        job_timers.append(executor_job_timer_cv.get())
+        await hass.async_add_executor_job(time.sleep, 0.01)
+
+    async def handler(request):
+        """Start a task and return right away."""
+        hass.async_create_task(background_task())
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    setup_request_stats(app)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/")
+    assert resp.status == HTTPStatus.OK
+    release.set()
+    await hass.async_block_till_done()
+
+    assert not job_timers[0].active
+    assert job_timers[0].total == 0
+    assert app["ha_request_stats"][("GET", "/")].executor_total == 0
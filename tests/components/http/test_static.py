@@ -0,0 +1,216 @@
+"""The tests for http static files."""
+import gzip
+from http import HTTPStatus
+import os
+from unittest.mock import patch
+
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_RANGE,
+    ETAG,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
+    RANGE,
+    VARY,
+)
+from aiohttp.test_utils import make_mocked_request
+import pytest
+
+from homeassistant.components.http.static import CACHE_HEADERS, _MemoryFile
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_client(hass, hass_client_no_auth, tmp_path):
+    """Return a client for a static path backed by a temporary directory."""
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/static_test", str(tmp_path))
+    return await hass_client_no_auth()
+
+
+async def test_serve_file_from_memory(hass, static_client, tmp_path):
+    """Test small files are served with cache headers and an ETag."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+
+    resp = await static_client.get("/static_test/app.js")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "console.log('hello');"
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADERS[CACHE_CONTROL]
+    assert resp.content_type.endswith("/javascript")
+    assert VARY not in resp.headers
+    etag = resp.headers[ETAG]
+
+    with patch(
+        "homeassistant.components.http.static._MemoryFile",
+        side_effect=AssertionError("file read from disk"),
+    ):
+        resp = await static_client.get("/static_test/app.js")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == "console.log('hello');"
+
+        resp = await static_client.get(
+            "/static_test/app.js", headers={IF_NONE_MATCH: etag}
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+
+
+async def test_serve_modified_file(hass, static_client, tmp_path):
+    """Test a file that changed on disk is loaded again."""
+    app_js = tmp_path / "app.js"
+    app_js.write_text("old")
+
+    resp = await static_client.get("/static_test/app.js")
+    assert await resp.text() == "old"
+    etag = resp.headers[ETAG]
+
+    app_js.write_text("newer")
+    os.utime(app_js, ns=(0, 10**9))
+
+    resp = await static_client.get("/static_test/app.js")
+    assert await resp.text() == "newer"
+    assert resp.headers[ETAG] != etag
+
+    app_js.unlink()
+    resp = await static_client.get("/static_test/app.js")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_serve_precompressed_siblings(hass, static_client, tmp_path):
+    """Test precompressed siblings are served when the client accepts them."""
+    (tmp_path / "app.js").write_text("plain")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"gzipped"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={ACCEPT_ENCODING: "gzip"}
+    )
+    assert resp.headers[CONTENT_ENCODING] == "gzip"
+    assert resp.headers[VARY] == ACCEPT_ENCODING
+    assert await resp.text() == "gzipped"
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    assert CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == "plain"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,content_encoding",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("br;q=0, *", "gzip"),
+        ("*;q=0.1", "br"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_precompressed_encoding_preference(tmp_path, accept_encoding, content_encoding):
+    """Test the encoding is negotiated using the quality values."""
+    app_js = tmp_path / "app.js"
+    app_js.write_text("plain")
+    (tmp_path / "app.js.gz").write_bytes(b"gzipped")
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    memory_file = _MemoryFile(app_js, app_js.stat())
+
+    resp = memory_file.response(
+        make_mocked_request(
+            "GET", "/app.js", headers={ACCEPT_ENCODING: accept_encoding}
+        )
+    )
+    assert resp.headers.get(CONTENT_ENCODING) == content_encoding
+    assert (
+        resp.body
+        == {None: b"plain", "gzip": b"gzipped", "br": b"brotli"}[content_encoding]
+    )
+
+
+async def test_serve_last_modified(hass, static_client, tmp_path):
+    """Test files are served with Last-Modified and honor If-Modified-Since."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+
+    resp = await static_client.get("/static_test/app.js")
+    assert resp.status == HTTPStatus.OK
+    last_modified = resp.headers[LAST_MODIFIED]
+
+    resp = await static_client.get(
+        "/static_test/app.js", headers={IF_MODIFIED_SINCE: last_modified}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[LAST_MODIFIED] == last_modified
+
+    resp = await static_client.get(
+        "/static_test/app.js",
+        headers={IF_MODIFIED_SINCE: "Thu, 01 Jan 1970 00:00:00 GMT"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "console.log('hello');"
+
+
+async def test_serve_range(hass, static_client, tmp_path):
+    """Test range requests of small files get partial content."""
+    (tmp_path / "audio.mp3").write_bytes(b"0123456789")
+
+    resp = await static_client.get(
+        "/static_test/audio.mp3", headers={RANGE: "bytes=2-5"}
+    )
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert resp.headers[CONTENT_RANGE] == "bytes 2-5/10"
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADERS[CACHE_CONTROL]
+    assert await resp.read() == b"2345"
+
+
+async def test_serve_compressed_file(hass, static_client, tmp_path):
+    """Test a requested compressed file is served with its encoding."""
+    (tmp_path / "data.json.gz").write_bytes(gzip.compress(b'{"hello": "world"}'))
+
+    resp = await static_client.get("/static_test/data.json.gz")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[CONTENT_ENCODING] == "gzip"
+    assert resp.content_type == "application/json"
+    assert await resp.json() == {"hello": "world"}
+
+
+async def test_serve_large_file_from_disk(hass, static_client, tmp_path):
+    """Test files above the memory limit are streamed from disk."""
+    (tmp_path / "large.bin").write_bytes(b"\0" * 1024)
+
+    with patch("homeassistant.components.http.static.MAX_MEMORY_FILE_SIZE", 512):
+        resp = await static_client.get("/static_test/large.bin")
+
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADERS[CACHE_CONTROL]
+    assert len(await resp.read()) == 1024
+
+
+async def test_memory_cache_is_bounded(hass, static_client, tmp_path):
+    """Test the least recently used files are dropped from memory."""
+    for name in ("one", "two", "three"):
+        (tmp_path / name).write_bytes(name.encode() * 100)
+
+    with patch("homeassistant.components.http.static.MAX_MEMORY_CACHE_SIZE", 1000):
+        for name in ("one", "two", "one", "three"):
+            resp = await static_client.get(f"/static_test/{name}")
+            assert resp.status == HTTPStatus.OK
+
+    resource = next(
+        resource
+        for resource in hass.http.app.router.resources()
+        if resource.canonical == "/static_test"
+    )
+    assert [path.name for path in resource._memory_files] == ["one", "three"]
+
+
+async def test_serve_missing_file(hass, static_client, tmp_path):
+    """Test requesting missing files or files outside the directory."""
+    resp = await static_client.get("/static_test/missing.js")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    (tmp_path / "sub").mkdir()
+    resp = await static_client.get("/static_test/sub/../../secret")
+    assert resp.status == HTTPStatus.NOT_FOUND
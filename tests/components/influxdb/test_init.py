@@ -4,6 +4,7 @@ import datetime
 from http import HTTPStatus
 from unittest.mock import MagicMock, Mock, call, patch
 
+from aiohttp import web
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -15,7 +16,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_STANDBY,
 )
-from homeassistant.core import split_entity_id
+from homeassistant.core import State, split_entity_id
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -1793,3 +1794,174 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+async def test_line_protocol_gzip(hass, aiohttp_server, socket_enabled):
+    """Test writing gzip compressed line protocol to a local InfluxDB stand-in."""
+    writes = []
+
+    async def handle_write(request):
+        """Record a write, aiohttp decompresses the body."""
+        writes.append(
+            (
+                request.headers.get("Content-Encoding"),
+                request.query.get("precision"),
+                await request.text(),
+            )
+        )
+        return web.Response(status=HTTPStatus.NO_CONTENT)
+
+    app = web.Application()
+    app.router.add_post("/write", handle_write)
+    server = await aiohttp_server(app)
+
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": server.port,
+            "gzip": True,
+            "line_protocol": True,
+            "precision": "ms",
+            "tags": {"home": "main house"},
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+
+    time_fired = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    for entity_id, value, attributes in (
+        ("sensor.outside", "15.6", {"unit_of_measurement": "°C"}),
+        ("switch.tv", STATE_ON, {"friendly_name": 'TV, "living"'}),
+    ):
+        state = State(entity_id, value, attributes)
+        handler_method(MagicMock(data={"new_state": state}, time_fired=time_fired))
+    await hass.async_add_executor_job(hass.data[influxdb.DOMAIN].block_till_done)
+
+    lines = "".join(body for _, _, body in writes[1:]).splitlines()
+    assert lines == [
+        "°C,domain=sensor,entity_id=outside,home=main\\ house value=15.6 "
+        "1640995200000",
+        'switch.tv,domain=switch,entity_id=tv,home=main\\ house state="on",'
+        'value=1.0,friendly_name_str="TV, \\"living\\"" 1640995200000',
+    ]
+    assert {(encoding, precision) for encoding, precision, _ in writes} == {
+        ("gzip", "ms")
+    }
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.DEFAULT_API_VERSION], indirect=["mock_client"]
+)
+async def test_line_protocol_spill(hass, mock_client, tmp_path):
+    """Test lines which could not be written are written when InfluxDB is back."""
+    hass.config.config_dir = str(tmp_path)
+    spill_path = tmp_path / influxdb.SPILL_FILENAME
+    handler_method = await _setup(
+        hass,
+        mock_client,
+        {"line_protocol": True, "measurement_attr": "entity_id"},
+        _get_write_api_mock_v1,
+    )
+    write_api = _get_write_api_mock_v1(mock_client)
+    time_fired = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def fire_event(value):
+        state = State("fake.entity", value)
+        handler_method(MagicMock(data={"new_state": state}, time_fired=time_fired))
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api.side_effect = OSError("down")
+    fire_event("1")
+    fire_event("2")
+
+    assert spill_path.read_text() == (
+        "fake.entity,domain=fake,entity_id=entity value=1.0 1640995200000000000\n"
+        "fake.entity,domain=fake,entity_id=entity value=2.0 1640995200000000000\n"
+    )
+
+    write_api.side_effect = None
+    write_api.reset_mock()
+    fire_event("3")
+
+    assert write_api.call_args_list == [
+        call(
+            ["fake.entity,domain=fake,entity_id=entity value=3.0 1640995200000000000"],
+            time_precision=None,
+            protocol="line",
+        ),
+        call(
+            [
+                "fake.entity,domain=fake,entity_id=entity value=1.0 1640995200000000000",
+                "fake.entity,domain=fake,entity_id=entity value=2.0 1640995200000000000",
+            ],
+            time_precision=None,
+            protocol="line",
+        ),
+    ]
+    assert not spill_path.exists()
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.API_VERSION_2], indirect=["mock_client"]
+)
+async def test_line_protocol_spill_v2(hass, mock_client, tmp_path):
+    """Test lines which could not be written to InfluxDB 2.x are spilled."""
+    hass.config.config_dir = str(tmp_path)
+    spill_path = tmp_path / influxdb.SPILL_FILENAME
+    handler_method = await _setup(
+        hass,
+        mock_client,
+        {**BASE_V2_CONFIG, "line_protocol": True, "measurement_attr": "entity_id"},
+        _get_write_api_mock_v2,
+    )
+    assert mock_client.return_value.write_api.call_args == call(
+        write_options=influxdb.SYNCHRONOUS
+    )
+    write_api = _get_write_api_mock_v2(mock_client)
+    time_fired = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def fire_event(value):
+        state = State("fake.entity", value)
+        handler_method(MagicMock(data={"new_state": state}, time_fired=time_fired))
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api.side_effect = OSError("down")
+    fire_event("1")
+
+    spilled = spill_path.read_text().splitlines()
+    assert len(spilled) == 1
+    assert spilled[0].startswith("fake.entity,domain=fake,entity_id=entity value=1.0")
+
+    write_api.side_effect = None
+    write_api.reset_mock()
+    fire_event("2")
+
+    assert write_api.call_count == 2
+    assert write_api.call_args == call(bucket=DEFAULT_BUCKET, record=spilled)
+    assert not spill_path.exists()
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.DEFAULT_API_VERSION], indirect=["mock_client"]
+)
+async def test_adaptive_batch_size(hass, mock_client):
+    """Test the batch size grows with fast writes and shrinks with slow writes."""
+    await _setup(hass, mock_client, {"max_batch_size": 250}, _get_write_api_mock_v1)
+    instance = hass.data[influxdb.DOMAIN]
+    assert instance.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+    instance.write_to_influxdb([{}] * 100)
+    assert instance.batch_size == 200
+    instance.write_to_influxdb([{}] * 200)
+    assert instance.batch_size == 250
+    # Batches which are not full do not grow the batch size
+    instance.write_to_influxdb([{}] * 10)
+    assert instance.batch_size == 250
+
+    with patch(f"{INFLUX_PATH}.time.monotonic", side_effect=[0, 10]):
+        instance.write_to_influxdb([{}] * 250)
+    assert instance.batch_size == 125
+    with patch(f"{INFLUX_PATH}.time.monotonic", side_effect=[0, 10]):
+        instance.write_to_influxdb([{}] * 125)
+    assert instance.batch_size == influxdb.BATCH_BUFFER_SIZE
@@ -1,11 +1,14 @@
 """Test the Profiler config flow."""
 from datetime import timedelta
+import json
 import os
 from unittest.mock import patch
 
 from homeassistant.components.profiler import (
     CONF_SECONDS,
+    SERVICE_DUMP_HTTP_REQUEST_STATS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_SETUP_TIMELINE,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
@@ -15,6 +18,9 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -177,11 +183,84 @@ async def test_log_scheduled(hass, caplog):
 
     assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED)
 
+    async_call_later(hass, 300, callback(lambda _: None))
     await hass.services.async_call(DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED, {})
     await hass.async_block_till_done()
 
     assert "Scheduled" in caplog.text
+    assert "Scheduled timer at" in caplog.text
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_dump_setup_timeline(hass, tmpdir):
+    """Test we can write the setup timeline as a Chrome trace."""
+    test_dir = tmpdir.mkdir("profiles")
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_SETUP_TIMELINE)
+
+    last_filename = None
+
+    def _mock_path(filename):
+        nonlocal last_filename
+        last_filename = f"{test_dir}/{filename}"
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(DOMAIN, SERVICE_DUMP_SETUP_TIMELINE, {})
+        await hass.async_block_till_done()
+
+    with open(last_filename, encoding="utf-8") as trace_file:
+        trace = json.load(trace_file)
+
+    names = [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert "profiler import" in names
+    assert "profiler setup_entry" in names
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_dump_http_request_stats(hass, tmpdir, hass_client_no_auth):
+    """Test we can write the http request statistics."""
+    test_dir = tmpdir.mkdir("profiles")
+
+    assert await async_setup_component(hass, "http", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_HTTP_REQUEST_STATS)
+
+    client = await hass_client_no_auth()
+    await client.get("/not_existing")
+
+    last_filename = None
+
+    def _mock_path(filename):
+        nonlocal last_filename
+        last_filename = f"{test_dir}/{filename}"
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_HTTP_REQUEST_STATS, {}, blocking=True
+        )
+
+    with open(last_filename, encoding="utf-8") as stats_file:
+        stats = json.load(stats_file)
+
+    assert stats["* <unmatched>"]["statuses"] == {"404": 1}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -51,6 +51,7 @@ from homeassistant.const import (
     STATE_NOT_HOME,
     STATE_OFF,
     STATE_ON,
+    STATE_UNAVAILABLE,
     STATE_UNLOCKED,
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
@@ -146,6 +147,78 @@ async def test_view_default_namespace(client, sensor_entities):
     )
 
 
+async def test_collect_on_scrape(hass, hass_client, sensor_entities):
+    """Test collecting the metrics of the states when scraping them."""
+    prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
+    config = {
+        prometheus.CONF_PROM_NAMESPACE: "",
+        prometheus.CONF_COLLECT_ON_SCRAPE: True,
+        prometheus.CONF_CACHE_TTL: 10,
+    }
+    assert await async_setup_component(
+        hass, prometheus.DOMAIN, {prometheus.DOMAIN: config}
+    )
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=1000):
+        body = await generate_latest_metrics(client)
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+    assert not any(line.startswith("state_change") for line in body)
+
+    hass.states.async_set("sensor.radio_energy", STATE_UNAVAILABLE)
+
+    # The metrics are cached
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=1009):
+        body = await generate_latest_metrics(client)
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=1010):
+        body = await generate_latest_metrics(client)
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="None"} 0.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_gzip(client, sensor_entities):
+    """Test the metrics are compressed when the client accepts it."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert "# HELP python_info Python platform information" in await resp.text()
+
+    for accept_encoding in ("identity", "gzip;q=0"):
+        resp = await client.get(
+            prometheus.API_ENDPOINT, headers={"Accept-Encoding": accept_encoding}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert "content-encoding" not in resp.headers
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert "# HELP python_info Python platform information" in await resp.text()
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(client, sensor_entities):
     """Test prometheus metrics for sensors with a unit."""
@@ -7,7 +7,10 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_RUN_COUNTS,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -35,7 +38,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -59,6 +62,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -752,6 +759,127 @@ async def test_trace_no_traces(hass, hass_ws_client, domain):
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_level_off(hass, hass_ws_client, domain):
+    """Test a script or automation with tracing turned off is not traced."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"level": "off"}
+    )
+
+    client = await hass_ws_client()
+
+    # Trigger "sun" automation / script once
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    # List traces
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+
+
+@pytest.mark.parametrize(
+    "domain, prefix", [("automation", "action"), ("script", "sequence")]
+)
+async def test_trace_level_summary_sampled(hass, hass_ws_client, domain, prefix):
+    """Test sampling summary traces of a script or automation."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"variables": {"brightness": 128}},
+            {"event": "some_event"},
+        ],
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config],
+        trace_config={"level": "summary", "sample_every": 3},
+    )
+
+    client = await hass_ws_client()
+
+    # Trigger "sun" automation / script 7 times, runs 1, 4 and 7 are traced
+    for _ in range(7):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    # List traces
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == 3
+
+    # Get trace, no variables are recorded
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": traces[-1]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert set(trace["trace"]) >= {f"{prefix}/0", f"{prefix}/1"}
+    for elements in trace["trace"].values():
+        for element in elements:
+            assert "changed_variables" not in element
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_run_count_cleared_on_reload(hass, domain):
+    """Test sampling run counts are dropped when a script or automation is removed."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config],
+        trace_config={"level": "summary", "sample_every": 3},
+    )
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert (domain, "sun") in hass.data[DATA_TRACE_RUN_COUNTS]
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={domain: {}},
+    ):
+        await hass.services.async_call(domain, "reload", blocking=True)
+        await hass.async_block_till_done()
+
+    assert (domain, "sun") not in hass.data[DATA_TRACE_RUN_COUNTS]
+
+
 @pytest.mark.parametrize(
     "domain, prefix, trigger, last_step, script_execution",
     [
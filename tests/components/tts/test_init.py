@@ -1,5 +1,8 @@
 """The tests for the TTS component."""
+import asyncio
+import hashlib
 from http import HTTPStatus
+import os
 from unittest.mock import PropertyMock, patch
 
 import pytest
@@ -740,3 +743,99 @@ async def test_tags_with_wave(hass, demo_provider):
     )
 
     assert tagged_data != demo_data
+
+
+async def test_concurrent_requests_share_provider_call(
+    hass, hass_ws_client, demo_provider
+):
+    """Test concurrent requests for the same speech only hit the provider once."""
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    tts_manager = hass.data[tts.DOMAIN]
+    with patch(
+        "homeassistant.components.demo.tts.DemoProvider.get_tts_audio",
+        side_effect=demo_provider.get_tts_audio,
+    ) as mock_get_tts_audio:
+        urls = await asyncio.gather(
+            *(
+                tts_manager.async_get_url_path("demo", "There is someone at the door.")
+                for _ in range(12)
+            )
+        )
+
+    assert len(mock_get_tts_audio.mock_calls) == 1
+    assert set(urls) == {
+        "/api/tts_proxy/42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    }
+
+    await tts_manager.async_get_url_path("demo", "There is someone at the door.")
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "tts/cache_info"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["misses"] == 1
+    assert msg["result"]["coalesced"] == 11
+    assert msg["result"]["memory_hits"] == 1
+    assert msg["result"]["memory_entries"] == 1
+    assert msg["result"]["pending"] == 0
+
+
+async def test_memory_cache_evicts_least_recently_used(hass):
+    """Test the memory cache stays within its byte budget."""
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    tts_manager = hass.data[tts.DOMAIN]
+    entry_size = len(tts_manager.providers["demo"].get_tts_audio("bla", "en")[1])
+    tts_manager.memory_cache_size = entry_size * 2
+
+    with patch("homeassistant.components.tts.SpeechManager.write_tags") as mock_tags:
+        mock_tags.side_effect = lambda *args: args[1]
+        await tts_manager.async_get_url_path("demo", "first", cache=False)
+        await tts_manager.async_get_url_path("demo", "second", cache=False)
+        # Touch the first message so the second is the least recently used
+        await tts_manager.async_get_url_path("demo", "first", cache=False)
+        await tts_manager.async_get_url_path("demo", "third", cache=False)
+
+    remaining = [
+        entry[tts.MEM_CACHE_FILENAME] for entry in tts_manager.mem_cache.values()
+    ]
+    assert len(remaining) == 2
+    assert remaining[0].startswith(hashlib.sha1(b"first").hexdigest())
+    assert remaining[1].startswith(hashlib.sha1(b"third").hexdigest())
+
+    info = tts_manager.async_get_cache_info()
+    assert info["memory_evictions"] == 1
+    assert info["memory_bytes"] == entry_size * 2
+
+
+async def test_file_cache_quota_removes_oldest_files(hass, empty_cache_dir):
+    """Test files exceeding the disk quota are removed oldest first."""
+    data = b"\0" * (512 * 1024)
+    files = [
+        empty_cache_dir / f"{hashlib.sha1(message).hexdigest()}_en_-_demo.mp3"
+        for message in (b"old", b"older", b"newest")
+    ]
+    for mtime, cache_file in zip((200, 100, 300), files):
+        cache_file.write_bytes(data)
+        os.utime(cache_file, (mtime, mtime))
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache_dir_size": 1}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    assert not files[1].is_file()
+    assert files[0].is_file()
+    assert files[2].is_file()
+
+    info = hass.data[tts.DOMAIN].async_get_cache_info()
+    assert info["file_evictions"] == 1
+    assert info["file_entries"] == 2
+    assert info["file_bytes"] == len(data) * 2
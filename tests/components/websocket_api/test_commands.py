@@ -569,6 +569,36 @@ async def test_subscribe_requires_admin(websocket_client, hass_admin_user):
     assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
 
 
+async def test_http_request_stats(hass, websocket_client, hass_admin_user, hass_client):
+    """Test http/request_stats command."""
+    client = await hass_client()
+    resp = await client.get("/not_existing")
+    assert resp.status == 404
+
+    await websocket_client.send_json({"id": 6, "type": "http/request_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["* <unmatched>"]["count"] == 1
+    assert msg["result"]["* <unmatched>"]["statuses"] == {"404": 1}
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "http/request_stats", "reset": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["* <unmatched>"]["count"] == 1
+
+    await websocket_client.send_json({"id": 8, "type": "http/request_stats"})
+    msg = await websocket_client.receive_json()
+    assert "* <unmatched>" not in msg["result"]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "http/request_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     """Test we only get entities that we're allowed to see."""
     hass_admin_user.mock_policy({"entities": {"entity_ids": {"test.entity": True}}})
@@ -659,6 +689,91 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribing to compact state changes of entities."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.other", "off")
+    ctx = Context()
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red"},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "red"}, context=ctx)
+    msg = await websocket_client.receive_json()
+    state = hass.states.get("light.permitted")
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"s": "on", "lc": state.last_changed.timestamp(), "c": ctx.id}
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"brightness": 128}, context=ctx)
+    msg = await websocket_client.receive_json()
+    state = hass.states.get("light.permitted")
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"brightness": 128},
+                    "lu": state.last_updated.timestamp(),
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_permissions(hass, websocket_client, hass_admin_user):
+    """Test subscribing to all entities only sends permitted ones."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -0,0 +1,43 @@
+"""Test ZHA diagnostics."""
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.components.zha.core.const import DATA_ZHA, DATA_ZHA_GATEWAY
+
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+
+
+async def test_diagnostics_for_config_entry(hass, hass_client, config_entry, setup_zha):
+    """Test diagnostics for config entry."""
+    await setup_zha()
+    await hass.async_block_till_done()
+    gateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+    gateway.refresh_timings["00:0d:6f:00:0a:90:69:e7"] = {
+        "name": "FakeManufacturer FakeModel",
+        "completed": 1645000000.0,
+        "duration": 0.5,
+        "success": True,
+        "concurrency": 3,
+    }
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["config_entry"]["entry_id"] == config_entry.entry_id
+    assert diagnostics["config_entry"]["data"]["device"]["path"] == REDACTED
+    assert (
+        diagnostics["config_entry"]["options"]["custom_configuration"][
+            "zha_alarm_options"
+        ]["alarm_master_code"]
+        == REDACTED
+    )
+    assert diagnostics["device_refresh"] == {
+        "concurrency": gateway.refresh_concurrency,
+        "devices": {
+            "00:0d:6f:00:0a:90:69:e7": {
+                "name": "FakeManufacturer FakeModel",
+                "completed": 1645000000.0,
+                "duration": 0.5,
+                "success": True,
+                "concurrency": 3,
+            }
+        },
+    }
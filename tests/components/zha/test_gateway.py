@@ -1,13 +1,17 @@
 """Test ZHA Gateway."""
 import asyncio
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 import zigpy.profiles.zha as zha
 import zigpy.zcl.clusters.general as general
 import zigpy.zcl.clusters.lighting as lighting
 
+from homeassistant.components.zha.core.gateway import (
+    REFRESH_CONCURRENCY_MAX,
+    ZHAGateway,
+)
 from homeassistant.components.zha.core.group import GroupMember
 from homeassistant.components.zha.core.store import TOMBSTONE_LIFETIME
 from homeassistant.const import Platform
@@ -256,3 +260,68 @@ async def test_cleaning_up_storage(hass, zigpy_dev_basic, zha_dev_basic, hass_st
     await zha_gateway.zha_storage.async_save()
     await hass.async_block_till_done()
     assert not hass_storage["zha.storage"]["data"]["devices"]
+
+
+def _refresh_device_mock(ieee, mains_powered=True, available=True, last_seen=None):
+    """Return a ZHA device mock for background refresh tests."""
+    zha_device = MagicMock(
+        ieee=ieee,
+        is_mains_powered=mains_powered,
+        available=available,
+        last_seen=last_seen,
+    )
+    zha_device.name = ieee
+    zha_device.async_initialize = AsyncMock()
+    return zha_device
+
+
+async def test_initialize_devices_from_cache_then_refresh(hass, config_entry):
+    """Test devices initialize from cache before a prioritized live refresh."""
+    zha_gateway = ZHAGateway(hass, {}, config_entry)
+    now = time.time()
+    stale = _refresh_device_mock("stale", last_seen=now - 100)
+    recent = _refresh_device_mock("recent", last_seen=now)
+    offline = _refresh_device_mock("offline", available=False, last_seen=now)
+    battery = _refresh_device_mock("battery", mains_powered=False)
+    zha_gateway._devices = {dev.ieee: dev for dev in (stale, recent, offline, battery)}
+
+    refreshed = []
+
+    def _refresh(zha_device):
+        async def _initialize(from_cache):
+            refreshed.append(zha_device.ieee)
+
+        return _initialize
+
+    for dev in (stale, recent, offline):
+        dev.async_initialize.side_effect = _refresh(dev)
+
+    await zha_gateway.async_initialize_devices_and_entities()
+    assert refreshed == ["stale", "recent", "offline"]
+    await hass.async_block_till_done()
+
+    assert refreshed[3:] == ["recent", "stale", "offline"]
+    for dev in (stale, recent, offline):
+        assert dev.async_initialize.await_args_list == [
+            call(from_cache=True),
+            call(from_cache=False),
+        ]
+    battery.async_initialize.assert_awaited_once_with(from_cache=True)
+    assert set(zha_gateway.refresh_timings) == {"stale", "recent", "offline"}
+    assert all(timing["success"] for timing in zha_gateway.refresh_timings.values())
+
+
+async def test_refresh_concurrency_adapts(hass, config_entry):
+    """Test the refresh concurrency grows when fast and backs off on failure."""
+    zha_gateway = ZHAGateway(hass, {}, config_entry)
+    devices = [_refresh_device_mock(f"dev_{idx}") for idx in range(4)]
+    zha_gateway._devices = {dev.ieee: dev for dev in devices}
+
+    await zha_gateway.async_refresh_mains_powered_devices()
+    assert zha_gateway.refresh_concurrency == REFRESH_CONCURRENCY_MAX
+
+    devices[0].async_initialize.side_effect = asyncio.TimeoutError
+    zha_gateway._devices = {devices[0].ieee: devices[0]}
+    await zha_gateway.async_refresh_mains_powered_devices()
+    assert zha_gateway.refresh_concurrency == REFRESH_CONCURRENCY_MAX // 2
+    assert zha_gateway.refresh_timings["dev_0"]["success"] is False
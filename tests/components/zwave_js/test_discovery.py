@@ -1,10 +1,17 @@
 """Test discovery of entities for device-specific schemas for the Z-Wave JS integration."""
+from unittest.mock import patch
+
 import pytest
 
+from homeassistant.components.zwave_js import discovery
 from homeassistant.components.zwave_js.discovery import (
+    DISCOVERY_SCHEMAS,
     FirmwareVersionRange,
     ZWaveDiscoverySchema,
     ZWaveValueDiscoverySchema,
+    async_get_node_schema_positions,
+    async_get_value_schemas,
+    check_value,
 )
 from homeassistant.components.zwave_js.discovery_data_template import (
     DynamicCurrentTempClimateDataTemplate,
@@ -93,3 +100,34 @@ async def test_dynamic_climate_data_discovery_template_failure(hass, multisensor
         DynamicCurrentTempClimateDataTemplate().resolve_data(
             node.values[f"{node.node_id}-49-0-Ultraviolet"]
         )
+
+
+async def test_value_schema_index(hass, multisensor_6, ge_12730):
+    """Test the schema index returns all schemas matching a value in order."""
+    for node in (multisensor_6, ge_12730):
+        for value in node.values.values():
+            positions = [position for position, _ in async_get_value_schemas(value)]
+            assert positions == sorted(positions)
+            assert {
+                position
+                for position, schema in enumerate(DISCOVERY_SCHEMAS)
+                if check_value(value, schema.primary_value)
+            } <= set(positions)
+
+
+async def test_node_schema_positions_cached(hass, climate_heatit_z_trm2fx):
+    """Test the node checks and the firmware version are evaluated once per node."""
+    discovery._NODE_SCHEMA_POSITIONS.clear()
+
+    with patch.object(
+        discovery, "AwesomeVersion", wraps=discovery.AwesomeVersion
+    ) as awesome_version:
+        positions = async_get_node_schema_positions(climate_heatit_z_trm2fx)
+        assert async_get_node_schema_positions(climate_heatit_z_trm2fx) is positions
+
+    assert awesome_version.call_count == 1
+    assert [
+        DISCOVERY_SCHEMAS[position].hint
+        for position in sorted(positions)
+        if DISCOVERY_SCHEMAS[position].firmware_version_range is not None
+    ] == ["dynamic_current_temp"]
@@ -679,6 +679,90 @@ async def test_not_condition_with_template(hass):
     assert not test(hass)
 
 
+async def test_untraced_nested_conditions(hass):
+    """Test nested conditions are evaluated without tracing when it is off."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "state", "entity_id": "sensor.temperature", "state": "100"},
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "below": 110,
+                    },
+                    {
+                        "condition": "or",
+                        "conditions": [
+                            {"condition": "template", "value_template": "{{ off }}"},
+                            {
+                                "condition": "not",
+                                "conditions": [
+                                    {
+                                        "condition": "state",
+                                        "entity_id": "sensor.temperature",
+                                        "state": "90",
+                                    }
+                                ],
+                            },
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    assert len(test.flat_checks) == 3
+
+    token = trace.trace_level_set(trace.TraceLevel.OFF)
+    try:
+        with pytest.raises(ConditionError) as err:
+            test(hass)
+        assert "unknown entity sensor.temperature" in str(err.value)
+
+        hass.states.async_set("sensor.temperature", 100)
+        with patch.object(hass.states, "get", wraps=hass.states.get) as mock_get:
+            assert test(hass)
+        assert mock_get.call_count == 1
+
+        hass.states.async_set("sensor.temperature", 90)
+        assert not test(hass)
+        assert trace.trace_get(clear=False) == {}
+    finally:
+        trace.trace_level_reset(token)
+
+
+async def test_compile_and(hass):
+    """Test compiling a list of conditions into one checker."""
+    checks = []
+    for config in (
+        {"condition": "state", "entity_id": "sensor.temperature", "state": "100"},
+        {
+            "condition": "and",
+            "conditions": [
+                {"condition": "template", "value_template": "{{ true }}"},
+                {"condition": "template", "value_template": "{{ 1 / 0 }}"},
+            ],
+        },
+    ):
+        config = cv.CONDITION_SCHEMA(config)
+        config = await condition.async_validate_condition_config(hass, config)
+        checks.append(await condition.async_from_config(hass, config))
+
+    check_all = condition.async_compile_and(checks)
+
+    hass.states.async_set("sensor.temperature", 90)
+    assert not check_all(hass)
+
+    hass.states.async_set("sensor.temperature", 100)
+    with pytest.raises(ConditionError):
+        check_all(hass)
+
+
 async def test_time_window(hass):
     """Test time condition windows."""
     sixam = "06:00:00"
@@ -20,6 +20,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_wheel,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -129,6 +130,98 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_time_timer_wheel(hass):
+    """Test point in time listeners share the timer wheel."""
+    runs = []
+    now = dt_util.utcnow()
+    first = now + timedelta(hours=1)
+    second = now + timedelta(hours=2)
+
+    scheduled_before = len(hass.loop._scheduled)
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append(1)), second)
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(2)), second
+    )
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append(3)), first)
+
+    # A single event loop timer is armed for all listeners
+    assert len(hass.loop._scheduled) - scheduled_before <= 2
+    wheel = async_get_timer_wheel(hass)
+    assert len(wheel) == 3
+    assert [point for point, _ in wheel.async_pending_timers()] == [
+        first,
+        second,
+        second,
+    ]
+
+    unsub()
+    assert len(wheel) == 2
+
+    async_fire_time_changed(hass, second)
+    await hass.async_block_till_done()
+    assert runs == [3, 1]
+    assert len(wheel) == 0
+
+
+async def test_track_point_in_time_reschedule_churn(hass):
+    """Test cancelling and rescheduling in the same second reuses the bucket."""
+    runs = []
+    point = dt_util.utcnow().replace(microsecond=0) + timedelta(minutes=5)
+    wheel = async_get_timer_wheel(hass)
+
+    for offset in range(10):
+        unsub = async_track_point_in_utc_time(
+            hass,
+            callback(lambda x: runs.append(1)),
+            point + timedelta(milliseconds=offset),
+        )
+        if offset < 9:
+            unsub()
+
+    assert len(wheel) == 1
+    assert len(wheel._bucket_heap) == 1
+
+    async_fire_time_changed(hass, point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [1]
+    assert wheel._bucket_heap == []
+    assert wheel._buckets == {}
+
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(2)), point + timedelta(minutes=1)
+    )
+    unsub()
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(3)), point + timedelta(minutes=2)
+    )
+    async_fire_time_changed(hass, point + timedelta(minutes=3))
+    await hass.async_block_till_done()
+    assert runs == [1, 3]
+    assert wheel._bucket_heap == []
+    assert wheel._buckets == {}
+
+
+async def test_track_point_in_time_cancel_while_firing(hass):
+    """Test a listener cancelled by a listener due at the same time."""
+    runs = []
+    now = dt_util.utcnow()
+    point = now + timedelta(minutes=5)
+
+    @callback
+    def cancel_other(_):
+        runs.append("cancel")
+        unsub()
+
+    async_track_point_in_utc_time(hass, cancel_other, point)
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("cancelled")), point
+    )
+
+    async_fire_time_changed(hass, point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["cancel"]
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 import asyncio
 from contextlib import contextmanager
+from copy import deepcopy
 from datetime import timedelta
 from functools import reduce
 import logging
@@ -29,6 +30,7 @@ from homeassistant.helpers import (
     config_validation as cv,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -269,6 +271,69 @@ async def test_calling_service_basic(hass, caplog):
     )
 
 
+async def test_calling_service_prepared_once(hass):
+    """Test service calls without templates are only prepared on the first run."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "service": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            {
+                "service": "test.script",
+                "data": {"hello": "{{ greeting }}"},
+            },
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as prepare_call:
+        await script_obj.async_run(MappingProxyType({"greeting": "world"}), Context())
+        await script_obj.async_run(MappingProxyType({"greeting": "moon"}), Context())
+        await hass.async_block_till_done()
+
+    assert len(prepare_call.mock_calls) == 3
+    assert [call.data for call in calls] == [
+        {"hello": "world", "entity_id": ["light.kitchen"]},
+        {"hello": "world"},
+        {"hello": "world", "entity_id": ["light.kitchen"]},
+        {"hello": "moon"},
+    ]
+
+
+async def test_calling_service_prepared_data_not_shared(hass):
+    """Test service handlers modifying the data don't affect later runs."""
+    calls = []
+
+    @callback
+    def mock_service(call):
+        """Modify the nested service data."""
+        calls.append(deepcopy(dict(call.data)))
+        call.data["data"]["title"] = "modified"
+        call.data["data"]["targets"].append("modified")
+
+    hass.services.async_register("test", "script", mock_service)
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "service": "test.script",
+            "data": {"data": {"title": "hello", "targets": ["phone"]}},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert calls == [{"data": {"title": "hello", "targets": ["phone"]}}] * 2
+
+
 async def test_calling_service_template(hass):
     """Test the calling of a service."""
     context = Context()
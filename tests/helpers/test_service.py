@@ -567,6 +567,70 @@ async def test_call_with_one_of_required_features(hass, mock_entities):
     assert all(entity in actual for entity in expected)
 
 
+async def test_call_with_platform_batch_handler(hass, mock_entities):
+    """Test platforms can handle a service call for all entities at once."""
+    test_service_mock = AsyncMock(return_value=None)
+    batch_handler = AsyncMock(return_value=True)
+    await service.entity_service_call(
+        hass,
+        [
+            Mock(
+                entities=mock_entities,
+                platform=Mock(async_handle_entity_service_batch=batch_handler),
+            )
+        ],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.bedroom"]},
+        ),
+    )
+
+    assert test_service_mock.call_count == 0
+    assert batch_handler.call_count == 1
+    args = batch_handler.call_args[0]
+    assert args[0] is hass
+    assert sorted(entity.entity_id for entity in args[1]) == [
+        "light.bedroom",
+        "light.kitchen",
+    ]
+    assert args[2] is test_service_mock
+
+
+async def test_call_with_platform_batch_handler_fallback(hass, mock_entities):
+    """Test the service is called per entity if the batch handler declines."""
+    test_service_mock = AsyncMock(return_value=None)
+    batch_handler = AsyncMock(return_value=False)
+    await service.entity_service_call(
+        hass,
+        [
+            Mock(
+                entities=mock_entities,
+                platform=Mock(async_handle_entity_service_batch=batch_handler),
+            ),
+            Mock(
+                entities={
+                    "light.hallway": MockEntity(
+                        entity_id="light.hallway", available=True, should_poll=False
+                    )
+                }
+            ),
+        ],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.bedroom", "light.hallway"]},
+        ),
+    )
+
+    assert batch_handler.call_count == 1
+    assert test_service_mock.call_count == 3
+    actual = {call[0][0].entity_id for call in test_service_mock.call_args_list}
+    assert actual == {"light.kitchen", "light.bedroom", "light.hallway"}
+
+
 async def test_call_with_sync_func(hass, mock_entities):
     """Test invoking sync service calls."""
     test_service_mock = Mock(return_value=None)
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -388,6 +389,22 @@ def test_state_as_dict():
     assert state.as_dict() is as_dict_1
 
 
+def test_state_as_json():
+    """Test a State as JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    as_json_1 = state.as_json()
+    assert json.loads(as_json_1) == json.loads(json.dumps(state.as_dict()))
+    # 2nd time to verify cache
+    assert state.as_json() is as_json_1
+
+
+def test_state_as_json_not_allows_nan():
+    """Test a State with NaN attributes can't be serialized."""
+    state = ha.State("happy.happy", "on", {"pig": float("NaN")})
+    with pytest.raises(ValueError):
+        state.as_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -436,6 +453,61 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_time_tick_listener(hass):
+    """Test time tick listeners and the time changed event."""
+    ticks = []
+    events = []
+    all_events = []
+    now = dt_util.utcnow()
+
+    @ha.callback
+    def tick_listener(now):
+        """Mock time tick listener."""
+        ticks.append(now)
+
+    @ha.callback
+    def event_listener(event):
+        """Mock time changed listener."""
+        events.append(event)
+
+    @ha.callback
+    def all_events_listener(event):
+        """Mock listener for all events."""
+        all_events.append(event)
+
+    unsub_tick = hass.bus.async_listen_time_tick(tick_listener)
+    unsub_all = hass.bus.async_listen(MATCH_ALL, all_events_listener)
+
+    hass.bus.async_fire_time_changed(now)
+    await hass.async_block_till_done()
+    assert ticks == [now]
+    assert all_events == []
+
+    unsub_event = hass.bus.async_listen(EVENT_TIME_CHANGED, event_listener)
+    hass.bus.async_fire_time_changed(now)
+    await hass.async_block_till_done()
+    assert ticks == [now, now]
+    assert len(events) == 1
+    assert events[0].data[ATTR_NOW] == now
+    assert events[0].time_fired == now
+
+    # Time changed events fired on the bus reach the time tick listeners too
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: now})
+    await hass.async_block_till_done()
+    assert ticks == [now, now, now]
+    assert len(events) == 2
+    assert all_events == []
+
+    unsub_tick()
+    unsub_event()
+    unsub_all()
+
+    hass.bus.async_fire_time_changed(now)
+    await hass.async_block_till_done()
+    assert len(ticks) == 3
+    assert len(events) == 2
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -670,6 +742,27 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_json(hass):
+    """Test the JSON of all states is kept until a state changes."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.desk", "off", {})
+
+    all_json = hass.states.async_all_json()
+    assert json.loads(all_json) == [
+        json.loads(state.as_json()) for state in hass.states.async_all()
+    ]
+    assert hass.states.async_all_json() is all_json
+
+    hass.states.async_set("light.bowl", "off", {})
+    all_json = hass.states.async_all_json()
+    assert [state["state"] for state in json.loads(all_json)] == ["off", "off"]
+
+    hass.states.async_remove("light.desk")
+    assert [
+        state["entity_id"] for state in json.loads(hass.states.async_all_json())
+    ] == ["light.bowl"]
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1086,7 +1179,8 @@ def test_create_timer(mock_monotonic, loop):
         callback(target)
 
     assert len(hass.bus.async_listen_once.mock_calls) == 1
-    assert len(hass.bus.async_fire.mock_calls) == 1
+    assert len(hass.bus.async_fire_time_changed.mock_calls) == 1
+    assert len(hass.bus.async_fire.mock_calls) == 0
     assert len(hass.loop.call_later.mock_calls) == 2
 
     event_type, callback = hass.bus.async_listen_once.mock_calls[0][1]
@@ -1098,9 +1192,8 @@ def test_create_timer(mock_monotonic, loop):
     assert callback is fire_time_event
     assert abs(target - 12.2) < 0.001
 
-    event_type, event_data = hass.bus.async_fire.mock_calls[0][1]
-    assert event_type == EVENT_TIME_CHANGED
-    assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
+    now, _ = hass.bus.async_fire_time_changed.mock_calls[0][1]
+    assert now == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
 @patch("homeassistant.core.monotonic")
@@ -1130,13 +1223,10 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     ):
         callback(target)
 
-        _, event_0_args, event_0_kwargs = hass.bus.async_fire.mock_calls[0]
-        event_context_0 = event_0_kwargs["context"]
-
-        event_type_0, _ = event_0_args
-        assert event_type_0 == EVENT_TIME_CHANGED
+        _, event_0_args, _ = hass.bus.async_fire_time_changed.mock_calls[0]
+        _, event_context_0 = event_0_args
 
-        _, event_1_args, event_1_kwargs = hass.bus.async_fire.mock_calls[1]
+        _, event_1_args, event_1_kwargs = hass.bus.async_fire.mock_calls[0]
         event_type_1, event_data_1 = event_1_args
         event_context_1 = event_1_kwargs["context"]
 
@@ -172,6 +172,67 @@ async def test_get_integration_exceptions(hass):
         assert hue_light == integration.get_platform("light")
 
 
+async def test_async_get_component_and_platform(hass):
+    """Test importing built-in integrations in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        assert hue == await integration.async_get_component()
+        assert hue_light == await integration.async_get_platform("light")
+        assert mock_executor.call_count == 2
+
+        # Imported modules are returned from the cache
+        assert hue == await integration.async_get_component()
+        assert hue_light == await integration.async_get_platform("light")
+        assert mock_executor.call_count == 2
+
+    import_times = hass.data[loader.DATA_IMPORT_TIMES]
+    assert import_times["hue"] >= 0
+    assert import_times["hue.light"] >= 0
+
+
+async def test_async_get_component_custom_integration(hass, enable_custom_integrations):
+    """Test custom integrations are imported in the event loop."""
+    integration = await loader.async_get_integration(hass, "test_package")
+
+    with patch.object(hass, "async_add_executor_job") as mock_executor:
+        component = await integration.async_get_component()
+
+    assert component.DOMAIN == "test_package"
+    assert not mock_executor.called
+
+
+async def test_preload_integrations(hass):
+    """Test preloading imports the component and its platforms."""
+    integration = await loader.async_get_integration(hass, "hue")
+    loaded = hass.data.setdefault(loader.DATA_COMPONENTS, {})
+
+    with patch("homeassistant.util.package.is_installed", return_value=True):
+        await loader.async_preload_integrations(hass, [integration])
+
+    assert loaded["hue"] == hue
+    assert loaded["hue.light"] == hue_light
+    assert loaded["hue.config_flow"] is not None
+    assert "hue.climate" not in loaded
+
+    import_times = hass.data[loader.DATA_IMPORT_TIMES]
+    assert import_times["hue"] >= 0
+    assert import_times["hue.config_flow"] >= 0
+    assert "hue.climate" not in import_times
+
+
+async def test_preload_integrations_requirements_not_installed(hass):
+    """Test integrations with missing requirements are not preloaded."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.util.package.is_installed", return_value=False):
+        await loader.async_preload_integrations(hass, [integration])
+
+    assert "hue" not in hass.data.get(loader.DATA_COMPONENTS, {})
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -691,3 +691,45 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_timeline(hass):
+    """Test the setup phases of integrations and platforms are recorded."""
+    mock_integration(hass, MockModule("comp", async_setup=AsyncMock(return_value=True)))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp2",
+            dependencies=["comp"],
+            async_setup=AsyncMock(return_value=True),
+        ),
+    )
+    mock_entity_platform(hass, "switch.comp2", MockPlatform())
+
+    assert await setup.async_setup_component(hass, "comp2", {})
+    assert await setup.async_prepare_setup_platform(hass, {}, "switch", "comp2")
+
+    timeline = setup.async_get_setup_timeline(hass)
+    spans = [(span.name, span.phase) for span in timeline.spans]
+    assert spans == [
+        ("comp2", setup.SetupPhase.WAIT_DEPENDENCIES),
+        ("comp", setup.SetupPhase.IMPORT),
+        ("comp", setup.SetupPhase.SETUP),
+        ("comp2", setup.SetupPhase.IMPORT),
+        ("comp2", setup.SetupPhase.SETUP),
+        ("switch.comp2", setup.SetupPhase.IMPORT),
+    ]
+    assert all(span.end >= span.start for span in timeline.spans)
+
+    trace = timeline.as_chrome_trace()
+    rows = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert set(rows) == {"comp", "comp2"}
+    platform_import = trace["traceEvents"][-1]
+    assert platform_import["name"] == "switch.comp2 import"
+    assert platform_import["cat"] == "import"
+    assert platform_import["tid"] == rows["comp2"]
+    assert platform_import["dur"] >= 0
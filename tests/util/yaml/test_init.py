@@ -445,3 +445,121 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def _write_old(path, content, mtime=1_600_000_000):
+    """Write a file with a modification time outside of the caching grace period."""
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def yaml_cache():
+    """Return a fresh parsed YAML cache."""
+    cache = yaml_loader.ParsedYamlCache()
+    with patch.object(yaml_loader, "PARSED_YAML_CACHE", cache):
+        yield cache
+
+
+def test_cache_reparses_only_changed_includes(tmp_path, yaml_cache):
+    """Test only changed files are parsed again."""
+    _write_old(
+        tmp_path / "configuration.yaml",
+        "first: !include first.yaml\nsecond: !include second.yaml\n",
+    )
+    _write_old(tmp_path / "first.yaml", "value: 1\n")
+    _write_old(tmp_path / "second.yaml", "value: 2\n")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    with patch.object(
+        yaml_loader, "_load_yaml_file", wraps=yaml_loader._load_yaml_file
+    ) as mock_load:
+        doc = yaml_loader.load_yaml(config_path)
+        assert doc == {"first": {"value": 1}, "second": {"value": 2}}
+        assert mock_load.call_count == 3
+
+        doc = yaml_loader.load_yaml(config_path)
+        assert doc == {"first": {"value": 1}, "second": {"value": 2}}
+        assert mock_load.call_count == 3
+        assert doc["first"].__config_file__ == config_path
+        assert doc.__line__ == 0
+
+        _write_old(tmp_path / "second.yaml", "value: 22\n")
+        mock_load.reset_mock()
+        doc = yaml_loader.load_yaml(config_path)
+        assert doc == {"first": {"value": 1}, "second": {"value": 22}}
+        assert [call.args[0] for call in mock_load.call_args_list] == [
+            config_path,
+            str(tmp_path / "second.yaml"),
+        ]
+
+
+def test_cache_returns_copies(tmp_path, yaml_cache):
+    """Test mutating a loaded tree does not change the cached tree."""
+    _write_old(tmp_path / "configuration.yaml", "a:\n  - 1\n  - 2\n")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    doc = yaml_loader.load_yaml(config_path)
+    doc["a"].append(3)
+    doc["b"] = 1
+
+    assert yaml_loader.load_yaml(config_path) == {"a": [1, 2]}
+    assert yaml_cache.hits == 1
+
+
+def test_cache_invalidated_by_secrets(tmp_path, yaml_cache):
+    """Test cached trees are invalidated when secrets change."""
+    _write_old(tmp_path / "configuration.yaml", "password: !secret pw\n")
+    _write_old(tmp_path / yaml.SECRET_YAML, "pw: one\n")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    doc = yaml_loader.load_yaml(config_path, yaml_loader.Secrets(tmp_path))
+    assert doc == {"password": "one"}
+
+    _write_old(tmp_path / yaml.SECRET_YAML, "pw: two\n", 1_600_000_001)
+    doc = yaml_loader.load_yaml(config_path, yaml_loader.Secrets(tmp_path))
+    assert doc == {"password": "two"}
+
+    # Loading without secrets is cached separately
+    with pytest.raises(HomeAssistantError):
+        yaml_loader.load_yaml(config_path)
+
+
+def test_cache_invalidated_by_include_dir(tmp_path, yaml_cache):
+    """Test cached trees are invalidated when files are added to a directory."""
+    (tmp_path / "packages").mkdir()
+    _write_old(
+        tmp_path / "configuration.yaml",
+        "packages: !include_dir_merge_named packages\n",
+    )
+    _write_old(tmp_path / "packages" / "one.yaml", "one: 1\n")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    assert yaml_loader.load_yaml(config_path) == {"packages": {"one": 1}}
+
+    _write_old(tmp_path / "packages" / "two.yaml", "two: 2\n")
+    assert yaml_loader.load_yaml(config_path) == {"packages": {"one": 1, "two": 2}}
+    assert yaml_cache.hits == 1
+
+
+def test_cache_skips_recently_modified_files(tmp_path, yaml_cache):
+    """Test files modified within the grace period are not cached."""
+    (tmp_path / "configuration.yaml").write_text("a: 1\n", encoding="utf-8")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    yaml_loader.load_yaml(config_path)
+    yaml_loader.load_yaml(config_path)
+
+    assert yaml_cache.hits == 0
+    assert yaml_cache.misses == 2
+
+
+@pytest.mark.skipif(not yaml_loader.HAS_C_LOADER, reason="LibYAML not available")
+def test_c_loader_errors_reported_by_python_loader():
+    """Test parse errors are reported with the Python loader."""
+    with patch.object(
+        yaml_loader, "_parse_yaml_python", wraps=yaml_loader._parse_yaml_python
+    ) as mock_parse, pytest.raises(HomeAssistantError):
+        yaml.parse_yaml("a: [1,")
+
+    assert mock_parse.call_count == 1